@@ -1,9 +1,26 @@
+import argparse
+
 from snake.main.controller import AppController
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m snake", description="Snake AI game."
+    )
+    parser.add_argument(
+        "--sim-speed",
+        type=float,
+        default=1,
+        help="multiplier of the game speed; frames are still drawn at most FPS times "
+        "per second (0: as fast as possible). Change it in game with + and -",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Initializes and runs the main application controller."""
-    controller = AppController()
+    args = parse_args(argv)
+    controller = AppController(sim_speed=args.sim_speed or None)
     controller.run()
 
 
@@ -0,0 +1,267 @@
+import argparse
+import json
+import sys
+
+from snake.bench.profiling import profile_game
+from snake.bench.report import (
+    LEADERBOARD_COLUMNS,
+    SEARCH_COLUMNS,
+    SUMMARY_COLUMNS,
+    format_table,
+    game_record,
+    write_csv,
+    write_json,
+    write_search_stats,
+)
+from snake.bench.runner import ALGORITHM_NAMES, DEFAULT_MAX_MOVES, run_benchmark
+from snake.bench.scaling import SCALING_COLUMNS, format_chart, run_scaling
+from snake.bench.tournament import run_tournament
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m snake.bench",
+        description="Plays seeded headless games of the search models and reports their performance.",
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithms",
+        nargs="+",
+        choices=sorted(ALGORITHM_NAMES),
+        default=list(ALGORITHM_NAMES),
+        help="algorithms to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "-n", "--games", type=int, default=10, help="games per algorithm"
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="seed of the first game"
+    )
+    parser.add_argument(
+        "-o", "--obstacles", action="store_true", help="play with obstacles"
+    )
+    parser.add_argument(
+        "--max-moves",
+        type=int,
+        default=DEFAULT_MAX_MOVES,
+        help="cut games off after this many moves",
+    )
+    parser.add_argument(
+        "--time-aware",
+        action="store_true",
+        help="let the graph searches plan through body cells that will be vacated in time",
+    )
+    parser.add_argument(
+        "--distance-heuristic",
+        action="store_const",
+        const=True,
+        help="use obstacle-aware distances as the heuristic of every algorithm "
+        "(the hill climbers always do)",
+    )
+    parser.add_argument(
+        "--safe-paths",
+        action="store_true",
+        help="reject paths after which the snake could no longer reach its tail",
+    )
+    parser.add_argument(
+        "--plan-ahead",
+        action="store_true",
+        help="plan the next path of the multi-step searches on a background thread",
+    )
+    parser.add_argument(
+        "--sim-speed",
+        type=float,
+        help="pace the games like the GUI at this speed multiplier instead of running "
+        "them flat out (only useful to measure frame times); 0 is unlimited",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="save a replay of every game in this directory (see python -m snake.replay)",
+    )
+    parser.add_argument(
+        "-t",
+        "--tournament",
+        action="store_true",
+        help="spread the games over a pool of worker processes and print a leaderboard",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        help="worker processes in tournament mode (default: one per core)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        metavar="PATH",
+        help="stream one JSON line per finished game in tournament mode",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="PATH",
+        help="write the search counters of every plan as one JSON line per game",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="instead of benchmarking, profile one game per algorithm (the first seed) "
+        "and save .pstats and collapsed stacks (.collapsed) for each in DIR",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        metavar="N",
+        help="benchmark on square boards of N cells per side, one run per size, and "
+        "plot planning time and peak memory against the board size",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="functions listed per algorithm in the profile report",
+    )
+    parser.add_argument("--json", metavar="PATH", help="write full results as JSON")
+    parser.add_argument("--csv", metavar="PATH", help="write summaries as CSV")
+    return parser.parse_args(argv)
+
+
+def game_options(args):
+    """Collects the options that are passed on to every game class."""
+    return {
+        "time_aware": args.time_aware,
+        "distance_heuristic": args.distance_heuristic,
+        "safe_paths": args.safe_paths,
+        "plan_ahead": args.plan_ahead,
+    }
+
+
+def run_options(args):
+    """Collects the options of run_game that are not game options."""
+    return {
+        "record_dir": args.record,
+        # Like the GUI, 0 means unlimited
+        "sim_speed": args.sim_speed or None,
+        "search_stats": args.stats is not None,
+    }
+
+
+def table_columns(args, columns):
+    """Adds the search counter columns to the given table columns when stats are on."""
+    return columns + SEARCH_COLUMNS if args.stats else columns
+
+
+def profile(args):
+    """Profiles one game per algorithm and prints the hot functions of each."""
+    for algorithm in args.algorithms:
+        report = profile_game(
+            algorithm,
+            args.seed,
+            args.obstacles,
+            args.max_moves,
+            args.profile,
+            args.top,
+            **game_options(args),
+        )
+        print(report, end="\n\n")
+
+
+def scaling(args):
+    """Benchmarks every algorithm on each board size and plots the trends."""
+    rows, results, skipped = run_scaling(
+        args.algorithms,
+        args.sizes,
+        args.games,
+        args.seed,
+        args.obstacles,
+        args.max_moves,
+        **game_options(args),
+        **run_options(args),
+    )
+    print(format_table(rows, SCALING_COLUMNS), end="\n\n")
+    for size, algorithm, reason in skipped:
+        print(f"Skipped {algorithm} on {size}x{size}: {reason}")
+    if skipped:
+        print()
+    print(
+        format_chart(rows, "plan_ms_mean", "Planning time per call", "ms"), end="\n\n"
+    )
+    print(format_chart(rows, "peak_memory_kib", "Peak memory", "KiB"))
+    return rows, results
+
+
+def tournament(args):
+    """Runs the games on all cores, streaming results as they finish."""
+    total = args.games * len(args.algorithms)
+    stream = open(args.jsonl, "w") if args.jsonl else None
+    finished = 0
+
+    def on_result(result):
+        nonlocal finished
+        finished += 1
+        if stream is not None:
+            stream.write(json.dumps(game_record(result)) + "\n")
+            stream.flush()
+        print(f"\r{finished}/{total} games", end="", file=sys.stderr, flush=True)
+
+    try:
+        summaries, results = run_tournament(
+            args.algorithms,
+            args.games,
+            args.seed,
+            args.obstacles,
+            args.max_moves,
+            workers=args.workers,
+            on_result=on_result,
+            **game_options(args),
+            **run_options(args),
+        )
+    finally:
+        if stream is not None:
+            stream.close()
+    print(file=sys.stderr)
+    print(format_table(summaries, table_columns(args, LEADERBOARD_COLUMNS)))
+    return summaries, results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.profile:
+        profile(args)
+        return
+    if args.sizes:
+        summaries, results = scaling(args)
+    elif args.tournament:
+        summaries, results = tournament(args)
+    else:
+        summaries, results = run_benchmark(
+            args.algorithms,
+            args.games,
+            args.seed,
+            args.obstacles,
+            args.max_moves,
+            **game_options(args),
+            **run_options(args),
+        )
+        print(format_table(summaries, table_columns(args, SUMMARY_COLUMNS)))
+
+    if args.json:
+        config = {
+            "algorithms": args.algorithms,
+            "games": args.games,
+            "seed": args.seed,
+            "obstacles": args.obstacles,
+            "max_moves": args.max_moves,
+            "tournament": args.tournament,
+            "sizes": args.sizes,
+            "options": {**game_options(args), **run_options(args)},
+        }
+        write_json(args.json, config, summaries, results)
+    if args.csv:
+        write_csv(args.csv, summaries)
+    if args.stats:
+        write_search_stats(args.stats, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+from snake.bench.runner import ALGORITHM_NAMES
+from snake.search_models.registry import ALGORITHMS
+
+# How often the sampling profiler records the stack of the game, and for how long it
+# keeps replaying the game (most games take only milliseconds)
+SAMPLE_INTERVAL = 0.001
+SAMPLE_DURATION = 1.0
+
+
+def play(game_class, seed, obstacles, max_moves, options):
+    """Sets up and plays one game: everything the profilers look at happens in here."""
+    game = game_class(
+        game_has_obstacles=obstacles, max_moves=max_moves, seed=seed, **options
+    )
+    game.main()
+    return game
+
+
+def frame_name(frame):
+    """Names a stack frame as module.qualified_name, e.g. snake.main.game.Game.step."""
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+
+
+def sample_stacks(function, *args, interval=SAMPLE_INTERVAL, duration=SAMPLE_DURATION):
+    """
+    Runs function(*args) repeatedly for at least duration seconds (and at least once)
+    while a background thread samples its stack every interval seconds.
+    Returns (runs, counts) where counts maps collapsed stacks (frame names from the
+    outermost call inside function down to the running one, joined by ';') to the
+    number of samples they were seen in.
+    """
+    target = threading.get_ident()
+    root = function.__code__
+    counts = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None and frame.f_code is not root:
+                stack.append(frame_name(frame))
+                frame = frame.f_back
+            # Only count samples taken inside the profiled call
+            if frame is not None and stack:
+                counts[";".join(reversed(stack))] += 1
+
+    # The sampler can only look at the game's stack when it gets the GIL
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(interval, switch_interval))
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    runs = 0
+    start = time.perf_counter()
+    try:
+        while not runs or time.perf_counter() - start < duration:
+            function(*args)
+            runs += 1
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    return runs, counts
+
+
+def write_collapsed(path, counts):
+    """Writes stack counts in the collapsed format read by flamegraph.pl and speedscope."""
+    with open(path, "w") as file:
+        for stack, count in sorted(counts.items()):
+            file.write(f"{stack} {count}\n")
+
+
+def function_label(key):
+    """Short label of a pstats function key (file, line, name)."""
+    filename, line, name = key
+    if filename == "~":
+        return name  # Built-in, e.g. <method 'popleft' of 'collections.deque' objects>
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def top_functions(stats, top):
+    """Formats the top functions by own time as a plain-text table."""
+    total = stats.total_tt or 1
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    lines = [f"{'own ms':>9}  {'own %':>6}  {'cum ms':>9}  {'calls':>9}  function"]
+    for key, (_primitive, calls, own, cumulative, _callers) in rows[:top]:
+        lines.append(
+            f"{own * 1000:9.1f}  {own / total * 100:6.1f}  {cumulative * 1000:9.1f}  "
+            f"{calls:9d}  {function_label(key)}"
+        )
+    return "\n".join(lines)
+
+
+def profile_game(algorithm, seed, obstacles, max_moves, out_dir, top=15, **options):
+    """
+    Profiles one seeded game of the given algorithm, from setting up the board to the
+    last move, without any of the benchmark machinery around it.
+
+    Seeded games play identically, so the game is played once under cProfile, saved
+    as <out_dir>/<algorithm>.pstats, and then over and over for about a second under a
+    sampling profiler, whose stacks are saved in the collapsed format as
+    <out_dir>/<algorithm>.collapsed.
+    Returns a short report with the top functions by own time.
+    """
+    game_class = ALGORITHMS[ALGORITHM_NAMES[algorithm]]
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, algorithm)
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    game = profiler.runcall(play, game_class, seed, obstacles, max_moves, options)
+    elapsed = time.perf_counter() - start
+    profiler.dump_stats(f"{base}.pstats")
+
+    runs, counts = sample_stacks(
+        play,
+        game_class,
+        seed,
+        obstacles,
+        max_moves,
+        options,
+        duration=SAMPLE_DURATION,
+    )
+    write_collapsed(f"{base}.collapsed", counts)
+
+    stats = pstats.Stats(profiler)
+    header = (
+        f"{algorithm} (seed {seed}): score {game.score}, {game.moves} moves, "
+        f"{elapsed * 1000:.0f} ms under cProfile, "
+        f"{sum(counts.values())} stack samples over {runs} runs"
+    )
+    return f"{header}\n{top_functions(stats, top)}"
@@ -0,0 +1,107 @@
+import csv
+import json
+import platform
+import subprocess
+from dataclasses import asdict
+
+SUMMARY_COLUMNS = [
+    ("algorithm", "algorithm", "{}"),
+    ("games", "games", "{}"),
+    ("score_mean", "score", "{:.1f}"),
+    ("score_p50", "p50", "{}"),
+    ("score_max", "max", "{}"),
+    ("moves_per_second", "moves/s", "{:.0f}"),
+    ("plan_ms_mean", "plan ms", "{:.3f}"),
+    ("plan_ms_p50", "p50 ms", "{:.3f}"),
+    ("plan_ms_p99", "p99 ms", "{:.3f}"),
+    ("frame_ms_max", "max frame ms", "{:.3f}"),
+    ("peak_memory_kib", "peak KiB", "{:.0f}"),
+]
+
+# Appended to the tables when the games collected search stats
+SEARCH_COLUMNS = [
+    ("expanded_per_plan", "expanded/plan", "{:.1f}"),
+    ("pushed_per_plan", "pushed/plan", "{:.1f}"),
+]
+
+LEADERBOARD_COLUMNS = [("rank", "#", "{}")] + [
+    column for column in SUMMARY_COLUMNS if column[0] != "peak_memory_kib"
+]
+
+
+def current_commit():
+    """Returns the git commit the benchmark ran against, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def game_record(result):
+    """Converts a GameResult into a JSON-friendly dict (without the raw per-plan samples)."""
+    return {
+        key: value
+        for key, value in asdict(result).items()
+        if key not in ("plan_times", "search_stats")
+    }
+
+
+def format_table(summaries, columns=SUMMARY_COLUMNS):
+    """Formats the per-algorithm summaries as a plain-text table."""
+    rows = [[title for _key, title, _fmt in columns]]
+    for summary in summaries:
+        rows.append(
+            [
+                "-" if summary[key] is None else fmt.format(summary[key])
+                for key, _title, fmt in columns
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    lines = []
+    for row in rows:
+        cells = [
+            cell.ljust(width) if key == "algorithm" else cell.rjust(width)
+            for cell, width, (key, _title, _fmt) in zip(row, widths, columns)
+        ]
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+def write_json(path, config, summaries, results):
+    """Writes the run configuration, summaries and per-game results as one JSON document."""
+    document = {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "config": config,
+        "summaries": summaries,
+        "games": [game_record(result) for result in results],
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def write_csv(path, summaries):
+    """Writes one CSV row of summary statistics per algorithm."""
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(summaries[0]))
+        writer.writeheader()
+        writer.writerows(summaries)
+
+
+def write_search_stats(path, results):
+    """Writes one JSON line per game with its search counters (see SearchStats.to_record)."""
+    with open(path, "w") as file:
+        for result in results:
+            record = {
+                "algorithm": result.algorithm,
+                "seed": result.seed,
+                "obstacles": result.obstacles,
+                "score": result.score,
+                "moves": result.moves,
+                "size": result.size,
+                **result.search_stats,
+            }
+            file.write(json.dumps(record) + "\n")
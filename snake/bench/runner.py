@@ -0,0 +1,218 @@
+import os
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from snake.main.grid import board_grid
+from snake.main.pacing import MoveClock
+from snake.main.stats import SearchStats
+from snake.replay.recording import ReplayRecorder
+from snake.search_models.registry import ALGORITHMS
+
+# Command line names of the algorithms, e.g. "astar" for MODE_ASTAR
+ALGORITHM_NAMES = {mode.removeprefix("MODE_").lower(): mode for mode in ALGORITHMS}
+
+# Games are cut off after this many moves so endless strategies still finish
+DEFAULT_MAX_MOVES = 10_000
+
+
+@dataclass
+class GameResult:
+    """Outcome and timings of a single benchmark game."""
+
+    algorithm: str
+    seed: int
+    obstacles: bool
+    score: int
+    moves: int
+    elapsed: float
+    plan_times: list = field(default_factory=list)
+    peak_memory: int | None = None
+    max_frame: float = 0.0
+    search_stats: dict | None = None
+    # Cells per side of the square board, in scaling runs (see snake.bench.scaling)
+    size: int | None = None
+
+
+def with_plan_timer(game_class, plan_times):
+    """Returns a subclass of game_class that records the wall time of every generate_path call."""
+
+    class TimedGame(game_class):
+        def generate_path(self):
+            start = time.perf_counter()
+            result = super().generate_path()
+            plan_times.append(time.perf_counter() - start)
+            return result
+
+    return TimedGame
+
+
+class FrameClock:
+    """
+    Stand-in for the renderer in benchmark games. Measures the frame time of every
+    move (how long the game loop works on it, without pacing) and, with a sim_speed,
+    paces the game like the GUI does at that speed, without drawing anything.
+    """
+
+    def __init__(self, sim_speed=None):
+        self.clock = MoveClock(sim_speed)
+        self.frame_start = None
+        self.max_frame = 0.0
+
+    def poll_events(self):
+        if self.frame_start is None:
+            self.frame_start = time.perf_counter()
+        return None
+
+    def advance(self, game, speed):
+        self.max_frame = max(self.max_frame, time.perf_counter() - self.frame_start)
+        self.clock.wait(speed)
+        self.frame_start = time.perf_counter()
+
+    def time_left(self):
+        return self.clock.time_left()
+
+
+def run_game(
+    algorithm,
+    seed,
+    obstacles=False,
+    max_moves=DEFAULT_MAX_MOVES,
+    trace_memory=False,
+    record_dir=None,
+    sim_speed=None,
+    search_stats=False,
+    **options,
+):
+    """
+    Plays one headless game of the given algorithm with the given seed.
+    Extra keyword options (e.g. time_aware) are passed on to the game class.
+    With trace_memory the peak Python heap usage of the game is recorded as well,
+    at the cost of much slower execution. With record_dir a replay of the game is
+    saved in there as <algorithm>-<seed>.snkr. With sim_speed the game is paced like
+    the GUI at that speed, so that frame times include the effect of plan_ahead.
+    With search_stats the counters of every plan (see SearchStats) are collected too.
+    """
+    recorder = ReplayRecorder() if record_dir is not None else None
+    stats = SearchStats() if search_stats else None
+    frames = FrameClock(sim_speed)
+    plan_times = []
+    game_class = with_plan_timer(ALGORITHMS[ALGORITHM_NAMES[algorithm]], plan_times)
+
+    if trace_memory:
+        # Count the board's grid too, like in a fresh process, instead of sharing it
+        board_grid.cache_clear()
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        game = game_class(
+            game_has_obstacles=obstacles,
+            max_moves=max_moves,
+            seed=seed,
+            renderer=frames,
+            recorder=recorder,
+            search_stats=stats,
+            **options,
+        )
+        game.main()
+    except Exception as error:
+        error.add_note(
+            f"while playing {algorithm} with seed {seed} (obstacles={obstacles})"
+        )
+        raise
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        _current, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    if recorder is not None:
+        os.makedirs(record_dir, exist_ok=True)
+        recorder.save(os.path.join(record_dir, f"{algorithm}-{seed}.snkr"))
+
+    return GameResult(
+        algorithm=algorithm,
+        seed=seed,
+        obstacles=obstacles,
+        score=game.score,
+        moves=game.moves,
+        elapsed=elapsed,
+        plan_times=plan_times,
+        peak_memory=peak_memory,
+        max_frame=frames.max_frame,
+        search_stats=stats.to_record() if stats is not None else None,
+    )
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of the given values (q in [0, 100])."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, round(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(algorithm, results, peak_memory=None):
+    """Aggregates the game results of one algorithm into a flat summary record."""
+    scores = [result.score for result in results]
+    moves = sum(result.moves for result in results)
+    elapsed = sum(result.elapsed for result in results)
+    plan_times = [t for result in results for t in result.plan_times]
+    plan_ms = [t * 1000 for t in plan_times]
+    # Search counters are only there when the games collected search stats
+    stats = [result.search_stats for result in results if result.search_stats]
+    searched_plans = sum(record["plans"] for record in stats)
+
+    return {
+        "algorithm": algorithm,
+        "games": len(results),
+        "score_min": min(scores),
+        "score_mean": statistics.fmean(scores),
+        "score_p50": percentile(scores, 50),
+        "score_max": max(scores),
+        "score_stdev": statistics.pstdev(scores),
+        "moves_mean": moves / len(results),
+        "moves_per_second": moves / elapsed if elapsed else None,
+        "plan_calls": len(plan_ms),
+        "plan_ms_mean": statistics.fmean(plan_ms) if plan_ms else None,
+        "plan_ms_p50": percentile(plan_ms, 50),
+        "plan_ms_p99": percentile(plan_ms, 99),
+        "plan_ms_per_move": sum(plan_ms) / moves if moves else None,
+        "frame_ms_max": max(result.max_frame for result in results) * 1000,
+        "peak_memory_kib": peak_memory / 1024 if peak_memory is not None else None,
+        "expanded_per_plan": (
+            sum(record["expanded"] for record in stats) / searched_plans
+            if searched_plans
+            else None
+        ),
+        "pushed_per_plan": (
+            sum(record["pushed"] for record in stats) / searched_plans
+            if searched_plans
+            else None
+        ),
+    }
+
+
+def run_benchmark(
+    algorithms, games, seed=0, obstacles=False, max_moves=DEFAULT_MAX_MOVES, **options
+):
+    """
+    Plays `games` seeded games of every algorithm (seeds seed .. seed + games - 1).
+    Peak memory is measured in an extra traced replay of the first seed so that
+    tracing does not distort the latency numbers.
+    Returns (summaries, results).
+    """
+    summaries = []
+    all_results = []
+    for algorithm in algorithms:
+        results = [
+            run_game(algorithm, game_seed, obstacles, max_moves, **options)
+            for game_seed in range(seed, seed + games)
+        ]
+        traced = run_game(
+            algorithm, seed, obstacles, max_moves, trace_memory=True, **options
+        )
+        summaries.append(summarize(algorithm, results, traced.peak_memory))
+        all_results.extend(results)
+    return summaries, all_results
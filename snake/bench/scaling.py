@@ -0,0 +1,100 @@
+import math
+
+from snake.bench.runner import DEFAULT_MAX_MOVES, run_benchmark
+from snake.configs.game import BLOCK_SIZE
+
+SCALING_COLUMNS = [
+    ("size", "board", "{0}x{0}"),
+    ("algorithm", "algorithm", "{}"),
+    ("score_mean", "score", "{:.1f}"),
+    ("moves_per_second", "moves/s", "{:.0f}"),
+    ("plan_ms_mean", "plan ms", "{:.3f}"),
+    ("plan_ms_p99", "p99 ms", "{:.3f}"),
+    ("peak_memory_kib", "peak KiB", "{:.0f}"),
+]
+
+# Width of the longest bar in the charts, in characters
+BAR_WIDTH = 40
+
+
+def unsupported(algorithm, size):
+    """Returns why the algorithm cannot play on a size x size board, or None if it can."""
+    if algorithm == "hamiltonian_cycle" and size % 2:
+        return "no Hamiltonian cycle on boards with an odd number of cells"
+    return None
+
+
+def run_scaling(
+    algorithms,
+    sizes,
+    games,
+    seed=0,
+    obstacles=False,
+    max_moves=DEFAULT_MAX_MOVES,
+    **options,
+):
+    """
+    Runs the benchmark of every algorithm on square boards of each of the given sizes
+    (in cells per side), with the same seeds on every board.
+    Returns (rows, results, skipped): the summaries of all runs, each with the board
+    size under "size", the GameResults of all games, each with its board size, and
+    (size, algorithm, reason) for every algorithm that cannot play on a board of that
+    size (see unsupported).
+    """
+    rows = []
+    all_results = []
+    skipped = []
+    for size in sizes:
+        playable = []
+        for algorithm in algorithms:
+            reason = unsupported(algorithm, size)
+            if reason is None:
+                playable.append(algorithm)
+            else:
+                skipped.append((size, algorithm, reason))
+        if not playable:
+            continue
+        summaries, results = run_benchmark(
+            playable,
+            games,
+            seed,
+            obstacles,
+            max_moves,
+            width=size * BLOCK_SIZE,
+            height=size * BLOCK_SIZE,
+            **options,
+        )
+        rows.extend({"size": size, **summary} for summary in summaries)
+        for result in results:
+            result.size = size
+        all_results.extend(results)
+    return rows, all_results, skipped
+
+
+def format_chart(rows, key, title, unit):
+    """
+    Plots one metric of the scaling summaries against the board size as text, one bar
+    per algorithm and size. Bars are on a log scale, since the metrics of the searches
+    grow with the number of cells (or faster).
+    """
+    values = [row[key] for row in rows if row[key]]
+    lines = [f"{title} ({unit}, log scale)"]
+    if not values:
+        return "\n".join(lines + ["  no data"])
+    low, high = min(values), max(values)
+    span = math.log(high / low) if high > low else 1.0
+
+    name_width = max(len(row["algorithm"]) for row in rows)
+    algorithms = list(dict.fromkeys(row["algorithm"] for row in rows))
+    for algorithm in algorithms:
+        for row in rows:
+            if row["algorithm"] != algorithm:
+                continue
+            label = f"{algorithm.ljust(name_width)} {row['size']:>4}x{row['size']:<4}"
+            value = row[key]
+            if not value:
+                lines.append(f"{label} -")
+                continue
+            length = 1 + round((BAR_WIDTH - 1) * math.log(value / low) / span)
+            lines.append(f"{label} {'#' * length} {value:.3g}")
+    return "\n".join(lines)
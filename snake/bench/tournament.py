@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+
+from snake.bench.runner import DEFAULT_MAX_MOVES, run_game, summarize
+
+
+def _play(job):
+    """Worker entry point: plays one (algorithm, seed, obstacles, max_moves, options) job."""
+    algorithm, seed, obstacles, max_moves, options = job
+    return run_game(algorithm, seed, obstacles, max_moves, **options)
+
+
+def build_jobs(
+    algorithms, games, seed=0, obstacles=False, max_moves=DEFAULT_MAX_MOVES, **options
+):
+    """
+    Lists one job per (algorithm, seed) pair.
+    Jobs are interleaved by seed so fast and slow algorithms finish side by side.
+    """
+    return [
+        (algorithm, game_seed, obstacles, max_moves, options)
+        for game_seed in range(seed, seed + games)
+        for algorithm in algorithms
+    ]
+
+
+def leaderboard(algorithms, results):
+    """Summarizes the results per algorithm and ranks the algorithms by mean score."""
+    summaries = []
+    for algorithm in algorithms:
+        algorithm_results = [r for r in results if r.algorithm == algorithm]
+        if algorithm_results:
+            summaries.append(summarize(algorithm, algorithm_results))
+    summaries.sort(key=lambda summary: summary["score_mean"], reverse=True)
+    for rank, summary in enumerate(summaries, start=1):
+        summary["rank"] = rank
+    return summaries
+
+
+def run_tournament(
+    algorithms,
+    games,
+    seed=0,
+    obstacles=False,
+    max_moves=DEFAULT_MAX_MOVES,
+    workers=None,
+    on_result=None,
+    **options,
+):
+    """
+    Plays `games` seeded games of every algorithm on a pool of worker processes
+    (one per core by default). on_result, if given, is called in the parent
+    process with each GameResult as soon as it arrives.
+    Returns (leaderboard, results).
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = build_jobs(algorithms, games, seed, obstacles, max_moves, **options)
+
+    results = []
+    with multiprocessing.Pool(processes=workers) as pool:
+        # One game per task: a game takes far longer than sending its result, and
+        # every result is streamed as soon as its game ends
+        for result in pool.imap_unordered(_play, jobs, chunksize=1):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return leaderboard(algorithms, results), results
@@ -17,11 +17,14 @@ MODE_MANUAL = (
     "MODE_MANUAL"  # Needed for AppController when "Play Game" is chosen from MainMenu
 )
 MODE_ASTAR = "MODE_ASTAR"
+MODE_BIDIRECTIONAL_ASTAR = "MODE_BIDIRECTIONAL_ASTAR"
 MODE_BEST_FS = "MODE_BEST_FS"
 MODE_BFS = "MODE_BFS"
+MODE_BIDIRECTIONAL_BFS = "MODE_BIDIRECTIONAL_BFS"
 MODE_DFS = "MODE_DFS"
 MODE_SIMPLE_HILL_CLIMBING = "MODE_SIMPLE_HILL_CLIMBING"
 MODE_STEEPEST_ASCENT_HILL_CLIMBING = "MODE_STEEPEST_ASCENT_HILL_CLIMBING"
 MODE_STOCHASTIC_HILL_CLIMBING = "MODE_STOCHASTIC_HILL_CLIMBING"
 MODE_RANDOM = "MODE_RANDOM"  # Note: In mode_selection.py, this was MODE_RANDOM_SEARCH. Will need to align.
 MODE_HAMILTONIAN_CYCLE = "MODE_HAMILTONIAN_CYCLE"
+MODE_JUMP_POINT_SEARCH = "MODE_JUMP_POINT_SEARCH"
@@ -0,0 +1,105 @@
+import random
+
+import numpy as np
+
+from snake.configs.directions import Direction
+from snake.configs.game import BLOCK_SIZE, HEIGHT, WIDTH
+from snake.main.game import Game
+
+# Actions are indices into this tuple (absolute directions, like the search models use)
+ACTIONS = (Direction.LEFT, Direction.RIGHT, Direction.UP, Direction.DOWN)
+
+REWARD_FOOD = 1.0
+REWARD_DEATH = -1.0
+
+# Observation planes
+BODY, HEAD, FOOD, OBSTACLES = range(4)
+
+
+class EnvGame(Game):
+    """Game that is driven from the outside, one step at a time."""
+
+    def generate_path(self):
+        return None
+
+    def main(self):
+        return self.score
+
+
+class SnakeEnv:
+    """
+    Gym-style environment around the game rules of snake.main.game.Game.
+
+    reset() starts a new game and returns the first observation; step(action) moves
+    the snake and returns (observation, reward, done, info). Actions index ACTIONS.
+    Observations are uint8 arrays of shape (4, rows, cols) with one plane each for the
+    snake's body, its head, the food and the obstacles.
+    Reward is REWARD_FOOD for eating, REWARD_DEATH for colliding and 0 otherwise.
+    Games are cut off (done, with info["truncated"]) after max_moves moves, if given.
+    A game also ends (with info["won"]) when the snake fills the board.
+    Boards are cols by rows cells, like VectorSnakeEnv's.
+    """
+
+    def __init__(
+        self,
+        game_has_obstacles=False,
+        max_moves=None,
+        seed=None,
+        cols=WIDTH // BLOCK_SIZE,
+        rows=HEIGHT // BLOCK_SIZE,
+    ):
+        self.game_has_obstacles = game_has_obstacles
+        self.max_moves = max_moves
+        self.cols = cols
+        self.rows = rows
+        # Draws the seed of every game, so a seeded environment plays a reproducible
+        # sequence of games; each game's own seed is game.seed
+        self.seeds = random.Random(seed)
+        self.game = None
+
+    def reset(self, seed=None):
+        """Starts a new game. A seed restarts the sequence of games from that seed."""
+        if seed is not None:
+            self.seeds = random.Random(seed)
+        self.game = EnvGame(
+            self.game_has_obstacles,
+            max_moves=self.max_moves,
+            seed=self.seeds.randrange(2**32),
+            width=self.cols * BLOCK_SIZE,
+            height=self.rows * BLOCK_SIZE,
+        )
+        return self.observe()
+
+    def step(self, action):
+        """Moves the snake in the direction of the given action index."""
+        game = self.game
+        score = game.score
+        alive = game.step(ACTIONS[action])
+
+        if not alive:
+            reward = REWARD_DEATH
+        elif game.score != score:
+            reward = REWARD_FOOD
+        else:
+            reward = 0.0
+        truncated = alive and not game.won and game.is_move_limit_reached()
+        info = {
+            "score": game.score,
+            "moves": game.moves,
+            "truncated": truncated,
+            "won": game.won,
+            "seed": game.seed,
+        }
+        return self.observe(), reward, not alive or truncated or game.won, info
+
+    def observe(self):
+        """Returns the observation planes of the current game state."""
+        game = self.game
+        grid = game.grid
+        planes = np.zeros((4, grid.size), dtype=np.uint8)
+        planes[BODY, game.snake.cells()] = 1
+        planes[HEAD, grid.cell(game.head)] = 1
+        if game.food is not None:
+            planes[FOOD, grid.cell(game.food)] = 1
+        planes[OBSTACLES, [grid.cell(point) for point in game.obstacles]] = 1
+        return planes.reshape(4, grid.rows, grid.cols)
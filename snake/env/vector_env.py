@@ -0,0 +1,160 @@
+import numpy as np
+
+from snake.configs.game import BLOCK_SIZE, HEIGHT, OBSTACLE_THRESHOLD, WIDTH
+from snake.env.snake_env import (
+    BODY,
+    FOOD,
+    HEAD,
+    OBSTACLES,
+    REWARD_DEATH,
+    REWARD_FOOD,
+)
+
+# Column and row offsets of the actions in snake.env.snake_env.ACTIONS
+ACTION_DX = np.array([-1, 1, 0, 0])
+ACTION_DY = np.array([0, 0, -1, 1])
+
+
+class VectorSnakeEnv:
+    """
+    Batched version of SnakeEnv that steps num_envs independent boards at once.
+
+    The game rules are the ones of snake.main.game.Game, reimplemented on NumPy arrays
+    so that a step costs a handful of array operations regardless of num_envs:
+    - every board keeps a lifetime per cell: how many more moves the snake's body
+      stays on it (the head is at the snake's length, the tail at 1, free cells at 0).
+      Moving decrements all of them and puts the new head at the snake's length, so
+      the tail moves out of the way without tracking the body as a list; eating
+      skips the decrement, which makes the snake grow by one.
+    - food is placed on a uniformly random free cell by taking the argmax of random
+      keys in which occupied cells are masked out.
+
+    step(actions) takes one action index per board and returns (observations, rewards,
+    dones, info) as arrays. Boards that are done are reset straight away, so the
+    returned observation of a done board is the first one of its next game; the
+    final scores and move counts are in info["score"] and info["moves"], and
+    info["won"] marks the boards whose snake filled the board.
+    """
+
+    def __init__(
+        self,
+        num_envs,
+        game_has_obstacles=False,
+        max_moves=None,
+        seed=None,
+        cols=WIDTH // BLOCK_SIZE,
+        rows=HEIGHT // BLOCK_SIZE,
+    ):
+        self.num_envs = num_envs
+        self.game_has_obstacles = game_has_obstacles
+        self.max_moves = max_moves
+        self.cols = cols
+        self.rows = rows
+        self.size = cols * rows
+        self.rng = np.random.default_rng(seed)
+
+        # Same starting cell as Game: the middle of the board
+        self.start = (rows // 2) * cols + cols // 2
+        self.boards = np.arange(num_envs)
+
+        self.lifetime = np.zeros((num_envs, self.size), dtype=np.int32)
+        self.obstacles = np.zeros((num_envs, self.size), dtype=bool)
+        self.free_cells = np.zeros(num_envs, dtype=np.int32)  # Without obstacles
+        self.head = np.zeros(num_envs, dtype=np.int64)
+        self.food = np.zeros(num_envs, dtype=np.int64)
+        self.length = np.zeros(num_envs, dtype=np.int32)
+        self.score = np.zeros(num_envs, dtype=np.int32)
+        self.moves = np.zeros(num_envs, dtype=np.int32)
+
+    def reset(self):
+        """Starts a new game on every board and returns the first observations."""
+        self.reset_boards(np.ones(self.num_envs, dtype=bool))
+        return self.observe()
+
+    def reset_boards(self, mask):
+        """Starts a new game on the boards selected by the boolean mask."""
+        count = int(mask.sum())
+        if not count:
+            return
+        self.lifetime[mask] = 0
+        self.lifetime[mask, self.start] = 1
+        self.head[mask] = self.start
+        self.length[mask] = 1
+        self.score[mask] = 0
+        self.moves[mask] = 0
+
+        self.obstacles[mask] = False
+        # Leave at least one free cell for the food besides the start cell
+        num_obstacles = min(OBSTACLE_THRESHOLD, self.size - 2)
+        if self.game_has_obstacles and num_obstacles > 0:
+            # num_obstacles distinct random cells per board, never the start cell
+            keys = self.rng.random((count, self.size))
+            keys[:, self.start] = -1
+            cells = np.argpartition(keys, -num_obstacles, axis=1)[:, -num_obstacles:]
+            obstacles = np.zeros((count, self.size), dtype=bool)
+            np.put_along_axis(obstacles, cells, True, axis=1)
+            self.obstacles[mask] = obstacles
+        self.free_cells[mask] = self.size - self.obstacles[mask].sum(axis=1)
+        self.place_food(mask)
+
+    def place_food(self, mask):
+        """Places new food on a random free cell of every board selected by the mask."""
+        count = int(mask.sum())
+        if not count:
+            return
+        keys = self.rng.random((count, self.size))
+        keys[(self.lifetime[mask] > 0) | self.obstacles[mask]] = -1
+        self.food[mask] = keys.argmax(axis=1)
+
+    def step(self, actions):
+        """Moves the snake on every board by the given action indices."""
+        actions = np.asarray(actions)
+        self.moves += 1
+        x = self.head % self.cols + ACTION_DX[actions]
+        y = self.head // self.cols + ACTION_DY[actions]
+        on_board = (x >= 0) & (x < self.cols) & (y >= 0) & (y < self.rows)
+        next_head = np.where(on_board, y * self.cols + x, 0)
+
+        # The tail (lifetime 1) moves out of the way; food is never on the snake
+        occupied = self.lifetime[self.boards, next_head]
+        blocked = self.obstacles[self.boards, next_head]
+        alive = on_board & ~blocked & (occupied <= 1)
+        eats = alive & (next_head == self.food)
+
+        # Move the snake on the boards that survived
+        moving = alive & ~eats
+        np.maximum(self.lifetime - moving[:, None], 0, out=self.lifetime)
+        self.length += eats
+        self.score += eats
+        self.head = np.where(alive, next_head, self.head)
+        self.lifetime[self.boards[alive], self.head[alive]] = self.length[alive]
+
+        # Boards without a free cell left have been won; the others get new food
+        full = eats & (self.length == self.free_cells)
+        self.place_food(eats & ~full)
+
+        rewards = np.where(alive, np.where(eats, REWARD_FOOD, 0.0), REWARD_DEATH)
+        truncated = alive & ~full
+        if self.max_moves is not None:
+            truncated &= self.moves >= self.max_moves
+        else:
+            truncated[:] = False
+        dones = ~alive | full | truncated
+        info = {
+            "score": self.score.copy(),
+            "moves": self.moves.copy(),
+            "truncated": truncated,
+            "won": full,
+        }
+
+        self.reset_boards(dones)
+        return self.observe(), rewards, dones, info
+
+    def observe(self):
+        """Returns the observation planes of every board, shape (num_envs, 4, rows, cols)."""
+        planes = np.zeros((self.num_envs, 4, self.size), dtype=np.uint8)
+        planes[:, BODY] = self.lifetime > 0
+        planes[self.boards, HEAD, self.head] = 1
+        planes[self.boards, FOOD, self.food] = 1
+        planes[:, OBSTACLES] = self.obstacles
+        return planes.reshape(self.num_envs, 4, self.rows, self.cols)
@@ -0,0 +1,90 @@
+from array import array
+
+import numpy as np
+
+
+class SnakeBody:
+    """
+    The snake's body as a fixed-capacity ring buffer of grid cells, from head to tail.
+
+    The buffer has a slot for every cell of the board (the snake can never be longer),
+    so a move is an O(1) push at the head and pop at the tail that neither shifts nor
+    allocates anything. Every cell is written twice, at slot i and i + capacity, so the
+    body is always one contiguous run of the buffer even when it wraps around: cells()
+    is a zero-copy NumPy view of it.
+
+    Indexing and iteration give Points (index 0 is the head, -1 the tail), for code
+    that works with Points rather than cells.
+    """
+
+    def __init__(self, grid, points=()):
+        self.grid = grid
+        self.capacity = grid.size
+        self.buffer = array("i", bytes(8 * self.capacity))
+        # Slot of the head; the body runs from there towards the end of the buffer
+        self.start = 0
+        self.length = 0
+        for point in points:
+            self.append_tail(grid.cell(point))
+
+    def copy(self):
+        body = SnakeBody.__new__(SnakeBody)
+        body.grid = self.grid
+        body.capacity = self.capacity
+        body.buffer = array("i", self.buffer)
+        body.start = self.start
+        body.length = self.length
+        return body
+
+    def push_head(self, cell):
+        """Adds a new head in front of the body."""
+        self.start = start = (self.start - 1) % self.capacity
+        self.buffer[start] = self.buffer[start + self.capacity] = cell
+        self.length += 1
+
+    def pop_tail(self):
+        """Removes the tail from the body and returns its cell."""
+        self.length -= 1
+        return self.buffer[self.start + self.length]
+
+    def append_tail(self, cell):
+        """Adds a cell behind the tail (only used to build a body)."""
+        slot = (self.start + self.length) % self.capacity
+        self.buffer[slot] = self.buffer[slot + self.capacity] = cell
+        self.length += 1
+
+    @property
+    def head(self):
+        """Cell of the head."""
+        return self.buffer[self.start]
+
+    @property
+    def tail(self):
+        """Cell of the tail."""
+        return self.buffer[self.start + self.length - 1]
+
+    def cells(self):
+        """The body's cells from head to tail, as a read-only view into the buffer."""
+        view = np.frombuffer(self.buffer, dtype=np.int32)[
+            self.start : self.start + self.length
+        ]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("snake body index out of range")
+        return self.grid.point(self.buffer[self.start + index])
+
+    def __iter__(self):
+        point = self.grid.point
+        for slot in range(self.start, self.start + self.length):
+            yield point(self.buffer[slot])
+
+    def __repr__(self):
+        return f"SnakeBody({list(self)})"
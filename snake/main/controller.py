@@ -5,30 +5,21 @@ import pygame
 from snake.configs import actions
 from snake.configs.game import FPS, HEIGHT, WIDTH
 from snake.main.state import GameState
-from snake.search_models.informed.a_star_search import AStar
-from snake.search_models.informed.best_first_search import BestFS
-from snake.search_models.local.simple_hill_climbing import HillClimbing
-from snake.search_models.local.steepest_ascent_hill_climbing import (
-    SteepestAscentHillClimbing,
-)
-from snake.search_models.local.stochastic_hill_climbing import StochasticHillClimbing
 
 # Game algorithm class imports
 from snake.search_models.manual import Manual
-from snake.search_models.uninformed.breadth_first_search import BFS
-from snake.search_models.uninformed.depth_first_search import DFS
-from snake.search_models.uninformed.random_search import Random
-from snake.search_models.uninformed.hamiltonian_cycle import HamiltonianCycle
+from snake.search_models.registry import ALGORITHMS
 from snake.ui.game_over import GameOverScreen
 
 # UI Screen imports
 from snake.ui.menu import MainMenu
 from snake.ui.mode_selection import ModeSelectionScreen
 from snake.ui.pause_menu import PauseMenuScreen
+from snake.ui.renderer import GameRenderer
 
 
 class AppController:
-    def __init__(self):
+    def __init__(self, sim_speed=1):
         pygame.init()
         pygame.font.init()  # Explicitly initialize font module
 
@@ -55,22 +46,13 @@ class AppController:
         self.selected_game_mode = None
         self.last_score = 0
         self.game_obstacles_enabled = True
+        # Shared by all games, so speed changes made with +/- carry over to the next game
+        self.renderer = GameRenderer(self.display, sim_speed=sim_speed)
 
         self.clock = pygame.time.Clock()
 
     def get_game_class(self, mode_string):
-        game_mode_map = {
-            actions.MODE_MANUAL: Manual,
-            actions.MODE_ASTAR: AStar,
-            actions.MODE_BEST_FS: BestFS,
-            actions.MODE_BFS: BFS,
-            actions.MODE_DFS: DFS,
-            actions.MODE_SIMPLE_HILL_CLIMBING: HillClimbing,
-            actions.MODE_STEEPEST_ASCENT_HILL_CLIMBING: SteepestAscentHillClimbing,
-            actions.MODE_STOCHASTIC_HILL_CLIMBING: StochasticHillClimbing,
-            actions.MODE_RANDOM: Random,  # Ensure this matches actions.py
-            actions.MODE_HAMILTONIAN_CYCLE: HamiltonianCycle,
-        }
+        game_mode_map = {actions.MODE_MANUAL: Manual, **ALGORITHMS}
         return game_mode_map.get(mode_string)
 
     def run(self):
@@ -108,17 +90,7 @@ class AppController:
                     if action == actions.ACTION_BACK_TO_MENU:
                         self.current_state = GameState.MAIN_MENU
                     # Check if action is one of the known game mode actions
-                    elif action in [
-                        actions.MODE_ASTAR,
-                        actions.MODE_BFS,
-                        actions.MODE_DFS,
-                        actions.MODE_BEST_FS,
-                        actions.MODE_SIMPLE_HILL_CLIMBING,
-                        actions.MODE_STEEPEST_ASCENT_HILL_CLIMBING,
-                        actions.MODE_STOCHASTIC_HILL_CLIMBING,
-                        actions.MODE_RANDOM,
-                        actions.MODE_HAMILTONIAN_CYCLE,
-                    ]:
+                    elif action in ALGORITHMS:
                         self.selected_game_mode = action
                         self.current_game_instance = None
                         self.current_state = GameState.GAME_PLAYING
@@ -134,7 +106,10 @@ class AppController:
                             f"Starting/Restarting game mode: {self.selected_game_mode} with obstacles: {self.game_obstacles_enabled}"
                         )
                         self.current_game_instance = GameAlgorithmClass(
-                            game_has_obstacles=self.game_obstacles_enabled
+                            game_has_obstacles=self.game_obstacles_enabled,
+                            renderer=self.renderer,
+                            # Plan in the background so searches never stall a frame
+                            plan_ahead=True,
                         )
                     else:
                         print(
@@ -144,6 +119,8 @@ class AppController:
                         continue  # Skip to next iteration of main loop
 
                 if self.current_game_instance:
+                    # Menus may have drawn over the board since the last frame
+                    self.renderer.invalidate()
                     # This call will block until that game's loop ends (due to game over or quit event)
                     result = self.current_game_instance.main()
 
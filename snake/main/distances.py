@@ -0,0 +1,108 @@
+from collections import OrderedDict
+
+import numpy as np
+
+# Memory the fields of one board may take; the oldest fields are dropped beyond it
+FIELD_BUDGET = 64 * 2**20
+# Memory the fields of all cached layouts may take together, and the most layouts kept
+CACHE_BUDGET = 256 * 2**20
+MAX_LAYOUTS = 16
+
+
+class DistanceFields:
+    """
+    Obstacle-aware true distances on a board whose obstacles never move.
+
+    The field of a target cell holds, for every cell, the number of moves needed to
+    reach the target while avoiding the obstacles (ignoring the snake, which keeps it
+    a lower bound on any real path and therefore an admissible heuristic).
+    Cells that cannot reach the target at all are set to the board size.
+    Fields are computed lazily, the first time a target is asked for, and kept as
+    NumPy arrays over the grid's cell indices. On large boards, where a field for
+    every cell would not fit in FIELD_BUDGET, the oldest fields are dropped first.
+    """
+
+    def __init__(self, cols, rows, obstacle_cells):
+        self.cols = cols
+        self.rows = rows
+        self.size = cols * rows
+        self.unreachable = self.size
+
+        self.free = np.ones((rows, cols), dtype=bool)
+        for cell in obstacle_cells:
+            self.free[divmod(cell, cols)] = False
+        self.has_obstacles = not self.free.all()
+
+        # Block coordinates of every cell, for the Manhattan fields of open boards
+        self.xs = np.tile(np.arange(cols, dtype=np.int32), rows)
+        self.ys = np.repeat(np.arange(rows, dtype=np.int32), cols)
+        self.fields = {}
+        self.max_fields = min(self.size, max(1, FIELD_BUDGET // (4 * self.size)))
+        # The most memory the fields can take
+        self.max_bytes = 4 * self.size * self.max_fields
+
+    def field(self, target):
+        """Returns the distance from every cell to the given target cell."""
+        field = self.fields.get(target)
+        if field is None:
+            if self.has_obstacles:
+                field = self.flood(target)
+            else:
+                # Without obstacles the Manhattan distance is exact
+                field = np.abs(self.xs - self.xs[target]) + np.abs(
+                    self.ys - self.ys[target]
+                )
+            field.flags.writeable = False
+            if len(self.fields) >= self.max_fields:
+                del self.fields[next(iter(self.fields))]
+            self.fields[target] = field
+        return field
+
+    def flood(self, target):
+        """Breadth-first wavefront from the target, one distance level per iteration."""
+        distances = np.full((self.rows, self.cols), self.unreachable, dtype=np.int32)
+        reached = np.zeros((self.rows, self.cols), dtype=bool)
+        frontier = np.zeros((self.rows, self.cols), dtype=bool)
+        frontier[divmod(target, self.cols)] = True
+
+        distance = 0
+        while frontier.any():
+            reached |= frontier
+            distances[frontier] = distance
+            distance += 1
+
+            # Every cell next to the frontier (left, right, up, down)
+            grown = np.zeros_like(frontier)
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            frontier = grown & self.free & ~reached
+        return distances.ravel()
+
+
+# DistanceFields of the most recently used layouts, oldest first
+_layouts: OrderedDict[tuple, DistanceFields] = OrderedDict()
+
+
+def distance_fields(cols, rows, obstacle_cells):
+    """
+    Returns the shared DistanceFields of a board layout.
+    obstacle_cells must be hashable (e.g. a frozenset), so that games with the same
+    obstacles reuse the fields computed so far. The least recently used layouts are
+    dropped once the fields of all of them could take more than CACHE_BUDGET, so
+    large boards keep fewer layouts around (but always the one asked for).
+    """
+    key = (cols, rows, obstacle_cells)
+    fields = _layouts.get(key)
+    if fields is not None:
+        _layouts.move_to_end(key)
+        return fields
+
+    fields = DistanceFields(cols, rows, obstacle_cells)
+    _layouts[key] = fields
+    total = sum(layout.max_bytes for layout in _layouts.values())
+    while len(_layouts) > 1 and (total > CACHE_BUDGET or len(_layouts) > MAX_LAYOUTS):
+        _key, oldest = _layouts.popitem(last=False)
+        total -= oldest.max_bytes
+    return fields
@@ -1,10 +1,11 @@
+import copy
 import random
 from abc import ABC, abstractmethod
+from collections import deque
 
-import pygame
+import numpy as np
 
 from snake.configs import actions
-from snake.configs.colors import BLACK, BLUE, GREEN, RED, WHITE
 from snake.configs.directions import Direction
 from snake.configs.game import (
     BLOCK_SIZE,
@@ -13,86 +14,244 @@ from snake.configs.game import (
     OBSTACLE_THRESHOLD,
     WIDTH,
 )
+from snake.main.body import SnakeBody
+from snake.main.distances import distance_fields
+from snake.main.grid import board_grid
+from snake.main.planner import PathPlanner
 from snake.main.point import Point
+from snake.main.regions import label_regions, region_sizes
+
+# Occupancy value bit for obstacles; the lower bits count the snake segments on a cell
+OBSTACLE = 0x80
 
 
 class Game(ABC):
-    def __init__(self, game_has_obstacles=False):
-        self.width = WIDTH
-        self.height = HEIGHT
+    """
+    Headless core of the snake game: state, movement, collision and food.
+    Nothing in here depends on pygame; a renderer (see snake.ui.renderer) can be
+    attached as an optional observer to draw frames and pace the game loop.
+    Without one, games run as fast as the search models can plan.
+
+    Every game owns its randomness: the seed (drawn from the global random module if
+    none is given) derives independent streams for food, obstacles and the algorithm
+    (self.rng), so a game is replayed exactly by constructing it with the same seed.
+    A recorder (see snake.replay.recording) can be attached to log every move.
+    Once the snake covers every free cell there is nowhere left for the food: the
+    game is won (won is set and food is None) and the traversals end.
+    """
+
+    # Whether heuristics use obstacle-aware distances (see heuristic) by default
+    distance_heuristic = False
+
+    def __init__(
+        self,
+        game_has_obstacles=False,
+        renderer=None,
+        max_moves=None,
+        time_aware=False,
+        distance_heuristic=None,
+        safe_paths=False,
+        seed=None,
+        recorder=None,
+        plan_ahead=False,
+        search_stats=None,
+        width=WIDTH,
+        height=HEIGHT,
+        block_size=BLOCK_SIZE,
+    ):
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.seed_streams()
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        self.grid = board_grid(width, height, block_size)
+        # Offsets of a move in every direction
+        self.direction_offsets = {
+            Direction.RIGHT: (block_size, 0),
+            Direction.LEFT: (-block_size, 0),
+            Direction.DOWN: (0, block_size),
+            Direction.UP: (0, -block_size),
+        }
+        self.occupancy = bytearray(self.grid.size)
+        self._snake = SnakeBody(self.grid)
+        self._obstacles = ()
+        self.open_distances = distance_fields(
+            self.grid.cols, self.grid.rows, frozenset()
+        )
+        self.distances = self.open_distances
         self.direction = Direction.UP
-        self.head = Point(self.width // 2, self.height // 2)
+        self.head = self.start_point()
         self.snake = [self.head]
         self.score = 0
+        self.moves = 0
+        self.won = False
+        self.max_moves = max_moves
+        self.time_aware = time_aware
+        if distance_heuristic is not None:
+            self.distance_heuristic = distance_heuristic
+        self.safe_paths = safe_paths
+        self.plan_ahead = plan_ahead
+        self.search_stats = search_stats
+        # (expanded, pushed, max_frontier) of the last search, set when stats are on
+        self.search_counts = (0, 0, 0)
         self.game_has_obstacles = game_has_obstacles
-        self.obstacles = []
         self.food = None
         self.path = []
-
-        # Pygame initializations
-        self.display = pygame.display.set_mode((self.width, self.height))
-        self.font = pygame.font.SysFont("arial", 25)
-        self.clock = pygame.time.Clock()
-        pygame.display.set_caption("Snake Game")
+        self.renderer = renderer
+        self.recorder = recorder
 
         # Initialize obstacles and food
         self.generate_obstacles()
         self.generate_food()
+        if self.recorder is not None:
+            self.recorder.start(self)
+
+    def clone(self):
+        """
+        Returns a copy of the game that can be played and planned on independently
+        (e.g. on another thread). Board geometry, obstacles and distance fields are
+        shared; the renderer and recorder are left out, and the search stats are
+        forked (see SearchStats.fork).
+        """
+        game = copy.copy(self)
+        game._snake = self._snake.copy()
+        game.occupancy = bytearray(self.occupancy)
+        game.free_cells = list(self.free_cells)
+        game.free_index = list(self.free_index)
+        game._path = deque(self._path)
+        # Much faster than deep-copying the streams
+        for name in ("food_rng", "obstacle_rng", "rng"):
+            stream = random.Random(0)
+            stream.setstate(getattr(self, name).getstate())
+            setattr(game, name, stream)
+        game.renderer = None
+        game.recorder = None
+        if self.search_stats is not None:
+            game.search_stats = self.search_stats.fork()
+        return game
+
+    def start_point(self):
+        """The cell the snake starts on: the middle of the board."""
+        grid = self.grid
+        return grid.point((grid.rows // 2) * grid.cols + grid.cols // 2)
+
+    def seed_streams(self):
+        """(Re)derives the random streams of the game from its seed."""
+        self.food_rng = random.Random(f"{self.seed}/food")
+        self.obstacle_rng = random.Random(f"{self.seed}/obstacles")
+        self.rng = random.Random(f"{self.seed}/algorithm")
 
     def reset(self):
         """Completely resets the game back to the initial starting point."""
+        self.seed_streams()
         self.direction = Direction.UP
-        self.head = Point(self.width // 2, self.height // 2)
+        self.head = self.start_point()
         self.snake = [self.head]
         self.score = 0
-        self.obstacles.clear()
+        self.moves = 0
+        self.won = False
+        self.obstacles = []
         self.food = None
+        self.path = []
         self.generate_obstacles()
         self.generate_food()
+        if self.recorder is not None:
+            self.recorder.start(self)
+
+    @property
+    def snake(self):
+        """The snake's body (a SnakeBody of cells that reads as Points), from head to tail."""
+        return self._snake
+
+    @snake.setter
+    def snake(self, points):
+        self._snake = SnakeBody(self.grid, points)
+        self.rebuild_occupancy()
+
+    @property
+    def path(self):
+        """The Points the snake follows next, as a deque that moves consume from the left."""
+        return self._path
+
+    @path.setter
+    def path(self, points):
+        self._path = deque(points)
+
+    @property
+    def obstacles(self):
+        """The obstacles on the board. Assign a new sequence to change them."""
+        return self._obstacles
+
+    @obstacles.setter
+    def obstacles(self, points):
+        self._obstacles = tuple(points)
+        self.rebuild_occupancy()
+        # Obstacle-aware distances, shared by all games with the same layout
+        obstacle_cells = frozenset(map(self.grid.cell, self._obstacles))
+        self.distances = distance_fields(self.grid.cols, self.grid.rows, obstacle_cells)
+
+    def rebuild_occupancy(self):
+        """
+        Recomputes the occupancy index and the free cell pool from scratch.
+        Only needed when the snake or obstacles are replaced wholesale; moves keep it up to date.
+        """
+        self.occupancy = bytearray(self.grid.size)
+        for point in self._obstacles:
+            self.occupancy[self.grid.cell(point)] |= OBSTACLE
+        for cell in self._snake.cells().tolist():
+            self.occupancy[cell] += 1
+
+        # Every free cell, in no particular order, and where each one is in there
+        # (-1 for occupied cells), so that cells are taken and released in O(1)
+        free_cells = np.flatnonzero(np.frombuffer(self.occupancy, dtype=np.uint8) == 0)
+        free_index = np.full(self.grid.size, -1)
+        free_index[free_cells] = np.arange(len(free_cells))
+        self.free_cells = free_cells.tolist()
+        self.free_index = free_index.tolist()
 
     def generate_food(self):
         """
-        Randomly generates a food Point in the game.
-        Ensures that obstacles and the snake are avoided in the process.
+        Places the food on a free cell, drawn uniformly from the free cell pool.
+        If the snake covers every free cell there is nowhere left to put it: the
+        food is set to None and the game is won.
         """
-        while True:
-            x = random.randint(0, (self.width - BLOCK_SIZE) // BLOCK_SIZE) * BLOCK_SIZE
-            y = random.randint(0, (self.height - BLOCK_SIZE) // BLOCK_SIZE) * BLOCK_SIZE
-            self.food = Point(x, y)
-            if self.food not in self.snake and self.food not in self.obstacles:
-                break
+        if not self.free_cells:
+            self.food = None
+            self.won = True
+            return
+        cell = self.free_cells[self.food_rng.randrange(len(self.free_cells))]
+        self.food = self.grid.point(cell)
 
     def generate_obstacles(self):
         """
         Randomly generates obstacles in the game.
-        Ensures that the snake is avoided in the process.
+        Ensures that the snake is avoided in the process, and that at least one free
+        cell is left for the food on boards too small for OBSTACLE_THRESHOLD obstacles.
         """
         if self.game_has_obstacles:
-            for _ in range(OBSTACLE_THRESHOLD):
-                while True:
-                    x = (
-                        random.randint(0, (self.width - BLOCK_SIZE) // BLOCK_SIZE)
-                        * BLOCK_SIZE
-                    )
-                    y = (
-                        random.randint(0, (self.height - BLOCK_SIZE) // BLOCK_SIZE)
-                        * BLOCK_SIZE
-                    )
-                    obstacle = Point(x, y)
-                    if obstacle not in self.snake and obstacle not in self.obstacles:
-                        self.obstacles.append(obstacle)
-                        break
-
-    def get_next_head(self, direction):
-        """Returns a point at which the snake's head should move next based on the given direction."""
-        direction_offsets = {
-            Direction.RIGHT: (BLOCK_SIZE, 0),
-            Direction.LEFT: (-BLOCK_SIZE, 0),
-            Direction.DOWN: (0, BLOCK_SIZE),
-            Direction.UP: (0, -BLOCK_SIZE),
-        }
-        offset = direction_offsets.get(direction, (0, 0))
-        return Point(self.head.x + offset[0], self.head.y + offset[1])
+            free_cells = list(self.free_cells)
+            obstacles = []
+            for _ in range(min(OBSTACLE_THRESHOLD, len(free_cells) - 1)):
+                # Swap-remove a random free cell
+                index = self.obstacle_rng.randrange(len(free_cells))
+                free_cells[index], free_cells[-1] = free_cells[-1], free_cells[index]
+                obstacles.append(self.grid.point(free_cells.pop()))
+            self.obstacles = obstacles
+
+    def get_next_head(self, direction, head=None):
+        """
+        Returns a point at which the snake's head should move next based on the given direction.
+        Moves from the given head point instead of the current one, if there is one.
+        """
+        head = head or self.head
+        offset = self.direction_offsets.get(direction, (0, 0))
+        x, y = head.x + offset[0], head.y + offset[1]
+        # Hand out the board's shared Point; only off-board heads need a new one
+        grid = self.grid
+        col, row = x // self.block_size, y // self.block_size
+        if 0 <= col < grid.cols and 0 <= row < grid.rows:
+            return grid.points[row * grid.cols + col]
+        return Point(x, y)
 
     def detect_collision(self):
         """
@@ -101,16 +260,11 @@ class Game(ABC):
         - The snake itself
         - Any obstacles in the game
         """
-        if (
-            self.head.x >= self.width
-            or self.head.x < 0
-            or self.head.y >= self.height
-            or self.head.y < 0
-        ):
+        if not self.grid.contains(self.head):
             return True
-        if self.head in self.snake[1:] or self.head in self.obstacles:
-            return True
-        return False
+        # The head itself accounts for one segment on its cell
+        occupancy = self.occupancy[self.grid.cell(self.head)]
+        return bool(occupancy & OBSTACLE) or occupancy > 1
 
     def detect_random_point_collision(self, next_head):
         """
@@ -121,36 +275,206 @@ class Game(ABC):
 
         Note: Here we assume that the random point is the next head.
         """
-        if (
-            next_head.x >= self.width
-            or next_head.x < 0
-            or next_head.y >= self.height
-            or next_head.y < 0
-        ):
-            return True
-        if next_head in self.snake[:-1] or next_head in self.obstacles:
+        if not self.grid.contains(next_head):
             return True
-        return False
-
-    def update_ui(self):
-        """
-        Updates the game's UI by plotting the following entities on the display window:
-        - The snake's body
-        - The snake's head
-        - Obstacles
-        - Food source
-        - Current score
-        """
-        self.display.fill(BLACK)
-        for point in self.snake:
-            point.plot(self.display, GREEN)
-        self.head.plot(self.display, WHITE)
-        for point in self.obstacles:
-            point.plot(self.display, RED)
-        self.food.plot(self.display, BLUE)
-        text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.display.blit(text, [0, 0])
-        pygame.display.flip()
+        cell = self.grid.cell(next_head)
+        occupancy = self.occupancy[cell]
+        # The tail moves out of the way as the head moves in
+        if cell == self._snake.tail:
+            occupancy -= 1
+        return occupancy != 0
+
+    def step(self, direction):
+        """
+        Moves the snake one block in the given direction and resolves the outcome of the move.
+        Returns False if the snake collided with something, True otherwise.
+        """
+        self.direction = direction
+        self.moves += 1
+        if self.recorder is not None:
+            self.recorder.record(direction)
+        next_head = self.get_next_head(direction)
+
+        # Check if the snake would collide with something
+        # (food is never placed on the snake, so the tail only stays put when it is free anyway)
+        if self.detect_random_point_collision(next_head):
+            return False
+
+        # Move snake
+        self.head = next_head
+        cell = self.grid.cell(self.head)
+        self._snake.push_head(cell)
+        occupancy = self.occupancy
+        free_cells, free_index = self.free_cells, self.free_index
+        occupancy[cell] += 1
+        # Swap-remove the cell from the free cell pool (unless the head moved onto the
+        # tail, whose cell stays covered)
+        if occupancy[cell] == 1:
+            index = free_index[cell]
+            last = free_cells.pop()
+            if last != cell:
+                free_cells[index] = last
+                free_index[last] = index
+            free_index[cell] = -1
+        # Check if snake has reached the food point
+        if self.head == self.food:
+            self.score += 1
+            self.generate_food()
+        else:
+            # Remove the last element from the snake's body as we have added a new head
+            tail = self._snake.pop_tail()
+            occupancy[tail] -= 1
+            # Back into the pool, unless the head moved in
+            if not occupancy[tail]:
+                free_index[tail] = len(free_cells)
+                free_cells.append(tail)
+        return True
+
+    def is_move_limit_reached(self):
+        """Checks if the game has used up its move budget (if it was given one)."""
+        return self.max_moves is not None and self.moves >= self.max_moves
+
+    def poll_events(self):
+        """
+        Checks the attached renderer for user input.
+        Returns the value the traversal should exit with (the score on quit or
+        ACTION_PAUSE_GAME on pause), or None if the game should keep going.
+        """
+        if self.renderer is None:
+            return None
+        action = self.renderer.poll_events()
+        if action == actions.ACTION_QUIT_GAME:
+            # Signal AppController to handle quit by returning current score
+            return self.score
+        return action
+
+    def release_times(self):
+        """
+        Returns, for every cell, the first move at which a path may enter it.
+        Free cells are available right away and obstacles never are. Body segment i
+        (the head being 0) leaves its cell after len(snake) - i moves, so in time-aware
+        mode a path can pass through cells the body will have vacated by then.
+        Otherwise only the tail is expected to move, and the rest of the body is
+        treated like an obstacle.
+        """
+        never = self.grid.size  # No path on the board is this long
+        free_at = [0] * self.grid.size
+        for point in self._obstacles:
+            free_at[self.grid.cell(point)] = never
+
+        length = len(self._snake)
+        for index, cell in enumerate(self._snake.cells().tolist()):
+            release = length - index
+            if release > 1 and not self.time_aware:
+                release = never
+            free_at[cell] = release
+        return free_at
+
+    def static_blocks(self, free_at):
+        """
+        Returns a bytearray with a 1 for every cell that a path might not be allowed to
+        enter, however long it is: obstacles, and body cells that may still be
+        occupied when the head gets there. A path cannot reach a cell in fewer moves
+        than its Manhattan distance from the head, so a body cell released by then is
+        always free. Searches that run backwards from the food do not know when the
+        head will get to a cell, so they can only use the unmarked cells.
+        """
+        grid = self.grid
+        blocked = bytearray(grid.size)
+        for point in self._obstacles:
+            blocked[grid.cell(point)] = 1
+
+        xs, ys = grid.xs, grid.ys
+        head = grid.cell(self.head)
+        head_x, head_y = xs[head], ys[head]
+        for cell in self._snake.cells().tolist():
+            if free_at[cell] > abs(xs[cell] - head_x) + abs(ys[cell] - head_y):
+                blocked[cell] = 1
+        return blocked
+
+    def heuristic(self, target):
+        """
+        Returns the heuristic distance from every cell to the given target cell, as a
+        read-only NumPy array indexed by cell. With distance_heuristic these are the true
+        distances around the obstacles, otherwise the Manhattan distances. Both ignore the
+        snake, so they never overestimate. Fields are cached per obstacle layout.
+        """
+        if self.distance_heuristic:
+            return self.distances.field(target)
+        return self.open_distances.field(target)
+
+    def escape_room(self, body):
+        """
+        Flood-fills the board as it would be with the snake at the given body cells
+        (listed from tail to head, obstacles unchanged).
+        Returns whether the head could still reach the tail, which always moves out of
+        the way, and how many free cells the head could still reach.
+        """
+        if len(body) == 1:
+            # The head is its own tail
+            return True, self.grid.size
+        occupancy = np.frombuffer(self.occupancy, dtype=np.uint8)
+        free = (occupancy & OBSTACLE) == 0
+        free[body[1:]] = False
+        labels = label_regions(free, self.grid.cols)
+        sizes = region_sizes(labels)
+
+        tail_label = labels[body[0]]
+        head_labels = {labels[cell] for cell in self.grid.neighbors[body[-1]]}
+        room = sum(sizes[label] for label in head_labels)
+        return tail_label in head_labels, int(room)
+
+    def body_after(self, path):
+        """
+        Returns the cells the snake would cover, from tail to head, after following
+        the given path of Points (growing by one if the path crosses the food).
+        """
+        body = self._snake.cells()[::-1].tolist()
+        body.extend(self.grid.cell(point) for point in path)
+        length = len(self._snake) + (self.food in path)
+        return body[-length:]
+
+    def traps_snake(self, path):
+        """Checks if following the given path would leave the head unable to reach its tail."""
+        reaches_tail, _room = self.escape_room(self.body_after(path))
+        return not reaches_tail
+
+    def survival_path(self):
+        """
+        Returns a one-move path for when the food cannot be reached safely:
+        the legal move that keeps the tail reachable and leaves the head the most room
+        (or just the most room, if every move traps the snake). Empty if no move is legal.
+        """
+        best_path, best_outcome = [], None
+        for cell in self.grid.neighbors[self.grid.cell(self.head)]:
+            point = self.grid.point(cell)
+            if self.detect_random_point_collision(point):
+                continue
+            outcome = self.escape_room(self.body_after([point]))
+            if best_outcome is None or outcome > best_outcome:
+                best_path, best_outcome = [point], outcome
+        return best_path
+
+    def secure_path(self):
+        """
+        In safe_paths mode, replaces a path that is missing or would trap the snake
+        with a single survival move. Search models call this on every path they plan.
+        """
+        if not self.safe_paths:
+            return
+        if self.path and not self.traps_snake(self.path):
+            return
+        self.path = self.survival_path()
+
+    def update_ui(self, speed=FIXED_AUTO_SPEED):
+        """
+        Lets the renderer draw a frame (if one is due) and pace the loop to the given
+        number of moves per second (times its simulation speed multiplier).
+        Does nothing when the game is running headless.
+        """
+        if self.renderer is None:
+            return
+        self.renderer.advance(self, speed)
 
     @abstractmethod
     def generate_path(self):
@@ -160,6 +484,19 @@ class Game(ABC):
         """
         pass
 
+    def plan(self):
+        """
+        Plans the next move(s) with generate_path, recording the call in the game's
+        search stats (see snake.main.stats) when it has any.
+        A won game has no food left to plan for: it gets no path and no move.
+        """
+        if self.won or self.food is None:
+            self.path = []
+            return None
+        if self.search_stats is None:
+            return self.generate_path()
+        return self.search_stats.measure(self)
+
     def single_step_traversal(self):
         """
         Executes traversal of the snake for algorithms where the snake's
@@ -167,78 +504,85 @@ class Game(ABC):
         """
         while True:
             # Check user input
-            for event in pygame.event.get():
-                # Quit event
-                if event.type == pygame.QUIT:
-                    # Signal AppController to handle quit by returning current score
-                    return self.score
-                # ESC key event - signal AppController to pause
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE or event.key == pygame.KSCAN_ESCAPE:
-                        return actions.ACTION_PAUSE_GAME
+            interrupt = self.poll_events()
+            if interrupt is not None:
+                return interrupt
+            # Stop games that would otherwise never end (e.g. endless cycles)
+            # and games that filled the board
+            if self.won or self.is_move_limit_reached():
+                return self.score
 
             # Set movement of snake
-            self.direction = self.generate_path()
-            if not self.direction:
+            direction = self.plan()
+            if not direction:
                 return self.score
 
             # Move snake
-            self.head = self.get_next_head(self.direction)
-            self.snake.insert(0, self.head)
-
-            # Check if the snake has collided with something
-            if self.detect_collision():
+            if not self.step(direction):
                 return self.score
-            # Check if snake has reached the food point
-            elif self.head == self.food:
-                self.score += 1
-                self.generate_food()
-            else:
-                # Remove the last element from the snake's body as we have added a new head
-                self.snake.pop()
 
             # Update UI and Clock
             self.update_ui()
-            self.clock.tick(FIXED_AUTO_SPEED)
 
     def multi_step_traversal(self):
         """
         Executes traversal of the snake for algorithms where the complete path
         of the snake's movement is evaluated all at once.
+        With plan_ahead, the next path is planned on a background thread (see
+        snake.main.planner) while the snake is still following the current one.
         """
-        while self.path:
-            # Check user input
-            for event in pygame.event.get():
-                # Quit event
-                if event.type == pygame.QUIT:
-                    # Signal AppController to handle quit by returning current score
+        planner = PathPlanner() if self.plan_ahead else None
+        try:
+            if planner is not None:
+                planner.speculate(self)
+            while self._path:
+                # Check user input
+                interrupt = self.poll_events()
+                if interrupt is not None:
+                    return interrupt
+                # Stop games that would otherwise never end (e.g. endless cycles)
+                if self.is_move_limit_reached():
                     return self.score
-                # ESC key event - signal AppController to pause
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE or event.key == pygame.KSCAN_ESCAPE:
-                        return actions.ACTION_PAUSE_GAME
 
-            # Move snake
-            self.direction = self.path.pop(0).get_direction()
-            self.head = self.get_next_head(self.direction)
-            self.snake.insert(0, self.head)
+                # Move snake
+                score = self.score
+                if not self.step(self._path.popleft().direction_from(self.head)):
+                    return self.score
+                # Check if snake has reached the food point and generate path to this new point
+                # (survival moves in safe_paths mode end before the food, so replan then as well)
+                if self.won:
+                    # The snake fills the board: there is no food left to plan for
+                    self.path = []
+                elif self.score != score or not self._path:
+                    if planner is None:
+                        self.plan()
+                    else:
+                        self.take_planned_path(planner)
 
-            # Check if the snake has collided with something
-            if self.detect_collision():
-                return self.score
-            # Check if snake has reached the food point and generate path to this new point
-            elif self.head == self.food:
-                self.score += 1
-                self.generate_food()
-                self.generate_path()
-            else:
-                # Remove the last element from the snake's body as we have added a new head
-                self.snake.pop()
+                # Update UI and Clock
+                self.update_ui()
+            return self.score
+        finally:
+            if planner is not None:
+                planner.close()
 
-            # Update UI and Clock
-            self.update_ui()
-            self.clock.tick(FIXED_AUTO_SPEED)
-        return self.score
+    def take_planned_path(self, planner):
+        """
+        Takes the next path from the planner, waiting for it until the next move is due
+        (without a renderer, or if moves are not paced, for as long as it takes).
+        If the plan is late, a survival move keeps the loop going instead.
+        The planner then starts on the path after this one.
+        """
+        timeout = self.renderer.time_left() if self.renderer is not None else None
+        planned = planner.take(self, timeout)
+        if planned is not None:
+            self.path = planned.path
+            self.rng = planned.rng
+            if self.search_stats is not None:
+                self.search_stats.merge(planned.search_stats)
+        else:
+            self.path = self.survival_path()
+        planner.speculate(self)
 
     @abstractmethod
     def main(self):
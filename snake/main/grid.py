@@ -0,0 +1,81 @@
+from functools import lru_cache
+
+from snake.configs.game import BLOCK_SIZE
+from snake.main.point import Point
+
+
+class Grid:
+    """
+    Board geometry in which every cell is a plain integer: y * cols + x (in blocks).
+    Neighbors of every cell are computed once, so searches can expand cells
+    without allocating anything. Points are only used at the boundary (paths, the
+    renderer), and every cell has one shared Point for that.
+    """
+
+    def __init__(self, width, height, block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        self.cols = width // block_size
+        self.rows = height // block_size
+        self.size = self.cols * self.rows
+
+        # Block coordinates of every cell
+        self.xs = [cell % self.cols for cell in range(self.size)]
+        self.ys = [cell // self.cols for cell in range(self.size)]
+        self.points = [
+            Point(x * block_size, y * block_size) for x, y in zip(self.xs, self.ys)
+        ]
+
+        # Same order as NEIGHBOR_OFFSETS in snake.main.point: left, right, up, down
+        self.neighbors = []
+        for cell in range(self.size):
+            x, y = self.xs[cell], self.ys[cell]
+            cell_neighbors = []
+            if x > 0:
+                cell_neighbors.append(cell - 1)
+            if x < self.cols - 1:
+                cell_neighbors.append(cell + 1)
+            if y > 0:
+                cell_neighbors.append(cell - self.cols)
+            if y < self.rows - 1:
+                cell_neighbors.append(cell + self.cols)
+            self.neighbors.append(tuple(cell_neighbors))
+
+    def contains(self, point):
+        """Checks if the given point lies on the board."""
+        return (
+            0 <= point.x < self.cols * self.block_size
+            and 0 <= point.y < self.rows * self.block_size
+        )
+
+    def cell(self, point):
+        """Returns the cell index of the given (on-board) point."""
+        return (point.y // self.block_size) * self.cols + point.x // self.block_size
+
+    def point(self, cell):
+        """Returns the (shared) Point at the top-left pixel of the given cell."""
+        return self.points[cell]
+
+    def manhattan(self, a, b):
+        """Manhattan distance between two cells, in moves."""
+        return abs(self.xs[a] - self.xs[b]) + abs(self.ys[a] - self.ys[b])
+
+    def trace_path(self, origin, start, goal):
+        """
+        Follows the origin links from goal back to start and returns the path as
+        Points (excluding start).
+        """
+        cells = []
+        while goal != start:
+            cells.append(goal)
+            goal = origin[goal]
+        cells.reverse()
+        return [self.points[cell] for cell in cells]
+
+
+@lru_cache(maxsize=8)
+def board_grid(width, height, block_size=BLOCK_SIZE):
+    """
+    Returns the shared Grid of a board size.
+    Grids are never modified after they are built, so all games on a board share one.
+    """
+    return Grid(width, height, block_size)
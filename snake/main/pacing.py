@@ -0,0 +1,42 @@
+import time
+
+# A loop that falls further behind schedule than this (e.g. while paused or on a slow
+# plan) drops the backlog instead of rushing through it
+MAX_LAG = 0.25
+
+
+class MoveClock:
+    """
+    Fixed-timestep schedule for the moves of a game loop.
+
+    Every move is scheduled 1 / (speed * sim_speed) seconds after the previous one and
+    wait() only sleeps when the loop is ahead of that schedule, so slow moves are made
+    up for by the next ones and the speed holds regardless of how long moves take to
+    plan. sim_speed=None runs the loop as fast as it goes.
+    """
+
+    def __init__(self, sim_speed=1):
+        self.sim_speed = sim_speed
+        self.next_move = None
+        self.move_time = 0.0
+
+    def wait(self, speed):
+        """Called after every move: sleeps until the next move is due."""
+        now = time.perf_counter()
+        if self.next_move is None or now - self.next_move > MAX_LAG:
+            self.next_move = now
+        if self.sim_speed is None:
+            return
+        self.move_time = 1 / (speed * self.sim_speed)
+        self.next_move += self.move_time
+        if self.next_move > now:
+            time.sleep(self.next_move - now)
+
+    def time_left(self):
+        """
+        Seconds left until the move after the one that was just made is due, or None
+        if moves are not paced.
+        """
+        if self.sim_speed is None or self.next_move is None:
+            return None
+        return max(0.0, self.next_move + self.move_time - time.perf_counter())
@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+# After this many moves in a row without a ready plan, wait for the plan instead of
+# making yet another survival move
+MAX_LATE_MOVES = 3
+
+
+def plan_after_path(game):
+    """
+    Follows the game's current path the way multi_step_traversal does and plans the
+    next path from where it ends. Runs on a clone of the game in the planner thread.
+    """
+    for point in list(game.path):
+        score = game.score
+        if not game.step(point.direction_from(game.head)) or game.score != score:
+            break
+    # A won game has no food left to plan for
+    if not game.won:
+        game.plan()
+    return game
+
+
+class PathPlanner:
+    """
+    Plans the next path of a multi-step game on a background thread.
+
+    As soon as the game has a path, speculate() hands a clone of the game to the
+    worker thread, which plays the clone along that path (drawing the same food from
+    its copy of the food stream) and plans from the state the real game will be in
+    when the path runs out. By then the plan is usually ready, so the game loop never
+    plans itself. Planning mostly happens while the loop sleeps between paced moves,
+    so the thread helps despite the GIL.
+
+    A plan that is still running when the next one is asked for was made for a state
+    the game has moved on from. It cannot be interrupted, so it is left to finish on
+    its own and the new plan starts right away on a fresh worker instead of queuing
+    up behind it.
+    """
+
+    def __init__(self):
+        self.executor = self.new_executor()
+        self.future = None
+        # The last plan handed to the worker, until the next one is asked for
+        self.running = None
+        self.late_moves = 0
+
+    @staticmethod
+    def new_executor():
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="planner")
+
+    def speculate(self, game):
+        """Starts planning the path that follows the game's current one."""
+        running = self.running
+        if running is not None and not running.done() and not running.cancel():
+            # Abandon the worker busy with the superseded plan
+            self.executor.shutdown(wait=False)
+            self.executor = self.new_executor()
+        self.future = self.running = self.executor.submit(plan_after_path, game.clone())
+
+    def take(self, game, timeout=None):
+        """
+        Returns the clone with the planned path for the game's current state, waiting
+        at most timeout seconds for it (forever if None or if the game has been late
+        MAX_LATE_MOVES times in a row). Returns None if the plan is late.
+        """
+        future, self.future = self.future, None
+        if future is None:
+            return None
+        if self.late_moves >= MAX_LATE_MOVES:
+            timeout = None
+        try:
+            clone = future.result(timeout)
+        except TimeoutError:
+            self.late_moves += 1
+            return None
+        self.late_moves = 0
+        # The clone must have ended up exactly where the game is
+        if (clone.moves, clone.head, clone.food, clone.score) != (
+            game.moves,
+            game.head,
+            game.food,
+            game.score,
+        ):
+            return None
+        return clone
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,60 @@
+import numpy as np
+
+
+def _runs(free):
+    """
+    Splits the free cells of a 2D board into horizontal runs.
+    Returns the flat indices of the free cells in row order, the position of the first
+    cell of every run within them and the length of every run.
+    """
+    cells = np.flatnonzero(free)
+    run_starts = free.copy()
+    run_starts[:, 1:] &= ~free[:, :-1]
+    starts = np.flatnonzero(run_starts[free])
+    return cells, starts, np.diff(starts, append=len(cells))
+
+
+def label_regions(free, cols):
+    """
+    Labels the 4-connected regions of free cells on a board with the given number of
+    columns. free is a boolean NumPy array over the cell indices.
+
+    Returns an int array over the cell indices (plus one trailing sentinel entry) in
+    which every free cell holds the smallest cell index of its region, and every
+    blocked cell holds len(free).
+
+    Fully vectorized: each round spreads the smallest label over every horizontal and
+    then every vertical run of free cells in one go, and then lets every cell jump to
+    its label's label (pointer jumping). Labels therefore cross whole corridors per
+    round, and a 32x32 board settles in a handful of rounds, well under a millisecond.
+    """
+    size = len(free)
+    board = free.reshape(-1, cols)
+    rows = board.shape[0]
+    labels = np.arange(size + 1)
+    labels[:size][~free] = size
+    if not free.any():
+        return labels
+
+    row_cells, row_starts, row_lengths = _runs(board)
+    column_cells, column_starts, column_lengths = _runs(board.T)
+    # Indices into the transposed board back to cell indices
+    column_cells = (column_cells % rows) * cols + column_cells // rows
+
+    while True:
+        spread = labels.copy()
+        row_min = np.minimum.reduceat(spread[row_cells], row_starts)
+        spread[row_cells] = np.repeat(row_min, row_lengths)
+        column_min = np.minimum.reduceat(spread[column_cells], column_starts)
+        spread[column_cells] = np.repeat(column_min, column_lengths)
+        spread = spread[spread]
+        if np.array_equal(spread, labels):
+            return labels
+        labels = spread
+
+
+def region_sizes(labels):
+    """Returns the number of cells in the region of every label from label_regions."""
+    sizes = np.bincount(labels, minlength=len(labels))
+    sizes[-1] = 0  # Blocked cells are not a region
+    return sizes
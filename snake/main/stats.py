@@ -0,0 +1,85 @@
+import time
+
+
+class SearchStats:
+    """
+    Per-call counters of a game's generate_path calls, enabled with
+    Game(search_stats=SearchStats()). Every call records:
+    - expanded: cells taken off the frontier and expanded
+    - pushed: cells added to the frontier
+    - max_frontier: largest size the frontier reached
+    - path_length: moves in the resulting path (1 for single-step models that moved)
+    - replan: whether the call planned for the same food as the call before it,
+      e.g. after a survival move or a path that ran out early
+    - wall time of the call
+
+    The graph searches (A*, Best-First Search, BFS, DFS, Jump Point Search and the
+    bidirectional ones) fill in the search counters; the other models only record path
+    lengths, re-plans and times. Without stats the searches skip all counting, so a
+    disabled game pays one check per plan.
+
+    Clones of a game (e.g. the ones plan_ahead plans on) record into a fork() of its
+    stats, which is only merge()d back if the game adopts the clone's plan, so plans
+    that are thrown away are not counted.
+    """
+
+    COUNTERS = (
+        "expanded",
+        "pushed",
+        "max_frontier",
+        "path_length",
+        "replan",
+        "wall_ms",
+    )
+
+    def __init__(self):
+        self.calls = {counter: [] for counter in self.COUNTERS}
+        self.last_target = None
+
+    def measure(self, game):
+        """Runs the game's generate_path and records its counters."""
+        target = game.food
+        game.search_counts = (0, 0, 0)
+        start = time.perf_counter()
+        result = game.generate_path()
+        elapsed = time.perf_counter() - start
+
+        expanded, pushed, max_frontier = game.search_counts
+        calls = self.calls
+        calls["expanded"].append(expanded)
+        calls["pushed"].append(pushed)
+        calls["max_frontier"].append(max_frontier)
+        # Single-step models return their move, multi-step ones set game.path
+        calls["path_length"].append(1 if result else len(game.path))
+        calls["replan"].append(target == self.last_target)
+        calls["wall_ms"].append(elapsed * 1000)
+        self.last_target = target
+        return result
+
+    def fork(self):
+        """Returns empty stats that carry on from the calls recorded so far."""
+        stats = SearchStats()
+        stats.last_target = self.last_target
+        return stats
+
+    def merge(self, stats):
+        """Appends the calls recorded by stats forked from these ones."""
+        for counter in self.COUNTERS:
+            self.calls[counter].extend(stats.calls[counter])
+        self.last_target = stats.last_target
+
+    def summary(self):
+        """Totals over all recorded calls."""
+        calls = self.calls
+        return {
+            "plans": len(calls["wall_ms"]),
+            "replans": sum(calls["replan"]),
+            "expanded": sum(calls["expanded"]),
+            "pushed": sum(calls["pushed"]),
+            "max_frontier": max(calls["max_frontier"], default=0),
+            "wall_ms": sum(calls["wall_ms"]),
+        }
+
+    def to_record(self):
+        """Summary plus every call's counters as one list per counter (JSON-friendly)."""
+        return {**self.summary(), "calls": self.calls}
@@ -0,0 +1,74 @@
+import argparse
+import os
+import sys
+
+from snake.replay.player import ReplayPlayer
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m snake.replay",
+        description="Inspects, verifies and renders frames of recorded snake games.",
+    )
+    parser.add_argument("replay", help="replay file (.snkr)")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="replay the whole game and check that it ends with the recorded score",
+    )
+    parser.add_argument(
+        "-f",
+        "--frames",
+        type=int,
+        nargs="+",
+        metavar="MOVE",
+        help="save a PNG of the board after each of these moves",
+    )
+    parser.add_argument(
+        "--out", default=".", metavar="DIR", help="directory for the frames"
+    )
+    return parser.parse_args(argv)
+
+
+def save_frames(player, moves, out):
+    """Renders the requested moves off screen and saves them as PNGs."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    # Importing pygame is only needed (and only paid for) when frames are rendered
+    import pygame
+
+    from snake.ui.renderer import GameRenderer
+
+    pygame.init()
+    game = player.game
+    display = pygame.display.set_mode((game.width, game.height))
+    renderer = GameRenderer(display)
+    os.makedirs(out, exist_ok=True)
+    try:
+        for move in player.render(moves, renderer):
+            path = os.path.join(out, f"move-{move:06d}.png")
+            pygame.image.save(display, path)
+            print(path)
+    finally:
+        pygame.quit()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    player = ReplayPlayer.load(args.replay)
+    replay = player.replay
+    print(
+        f"seed {replay.seed}, {replay.cols}x{replay.rows} board, "
+        f"{len(replay.obstacles)} obstacles, {replay.moves} moves, score {replay.score}"
+    )
+
+    if args.frames:
+        save_frames(player, args.frames, args.out)
+    if args.verify:
+        game = player.play_to_end()
+        if game.score != replay.score:
+            sys.exit(f"Replay diverged: score {game.score}, recorded {replay.score}")
+        print("Replay verified")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from snake.main.game import Game
+from snake.replay.recording import Replay
+
+
+class ReplayGame(Game):
+    """Game whose moves come from a replay instead of a search model."""
+
+    def generate_path(self):
+        return None
+
+    def main(self):
+        return self.score
+
+
+class ReplayPlayer:
+    """
+    Plays a Replay back by re-simulating the game headless from its seed.
+    seek() fast-forwards (or restarts and fast-forwards) to any move at full speed;
+    frames are only drawn for the moves passed to render().
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.directions = replay.directions()
+        self.game = None
+        self.position = 0
+        self.restart()
+
+    @classmethod
+    def load(cls, path):
+        return cls(Replay.load(path))
+
+    def restart(self):
+        """Sets the game up again, as it was before the first move."""
+        replay = self.replay
+        block = replay.block_size
+        self.game = ReplayGame(
+            replay.has_obstacles,
+            seed=replay.seed,
+            width=replay.cols * block,
+            height=replay.rows * block,
+            block_size=block,
+        )
+        grid = self.game.grid
+        obstacles = tuple(grid.cell(point) for point in self.game.obstacles)
+        if obstacles != replay.obstacles:
+            raise ValueError("Replay does not match this version of the game")
+        self.position = 0
+
+    def seek(self, move):
+        """
+        Brings the game to its state after the given number of moves
+        (clamped to the length of the replay) and returns it.
+        """
+        move = max(0, min(move, len(self.directions)))
+        if move < self.position:
+            self.restart()
+        game = self.game
+        for direction in self.directions[self.position : move]:
+            game.step(direction)
+        self.position = move
+        return game
+
+    def play_to_end(self):
+        """Replays every remaining move and returns the final game state."""
+        return self.seek(len(self.directions))
+
+    def render(self, moves, renderer):
+        """Draws the game after each of the given moves with the renderer, in order."""
+        for move in sorted(moves):
+            renderer.draw(self.seek(move))
+            yield move
@@ -0,0 +1,158 @@
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+from snake.configs.directions import Direction
+
+# Every move is stored as the index of its direction in here, in 2 bits
+DIRECTIONS = (Direction.LEFT, Direction.RIGHT, Direction.UP, Direction.DOWN)
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+MAGIC = b"SNKR"
+# Games of older versions placed food and obstacles differently, so their replays
+# cannot be played back
+VERSION = 3
+# magic, version, flags, cols, rows, block size, seed, moves, score, obstacle count
+HEADER = struct.Struct("<4sBBHHHQIIH")
+FLAG_OBSTACLES = 1
+
+
+def pack_moves(codes):
+    """Packs direction codes (one per byte) into 2 bits each, four moves per byte."""
+    codes = np.frombuffer(bytes(codes), dtype=np.uint8)
+    padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+    padded[: len(codes)] = codes
+    quads = padded.reshape(-1, 4)
+    return (
+        quads[:, 0] | quads[:, 1] << 2 | quads[:, 2] << 4 | quads[:, 3] << 6
+    ).tobytes()
+
+
+def unpack_moves(packed, count):
+    """Reverses pack_moves, returning the first count direction codes."""
+    packed = np.frombuffer(packed, dtype=np.uint8)
+    quads = np.stack([(packed >> shift) & 3 for shift in (0, 2, 4, 6)], axis=1)
+    return quads.ravel()[:count].tobytes()
+
+
+@dataclass
+class Replay:
+    """
+    Everything needed to replay a game exactly: its seed and board, plus the direction
+    of every move. The obstacle layout and final score are stored as well, so a replay
+    can be checked against the version of the game that plays it back.
+    """
+
+    seed: int
+    cols: int
+    rows: int
+    block_size: int
+    has_obstacles: bool
+    obstacles: tuple
+    codes: bytes
+    score: int
+
+    @property
+    def moves(self):
+        return len(self.codes)
+
+    def directions(self):
+        """Returns the direction of every move, in order."""
+        return [DIRECTIONS[code] for code in self.codes]
+
+    def to_bytes(self):
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            FLAG_OBSTACLES if self.has_obstacles else 0,
+            self.cols,
+            self.rows,
+            self.block_size,
+            self.seed,
+            len(self.codes),
+            self.score,
+            len(self.obstacles),
+        )
+        obstacles = struct.pack(f"<{len(self.obstacles)}I", *self.obstacles)
+        return header + obstacles + pack_moves(self.codes)
+
+    @classmethod
+    def from_bytes(cls, data):
+        (
+            magic,
+            version,
+            flags,
+            cols,
+            rows,
+            block_size,
+            seed,
+            moves,
+            score,
+            obstacle_count,
+        ) = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a snake replay (or one from an unsupported version)")
+        offset = HEADER.size
+        cells = struct.Struct(f"<{obstacle_count}I")
+        obstacles = cells.unpack_from(data, offset)
+        offset += cells.size
+        return cls(
+            seed=seed,
+            cols=cols,
+            rows=rows,
+            block_size=block_size,
+            has_obstacles=bool(flags & FLAG_OBSTACLES),
+            obstacles=obstacles,
+            codes=unpack_moves(data[offset:], moves),
+            score=score,
+        )
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """
+    Records a game's moves as it is played: attach it with Game(recorder=...).
+    The game calls start() when it sets up its board and record() on every move.
+    Recording a move is a plain list append; the directions are only encoded
+    (Direction members hash slowly) when the replay is built.
+    """
+
+    def __init__(self):
+        self.game = None
+        self.directions = []
+
+    def start(self, game):
+        """Starts a new recording of the given game, which has just been set up."""
+        if not isinstance(game.seed, int) or not 0 <= game.seed < 2**64:
+            raise ValueError("Only games with a 64-bit integer seed can be recorded")
+        self.game = game
+        self.directions = []
+
+    def record(self, direction):
+        self.directions.append(direction)
+
+    def replay(self):
+        """Returns the recording so far as a Replay."""
+        game = self.game
+        return Replay(
+            seed=game.seed,
+            cols=game.grid.cols,
+            rows=game.grid.rows,
+            block_size=game.grid.block_size,
+            has_obstacles=game.game_has_obstacles,
+            obstacles=tuple(game.grid.cell(point) for point in game.obstacles),
+            codes=bytes(map(DIRECTION_CODES.__getitem__, self.directions)),
+            score=game.score,
+        )
+
+    def save(self, path):
+        self.replay().save(path)
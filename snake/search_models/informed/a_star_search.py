@@ -1,85 +1,85 @@
 import heapq
-from collections import deque
 
 from snake.main.game import Game
 
 
 class AStar(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
         self.open = []  # Will be a min-priority queue (heap)
-        self.closed = set()
+        self.closed = bytearray()
         self.counter = 0  # Initialize counter
 
         # Calculate initial path
-        self.generate_path()
-
-    def calculate_h(self, point):
-        """Calculates heuristic i.e. the Manhattan distance between selected node and goal state"""
-        return abs(self.food.x - point.x) + abs(self.food.y - point.y)
+        self.plan()
 
     def generate_path(self):
         """Implements A* Search algorithm for snake traversal"""
+        grid = self.grid
         self.path = []
         self.open = []
-        self.closed = set()
+        self.closed = bytearray(grid.size)
         self.counter = 0  # Reset counter for each path generation call
 
+        # First move at which each cell may be entered, and per-cell search bookkeeping
+        free_at = self.release_times()
+        g = [grid.size] * grid.size  # Any real path is shorter than the board size
+        origin = [None] * grid.size
+
         # Initialize the start node
-        self.head.g = 0
-        self.head.h = self.calculate_h(self.head)
-        self.head.f = self.head.g + self.head.h
-        self.head.origin = None  # Ensure origin is None for the head
-        heapq.heappush(self.open, (self.head.f, self.counter, self.head))
+        start = grid.cell(self.head)
+        goal = grid.cell(self.food)
+        h = self.heuristic(goal).tolist()
+        g[start] = 0
+        heapq.heappush(self.open, (h[start], 0, self.counter, start))
         self.counter += 1
 
+        # Frontier sizes are only tracked for the search stats
+        track = self.search_stats is not None
+        max_frontier = 0
+
         while self.open:
-            # Select node with the lowest f value
-            _f_value, _count, current = heapq.heappop(self.open)
+            if track and len(self.open) > max_frontier:
+                max_frontier = len(self.open)
+            # Select node with the lowest f value; among equal f values the deepest one,
+            # which heads straight for the goal instead of widening the whole f-level
+            _f_value, _g, _count, current = heapq.heappop(self.open)
 
-            if (current in self.closed):
+            if self.closed[current]:
                 # Already processed this node via a shorter or equal path
                 continue
-            self.closed.add(current)
-
-            is_current_node_food = current == self.food
-
-            # Simulate moving the snake to current position for collision checks
-            current_simulated_snake = deque(self.snake)
-            # Start with actual game snake state
-            current_simulated_snake.appendleft(current)  # Assume head moves to current
-            if not is_current_node_food:
-                if len(current_simulated_snake) > 1:  # Snake grows if food is eaten
-                    current_simulated_snake.pop()  # Tail moves forward only if not eating
+            self.closed[current] = 1
 
             # Check if snake has reached the goal state (food)
-            if is_current_node_food:
+            if current == goal:
                 # Reconstruct path - backtrack from food to head
-                while current.origin:
-                    self.path.append(current)
-                    current = current.origin
-                self.path.reverse()
-                return
+                self.path = grid.trace_path(origin, start, current)
+                break
 
             # Explore neighbors of the selected node
-            current.generate_neighbors()
-            for neighbor in current.neighbors:
-                # Basic collision checks
-                if neighbor in self.obstacles or neighbor in current_simulated_snake:
+            neighbor_g = g[current] + 1
+            for neighbor in grid.neighbors[current]:
+                # Basic collision checks (the snake's body may have moved on by move neighbor_g)
+                if neighbor_g < free_at[neighbor] or self.closed[neighbor]:
                     continue
-
-                if (neighbor in self.closed):
-                    # Already found the optimal path to this neighbor
+                # Only keep the shortest known way of reaching the neighbor
+                if neighbor_g >= g[neighbor]:
                     continue
 
-                neighbor.g = current.g + 1
-                neighbor.h = self.calculate_h(neighbor)
-                neighbor.f = neighbor.g + neighbor.h
-                neighbor.origin = current
-                heapq.heappush(self.open, (neighbor.f, self.counter, neighbor))
+                g[neighbor] = neighbor_g
+                origin[neighbor] = current
+                neighbor_f = neighbor_g + h[neighbor]
+                heapq.heappush(
+                    self.open, (neighbor_f, -neighbor_g, self.counter, neighbor)
+                )
                 self.counter += 1
 
-        # If the loop finishes, no path was found, self.path remains [] as initialized.
+        if track:
+            self.search_counts = (self.closed.count(1), self.counter, max_frontier)
+
+        # If no path was found, self.path remains [] as initialized.
+        # In safe_paths mode, paths that would trap the snake are replaced by a survival move.
+        self.secure_path()
 
     def main(self):
         """Executes multi-step traversal based on the A* generated path."""
@@ -1,86 +1,79 @@
 import heapq
-from collections import deque
 
 from snake.main.game import Game
 
 
 class BestFS(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
         self.open = []  # Will be a min-priority queue (heap)
-        self.closed = set()
+        self.closed = bytearray()
         self.counter = 0  # Initialize counter
 
         # Calculate initial path
-        self.generate_path()
-
-    def calculate_h(self, point):
-        """Calculates heuristic i.e. the Manhattan distance between selected node and goal state"""
-        return abs(self.food.x - point.x) + abs(self.food.y - point.y)
+        self.plan()
 
     def generate_path(self):
         """Implements Best First Search algorithm for snake traversal"""
+        grid = self.grid
         self.path = []
         self.open = []
-        self.closed = set()
+        self.closed = bytearray(grid.size)
         self.counter = 0  # Reset counter for each path generation call
 
+        # First move at which each cell may be entered, the cell each cell was
+        # reached from and the number of moves needed to get there
+        free_at = self.release_times()
+        origin = [None] * grid.size
+        depth = [0] * grid.size
+
         # Initialize the start node
-        # For BestFS, only h matters for priority. g and f are not strictly needed for the algorithm itself.
-        self.head.h = self.calculate_h(self.head)
-        self.head.origin = None  # Ensure origin is None for the head
-        heapq.heappush(self.open, (self.head.h, self.counter, self.head))
+        # For BestFS, only h matters for priority. g and f are not needed for the algorithm itself.
+        start = grid.cell(self.head)
+        goal = grid.cell(self.food)
+        h = self.heuristic(goal).tolist()
+        heapq.heappush(self.open, (h[start], self.counter, start))
         self.counter += 1
 
-        # food_eaten flag not needed due to early return
+        # Frontier sizes are only tracked for the search stats
+        track = self.search_stats is not None
+        max_frontier = 0
 
         while self.open:
+            if track and len(self.open) > max_frontier:
+                max_frontier = len(self.open)
             # Select node with the lowest h value
             _h_value, _count, current = heapq.heappop(self.open)
 
-            if current in self.closed:  # Already processed this node
+            if self.closed[current]:  # Already processed this node
                 continue
-            self.closed.add(current)
-
-            is_current_node_food = current == self.food
-
-            # Simulate moving the snake to current position for collision checks
-            current_simulated_snake = deque(
-                self.snake
-            )  # Start with actual game snake state
-            current_simulated_snake.appendleft(current)  # Assume head moves to current
-            if not is_current_node_food:
-                if len(current_simulated_snake) > 1:  # Snake grows if food is eaten
-                    current_simulated_snake.pop()  # Tail moves forward only if not eating
+            self.closed[current] = 1
 
             # Check if snake has reached the goal state (food)
-            if is_current_node_food:
-                # Reconstruct path
-                while current.origin:  # Backtrack from food to head
-                    self.path.append(current)
-                    current = current.origin
-                self.path.reverse()
-                return
+            if current == goal:
+                # Reconstruct path - backtrack from food to head
+                self.path = grid.trace_path(origin, start, current)
+                break
 
             # Explore neighbors of the selected node
-            current.generate_neighbors()
-            for neighbor in current.neighbors:
-                if neighbor in self.obstacles or neighbor in current_simulated_snake:
+            neighbor_depth = depth[current] + 1
+            for neighbor in grid.neighbors[current]:
+                if neighbor_depth < free_at[neighbor] or self.closed[neighbor]:
                     continue
 
-                if (
-                    neighbor in self.closed
-                ):  # Already found the optimal path (by h) to this neighbor
-                    continue
-
-                # The neighbor Point object from generate_neighbors() is a new instance.
-                # Set its h and origin for this specific path consideration.
-                neighbor.h = self.calculate_h(neighbor)
-                neighbor.origin = current
-                heapq.heappush(self.open, (neighbor.h, self.counter, neighbor))
+                # The first time a cell is reached decides its origin, as its h never changes
+                if origin[neighbor] is None:
+                    origin[neighbor] = current
+                    depth[neighbor] = neighbor_depth
+                heapq.heappush(self.open, (h[neighbor], self.counter, neighbor))
                 self.counter += 1
 
-        # If the loop finishes, no path was found, self.path remains [] as initialized.
+        if track:
+            self.search_counts = (self.closed.count(1), self.counter, max_frontier)
+
+        # If no path was found, self.path remains [] as initialized.
+        # In safe_paths mode, paths that would trap the snake are replaced by a survival move.
+        self.secure_path()
 
     def main(self):
         return self.multi_step_traversal()
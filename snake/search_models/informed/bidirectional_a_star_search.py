@@ -0,0 +1,151 @@
+import heapq
+
+from snake.main.game import Game
+
+
+class BidirectionalAStar(Game):
+    """
+    A* Search from the head towards the food and from the food towards the head at
+    the same time, always advancing the search with the smaller frontier. Every cell
+    reached by both searches joins a path; the search stops once no open cell on
+    either side can lead to a shorter one than the best path found.
+
+    As in BidirectionalBFS, the forward search may pass through body cells that are
+    vacated in time, while the backward search avoids every cell that
+    Game.static_blocks marks, and the forward search goes on alone once the backward
+    one is walled in.
+    """
+
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
+        self.open = []  # Min-priority queues (heaps) of both searches
+        self.open_backward = []
+        # Cells expanded by the search from the head and by the one from the food
+        self.closed = bytearray()
+        self.closed_backward = bytearray()
+        self.counter = 0  # Initialize counter
+
+        # Calculate initial path
+        self.plan()
+
+    def generate_path(self):
+        """Implements Bidirectional A* Search algorithm for snake traversal"""
+        grid = self.grid
+        self.path = []
+        self.open = open_forward = []
+        self.open_backward = open_backward = []
+        self.closed = closed = bytearray(grid.size)
+        self.closed_backward = closed_backward = bytearray(grid.size)
+        self.counter = 0  # Reset counter for each path generation call
+
+        free_at = self.release_times()
+        blocked = self.static_blocks(free_at)
+        # Moves from the head to each cell and from each cell to the food (any real
+        # path is shorter than the board size), the cell each cell was reached from
+        # and the cell it leads to
+        g = [grid.size] * grid.size
+        back_g = [grid.size] * grid.size
+        origin = [None] * grid.size
+        successor = [None] * grid.size
+
+        start = grid.cell(self.head)
+        goal = grid.cell(self.food)
+        # Heuristic distances to the food and to the head (see Game.heuristic)
+        h = self.heuristic(goal).tolist()
+        back_h = self.heuristic(start).tolist()
+        g[start] = 0
+        back_g[goal] = 0
+        heapq.heappush(open_forward, (h[start], 0, self.counter, start))
+        heapq.heappush(open_backward, (back_h[goal], 0, self.counter + 1, goal))
+        self.counter += 2
+
+        # Cell where the shortest path found so far meets, and that path's length
+        meet = start if start == goal else None
+        best = 0 if meet is not None else grid.size
+
+        # Frontier sizes are only tracked for the search stats
+        track = self.search_stats is not None
+        max_frontier = 0
+
+        while open_forward:
+            if track and len(open_forward) + len(open_backward) > max_frontier:
+                max_frontier = len(open_forward) + len(open_backward)
+            # Neither search can find a shorter path once the lowest f value on either
+            # side (a lower bound for every path through its open cells) reaches it
+            if best <= open_forward[0][0] or (
+                open_backward and best <= open_backward[0][0]
+            ):
+                break
+
+            if open_backward and len(open_backward) < len(open_forward):
+                _f_value, _g, _count, current = heapq.heappop(open_backward)
+                if closed_backward[current]:
+                    continue
+                closed_backward[current] = 1
+
+                neighbor_g = back_g[current] + 1
+                for neighbor in grid.neighbors[current]:
+                    if blocked[neighbor] or closed_backward[neighbor]:
+                        continue
+                    if neighbor_g >= back_g[neighbor]:
+                        continue
+
+                    back_g[neighbor] = neighbor_g
+                    successor[neighbor] = current
+                    neighbor_f = neighbor_g + back_h[neighbor]
+                    heapq.heappush(
+                        open_backward, (neighbor_f, -neighbor_g, self.counter, neighbor)
+                    )
+                    self.counter += 1
+                    # The head reaches the neighbor in time, and the rest of the way
+                    # to the food is free whenever it gets there
+                    if g[neighbor] + neighbor_g < best:
+                        meet, best = neighbor, g[neighbor] + neighbor_g
+            else:
+                # Among equal f values the deepest cell, as in AStar
+                _f_value, _g, _count, current = heapq.heappop(open_forward)
+                if closed[current]:
+                    continue
+                closed[current] = 1
+
+                neighbor_g = g[current] + 1
+                for neighbor in grid.neighbors[current]:
+                    # Basic collision checks (the snake's body may have moved on by move neighbor_g)
+                    if neighbor_g < free_at[neighbor] or closed[neighbor]:
+                        continue
+                    if neighbor_g >= g[neighbor]:
+                        continue
+
+                    g[neighbor] = neighbor_g
+                    origin[neighbor] = current
+                    neighbor_f = neighbor_g + h[neighbor]
+                    heapq.heappush(
+                        open_forward, (neighbor_f, -neighbor_g, self.counter, neighbor)
+                    )
+                    self.counter += 1
+                    if neighbor_g + back_g[neighbor] < best:
+                        meet, best = neighbor, neighbor_g + back_g[neighbor]
+
+        if meet is not None:
+            # Backtrack from the meeting cell to the head, then follow it on to the food
+            path = grid.trace_path(origin, start, meet)
+            cell = meet
+            while cell != goal:
+                cell = successor[cell]
+                path.append(grid.point(cell))
+            self.path = path
+
+        if track:
+            self.search_counts = (
+                closed.count(1) + closed_backward.count(1),
+                self.counter,
+                max_frontier,
+            )
+
+        # If no path was found, self.path remains [] as initialized.
+        # In safe_paths mode, paths that would trap the snake are replaced by a survival move.
+        self.secure_path()
+
+    def main(self):
+        """Executes multi-step traversal along the bidirectional A* path."""
+        return self.multi_step_traversal()
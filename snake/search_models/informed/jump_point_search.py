@@ -0,0 +1,199 @@
+import heapq
+
+from snake.main.game import Game
+
+# Two neighboring cells of a row: an occupied one and then a free one, or the reverse
+BLOCKED_FREE = b"\x01\x00"
+FREE_BLOCKED = b"\x00\x01"
+
+
+class JumpPointSearch(Game):
+    """
+    A* Search that jumps over the cells of straight runs instead of pushing each of
+    them onto the heap (Jump Point Search for 4-connected grids).
+
+    On a uniform grid most shortest paths have many symmetric twins that only differ
+    in the order of their moves. This search only follows the ones that make their
+    vertical moves as early as possible: a horizontal run only turns at a cell whose
+    vertical neighbor could not have been reached by turning one cell earlier (a forced
+    neighbor), and every cell of a vertical run may branch off horizontally. A run is
+    scanned without touching the heap until it reaches the food, a forced neighbor or
+    (vertically) a cell with a horizontal branch that leads to one; only these jump
+    points are pushed. Horizontal runs are scanned a row at a time with bytes searches.
+
+    The search needs a board that does not change while the snake moves, so every cell
+    that Game.static_blocks marks counts as blocked: obstacles, and body cells that may
+    still be occupied when the head gets there.
+    """
+
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
+        self.open = []  # Will be a min-priority queue (heap) of jump points
+        self.closed = bytearray()
+        self.counter = 0  # Initialize counter
+
+        # Calculate initial path
+        self.plan()
+
+    def jump_horizontal(self, cell, dx, blocked, goal):
+        """
+        Returns the first jump point in direction dx (-1 or 1) along the row of the
+        given cell, or None if the run hits a wall first.
+        """
+        grid = self.grid
+        cols = grid.cols
+        x = grid.xs[cell]
+        row = cell - x
+        # Stops that end the run: the food, and free cells with a forced neighbor
+        # above or below (the cell before them has a blocked one there)
+        stops = []
+        if row <= goal < row + cols and (goal - cell) * dx > 0:
+            stops.append(goal)
+        for side in (row - cols, row + cols):
+            if not 0 <= side < grid.size:
+                continue
+            if dx > 0:
+                found = blocked.find(BLOCKED_FREE, side + x, side + cols)
+                if found >= 0:
+                    stops.append(row + found + 1 - side)
+            else:
+                found = blocked.rfind(FREE_BLOCKED, side, side + x + 1)
+                if found >= 0:
+                    stops.append(row + found - side)
+        if not stops:
+            return None
+
+        # The nearest stop, if the run gets there before a blocked cell
+        if dx > 0:
+            stop = min(stops)
+            wall = blocked.find(1, cell + 1, stop + 1)
+        else:
+            stop = max(stops)
+            wall = blocked.rfind(1, stop, cell)
+        return stop if wall < 0 else None
+
+    def jump_vertical(self, cell, dy, blocked, goal):
+        """
+        Returns the first jump point in direction dy (-1 or 1) along the column of the
+        given cell, or None if the run hits a wall first.
+        """
+        grid = self.grid
+        step = dy * grid.cols
+        cell += step
+        while 0 <= cell < grid.size and not blocked[cell]:
+            if cell == goal:
+                return cell
+            # Stop where a horizontal branch leads to a jump point
+            if (
+                self.jump_horizontal(cell, 1, blocked, goal) is not None
+                or self.jump_horizontal(cell, -1, blocked, goal) is not None
+            ):
+                return cell
+            cell += step
+        return None
+
+    def generate_path(self):
+        """Implements Jump Point Search for snake traversal"""
+        grid = self.grid
+        cols = grid.cols
+        self.path = []
+        self.open = []
+        self.closed = bytearray(grid.size)
+        self.counter = 0  # Reset counter for each path generation call
+
+        start = grid.cell(self.head)
+        goal = grid.cell(self.food)
+        blocked = self.static_blocks(self.release_times())
+        # Paths never come back to the head, so it does not need to block the runs
+        blocked[start] = 0
+        g = [grid.size] * grid.size  # Any real path is shorter than the board size
+        origin = [None] * grid.size
+
+        h = self.heuristic(goal).tolist()
+        g[start] = 0
+        heapq.heappush(self.open, (h[start], 0, self.counter, start))
+        self.counter += 1
+
+        # Frontier sizes are only tracked for the search stats
+        track = self.search_stats is not None
+        max_frontier = 0
+
+        while self.open:
+            if track and len(self.open) > max_frontier:
+                max_frontier = len(self.open)
+            # Select jump point with the lowest f value, among equal ones the deepest
+            _f_value, _g, _count, current = heapq.heappop(self.open)
+
+            if self.closed[current]:
+                # Already processed this jump point via a shorter or equal path
+                continue
+            self.closed[current] = 1
+
+            if current == goal:
+                # Reconstruct path - backtrack from food to head, filling in the runs
+                cells = []
+                while current != start:
+                    parent = origin[current]
+                    if abs(current - parent) < cols:
+                        step = 1 if current > parent else -1
+                    else:
+                        step = cols if current > parent else -cols
+                    while current != parent:
+                        cells.append(current)
+                        current -= step
+                cells.reverse()
+                self.path = [grid.point(cell) for cell in cells]
+                break
+
+            # Directions worth following from here: all of them at the start, on and
+            # up or down after a vertical run, on and towards forced neighbors after a
+            # horizontal one
+            x = grid.xs[current]
+            parent = origin[current]
+            if parent is None:
+                horizontal, vertical = (-1, 1), (-1, 1)
+            elif grid.xs[parent] == x:
+                horizontal = (-1, 1)
+                vertical = (1 if current > parent else -1,)
+            else:
+                dx = 1 if current > parent else -1
+                horizontal = (dx,)
+                behind = current - dx
+                vertical = tuple(
+                    dy
+                    for dy, neighbor, side in (
+                        (-1, current - cols, behind - cols),
+                        (1, current + cols, behind + cols),
+                    )
+                    if 0 <= neighbor < grid.size
+                    and blocked[side]
+                    and not blocked[neighbor]
+                )
+
+            jump_points = [
+                self.jump_horizontal(current, dx, blocked, goal) for dx in horizontal
+            ] + [self.jump_vertical(current, dy, blocked, goal) for dy in vertical]
+            for jump_point in jump_points:
+                if jump_point is None or self.closed[jump_point]:
+                    continue
+                # Runs are straight, so their length is the Manhattan distance
+                jump_g = g[current] + grid.manhattan(current, jump_point)
+                if jump_g >= g[jump_point]:
+                    continue
+
+                g[jump_point] = jump_g
+                origin[jump_point] = current
+                jump_f = jump_g + h[jump_point]
+                heapq.heappush(self.open, (jump_f, -jump_g, self.counter, jump_point))
+                self.counter += 1
+
+        if track:
+            self.search_counts = (self.closed.count(1), self.counter, max_frontier)
+
+        # If no path was found, self.path remains [] as initialized.
+        # In safe_paths mode, paths that would trap the snake are replaced by a survival move.
+        self.secure_path()
+
+    def main(self):
+        """Executes multi-step traversal along the Jump Point Search path."""
+        return self.multi_step_traversal()
@@ -3,12 +3,17 @@ from snake.main.game import Game
 
 
 class SteepestAscentHillClimbing(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    # Greedy moves get stuck behind obstacles with the Manhattan distance, so the
+    # obstacle-aware distances are used by default
+    distance_heuristic = True
+
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
 
     def calculate_h(self, point):
-        """Calculates heuristic i.e. the Manhattan distance between selected node and goal state"""
-        return abs(self.food.x - point.x) + abs(self.food.y - point.y)
+        """Calculates heuristic i.e. the distance between selected node and goal state (see Game.heuristic)"""
+        field = self.heuristic(self.grid.cell(self.food))
+        return int(field[self.grid.cell(point)])
 
     def generate_path(self):
         """Selects a direction for the snake to move using Steepest Ascent Hill Climbing (selection of best neighbor) algorithm"""
@@ -19,14 +24,13 @@ class SteepestAscentHillClimbing(Game):
         for direction in directions:
             neighbor = self.get_next_head(direction)
             if not self.detect_random_point_collision(neighbor):
-                neighbor.h = self.calculate_h(neighbor)
-                neighbors.append((neighbor, direction))
+                neighbors.append((self.calculate_h(neighbor), direction))
 
         if neighbors:
             # Climb the hill if best neighbor is better than current state
             current_h = self.calculate_h(self.head)
-            best_neighbor, best_direction = min(neighbors, key=lambda x: x[0].h)
-            if best_neighbor.h < current_h:
+            best_h, best_direction = min(neighbors, key=lambda x: x[0])
+            if best_h < current_h:
                 return best_direction
         return None
 
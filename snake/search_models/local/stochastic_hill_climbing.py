@@ -1,16 +1,19 @@
-import random
-
 from snake.configs.directions import Direction
 from snake.main.game import Game
 
 
 class StochasticHillClimbing(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    # Greedy moves get stuck behind obstacles with the Manhattan distance, so the
+    # obstacle-aware distances are used by default
+    distance_heuristic = True
+
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
 
     def calculate_h(self, point):
-        """Calculates heuristic i.e. the Manhattan distance between selected node and goal state"""
-        return abs(self.food.x - point.x) + abs(self.food.y - point.y)
+        """Calculates heuristic i.e. the distance between selected node and goal state (see Game.heuristic)"""
+        field = self.heuristic(self.grid.cell(self.food))
+        return int(field[self.grid.cell(point)])
 
     def generate_path(self):
         """Selects a direction for the snake to move using Stochastic Hill Climbing (random selection of a better neighbor) algorithm"""
@@ -19,7 +22,7 @@ class StochasticHillClimbing(Game):
 
         while directions:
             # Generate valid neighbor
-            direction = random.choice(directions)
+            direction = self.rng.choice(directions)
             neighbor = self.get_next_head(direction)
             if self.detect_random_point_collision(neighbor):
                 directions.remove(direction)
@@ -7,8 +7,8 @@ from snake.main.game import Game
 
 
 class Manual(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
 
     def generate_path(self):
         """Handles user input to change the direction of the snake"""
@@ -31,38 +31,37 @@ class Manual(Game):
                 elif event.key == pygame.K_DOWN and self.direction != Direction.UP:
                     self.direction = Direction.DOWN
 
+    def update_ui(self, speed=FIXED_AUTO_SPEED):
+        """
+        Like Game.update_ui, but always paced at the given speed: the renderer's
+        simulation speed (e.g. left over from an AI game) does not apply to a human.
+        """
+        if self.renderer is None:
+            return
+        clock = self.renderer.clock
+        sim_speed, clock.sim_speed = clock.sim_speed, 1
+        try:
+            self.renderer.advance(self, speed)
+        finally:
+            clock.sim_speed = sim_speed
+
     def main(self):
         while True:
+            # Games that filled the board have no food left
+            if self.won:
+                return self.score
+
             user_action = self.generate_path()  # Update direction based on user input
             if user_action == actions.ACTION_QUIT_GAME:
                 return self.score  # Exit game loop, return score
             elif user_action == actions.ACTION_PAUSE_GAME:
                 return actions.ACTION_PAUSE_GAME  # Signal AppController to pause
 
-            temp_head = self.get_next_head(self.direction)
-
-            # Disallow movement of snake in the direction opposite to its current direction
-            if len(self.snake) > 1 and temp_head == self.snake[1]:
-                self.head = self.get_next_head(self.direction)
-            else:
-                self.head = temp_head
-
-            # Move snake
-            self.snake.insert(0, self.head)
-            # Check if snake has hit something
-            if self.detect_collision():
+            # Move snake and check if it has hit something
+            if not self.step(self.direction):
                 return self.score
 
-            # Check if snake has reached the food
-            if self.head == self.food:
-                self.score += 1
-                self.generate_food()
-            else:
-                # Remove the last element from the snake's body as we have added a new head
-                self.snake.pop()
-
             # Update UI and Clock
             speed = INITIAL_SPEED + (self.score // SPEED_THRESHOLD) * SPEEDUP
             speed = min(speed, FIXED_AUTO_SPEED)
-            self.update_ui()
-            self.clock.tick(speed)
+            self.update_ui(speed)
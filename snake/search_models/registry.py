@@ -0,0 +1,34 @@
+from snake.configs import actions
+from snake.search_models.informed.a_star_search import AStar
+from snake.search_models.informed.best_first_search import BestFS
+from snake.search_models.informed.bidirectional_a_star_search import (
+    BidirectionalAStar,
+)
+from snake.search_models.informed.jump_point_search import JumpPointSearch
+from snake.search_models.local.simple_hill_climbing import HillClimbing
+from snake.search_models.local.steepest_ascent_hill_climbing import (
+    SteepestAscentHillClimbing,
+)
+from snake.search_models.local.stochastic_hill_climbing import StochasticHillClimbing
+from snake.search_models.uninformed.bidirectional_bfs import BidirectionalBFS
+from snake.search_models.uninformed.breadth_first_search import BFS
+from snake.search_models.uninformed.depth_first_search import DFS
+from snake.search_models.uninformed.hamiltonian_cycle import HamiltonianCycle
+from snake.search_models.uninformed.random_search import Random
+
+# Game classes of every mode where an algorithm controls the snake.
+# Kept free of pygame so headless tools (e.g. snake.bench) can use it.
+ALGORITHMS = {
+    actions.MODE_ASTAR: AStar,
+    actions.MODE_BEST_FS: BestFS,
+    actions.MODE_BFS: BFS,
+    actions.MODE_BIDIRECTIONAL_ASTAR: BidirectionalAStar,
+    actions.MODE_BIDIRECTIONAL_BFS: BidirectionalBFS,
+    actions.MODE_DFS: DFS,
+    actions.MODE_SIMPLE_HILL_CLIMBING: HillClimbing,
+    actions.MODE_STEEPEST_ASCENT_HILL_CLIMBING: SteepestAscentHillClimbing,
+    actions.MODE_STOCHASTIC_HILL_CLIMBING: StochasticHillClimbing,
+    actions.MODE_RANDOM: Random,
+    actions.MODE_HAMILTONIAN_CYCLE: HamiltonianCycle,
+    actions.MODE_JUMP_POINT_SEARCH: JumpPointSearch,
+}
@@ -0,0 +1,122 @@
+from snake.main.game import Game
+
+
+class BidirectionalBFS(Game):
+    """
+    Breadth First Search from the head and from the food at the same time, one whole
+    level of the smaller frontier after the other, until the two searches meet.
+    Each search only explores about half as deep as BFS does, which is far fewer cells
+    when the food is far away.
+
+    The forward search knows how many moves it takes to reach a cell, so it passes
+    through the body like BFS does (see Game.release_times). The backward search does
+    not, so it avoids every cell that Game.static_blocks marks. When the backward
+    search is walled in, the forward one goes on alone, so a path is found whenever
+    BFS finds one; it may be longer than BFS's if all the shortest paths run through
+    body cells near the food.
+    """
+
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
+        # Cells expanded by the search from the head and by the one from the food
+        self.closed = bytearray()
+        self.closed_backward = bytearray()
+
+        # Calculate initial path
+        self.plan()
+
+    def generate_path(self):
+        """Implements Bidirectional Breadth First Search for snake traversal"""
+        grid = self.grid
+        self.path = []
+        self.closed = closed = bytearray(grid.size)
+        self.closed_backward = closed_backward = bytearray(grid.size)
+
+        free_at = self.release_times()
+        blocked = self.static_blocks(free_at)
+        # Moves from the head to each cell and from each cell to the food (-1 while
+        # undiscovered), the cell each cell was reached from and the cell it leads to
+        depth = [-1] * grid.size
+        back_depth = [-1] * grid.size
+        origin = [None] * grid.size
+        successor = [None] * grid.size
+
+        start = grid.cell(self.head)
+        goal = grid.cell(self.food)
+        depth[start] = 0
+        back_depth[goal] = 0
+        frontier = [start]
+        back_frontier = [goal]
+
+        # Cell where the shortest path found so far meets, and that path's length
+        meet = start if start == goal else None
+        best = 0 if meet is not None else grid.size
+
+        # Frontier sizes are only tracked for the search stats
+        track = self.search_stats is not None
+        pushed = len(frontier) + len(back_frontier)
+        max_frontier = 0
+
+        while frontier and meet is None:
+            if track and len(frontier) + len(back_frontier) > max_frontier:
+                max_frontier = len(frontier) + len(back_frontier)
+
+            next_level = []
+            # Grow the smaller frontier by a whole level, so every meeting found in
+            # that level is compared and the shortest path through them is kept
+            if back_frontier and len(back_frontier) < len(frontier):
+                for current in back_frontier:
+                    closed_backward[current] = 1
+                    neighbor_depth = back_depth[current] + 1
+                    for neighbor in grid.neighbors[current]:
+                        if back_depth[neighbor] >= 0 or blocked[neighbor]:
+                            continue
+
+                        back_depth[neighbor] = neighbor_depth
+                        successor[neighbor] = current
+                        next_level.append(neighbor)
+                        # The head reaches the neighbor in time, and the rest of the
+                        # way to the food is free whenever it gets there
+                        if 0 <= depth[neighbor] < best - neighbor_depth:
+                            meet, best = neighbor, depth[neighbor] + neighbor_depth
+                back_frontier = next_level
+            else:
+                for current in frontier:
+                    closed[current] = 1
+                    neighbor_depth = depth[current] + 1
+                    for neighbor in grid.neighbors[current]:
+                        # Already visited or waiting to be visited, or an obstacle
+                        # or snake body collision
+                        if depth[neighbor] >= 0 or neighbor_depth < free_at[neighbor]:
+                            continue
+
+                        depth[neighbor] = neighbor_depth
+                        origin[neighbor] = current
+                        next_level.append(neighbor)
+                        if 0 <= back_depth[neighbor] < best - neighbor_depth:
+                            meet, best = neighbor, neighbor_depth + back_depth[neighbor]
+                frontier = next_level
+            pushed += len(next_level)
+
+        if meet is not None:
+            # Backtrack from the meeting cell to the head, then follow it on to the food
+            path = grid.trace_path(origin, start, meet)
+            cell = meet
+            while cell != goal:
+                cell = successor[cell]
+                path.append(grid.point(cell))
+            self.path = path
+
+        if track:
+            self.search_counts = (
+                closed.count(1) + closed_backward.count(1),
+                pushed,
+                max_frontier,
+            )
+
+        # If no path was found, self.path remains [] as initialized.
+        # In safe_paths mode, paths that would trap the snake are replaced by a survival move.
+        self.secure_path()
+
+    def main(self):
+        return self.multi_step_traversal()
@@ -4,69 +4,75 @@ from snake.main.game import Game
 
 
 class BFS(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
         self.open = deque()
-        self.closed = set()
+        self.closed = bytearray()
 
         # Calculate initial path
-        self.generate_path()
+        self.plan()
 
     def generate_path(self):
         """Implements Breadth First Search algorithm for snake traversal"""
+        grid = self.grid
         self.path = []
-        self.closed = set()
+        self.closed = bytearray(grid.size)
         self.open = deque()
 
-        if self.head:
-            self.head.origin = None  # Ensure origin is None for the head
-            self.open.append(self.head)
+        # First move at which each cell may be entered, the cell each cell was
+        # reached from and the number of moves needed to get there
+        free_at = self.release_times()
+        origin = [None] * grid.size
+        depth = [0] * grid.size
+        # Cells are marked when they are added to the queue, so none is added twice
+        discovered = bytearray(grid.size)
+
+        start = grid.cell(self.head)
+        goal = grid.cell(self.food)
+        discovered[start] = 1
+        self.open.append(start)
+
+        # Frontier sizes are only tracked for the search stats
+        track = self.search_stats is not None
+        max_frontier = 0
 
         while self.open:
+            if track and len(self.open) > max_frontier:
+                max_frontier = len(self.open)
             # Pop first entry from the open queue
             current = self.open.popleft()
 
-            if (
-                current in self.closed
-            ):  # Should not happen if we check before adding to open
-                continue
-            self.closed.add(current)
-
-            is_current_node_food = current == self.food
-
-            # Simulate moving the snake to current position for collision checks
-            current_simulated_snake = deque(
-                self.snake
-            )  # Start with actual game snake state
-            current_simulated_snake.appendleft(current)  # Assume head moves to current
-            if not is_current_node_food:
-                if len(current_simulated_snake) > 1:  # Snake grows if food is eaten
-                    current_simulated_snake.pop()  # Tail moves forward only if not eating
+            self.closed[current] = 1
 
             # Check if snake has reached the goal state (food)
-            if is_current_node_food:
-                # Reconstruct path
-                while current.origin:  # Backtrack from food to head
-                    self.path.append(current)
-                    current = current.origin
-                self.path.reverse()
-                return
+            if current == goal:
+                # Reconstruct path - backtrack from food to head
+                self.path = grid.trace_path(origin, start, current)
+                break
 
             # Explore neighbors of the selected node
-            current.generate_neighbors()
-            for neighbor in current.neighbors:
-                if (
-                    neighbor in self.closed  # Already visited
-                    or neighbor in self.obstacles  # Obstacle
-                    or neighbor in current_simulated_snake  # Snake body collision
-                    or neighbor in self.open  # Already in queue to be visited
-                ):
+            neighbor_depth = depth[current] + 1
+            for neighbor in grid.neighbors[current]:
+                # Already visited or waiting to be visited, or an obstacle or snake
+                # body collision
+                if discovered[neighbor] or neighbor_depth < free_at[neighbor]:
                     continue
 
-                neighbor.origin = current
+                discovered[neighbor] = 1
+                origin[neighbor] = current
+                depth[neighbor] = neighbor_depth
                 self.open.append(neighbor)
 
-        # If the loop finishes, no path was found, self.path remains [] as initialized.
+        if track:
+            self.search_counts = (
+                self.closed.count(1),
+                discovered.count(1),
+                max_frontier,
+            )
+
+        # If no path was found, self.path remains [] as initialized.
+        # In safe_paths mode, paths that would trap the snake are replaced by a survival move.
+        self.secure_path()
 
     def main(self):
         return self.multi_step_traversal()
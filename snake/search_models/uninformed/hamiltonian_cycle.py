@@ -1,32 +1,36 @@
 from collections import deque
+from functools import lru_cache
 
-from snake.main.game import Game
-from snake.configs.game import BLOCK_SIZE, WIDTH, HEIGHT
 from snake.configs.directions import Direction
-from snake.main.point import Point
-
-
-class HamiltonianCycle(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
-        self.grid_width = WIDTH // BLOCK_SIZE
-        self.grid_height = HEIGHT // BLOCK_SIZE
-        self.cycle = []
-        self.current_cycle_index = 0
-        self.detour_path = []
-        self.target_cycle_index = 0
-        self.is_avoiding_obstacle = False
+from snake.main.game import Game
 
-        # Generate the Hamiltonian cycle
-        self.generate_hamiltonian_cycle()
 
-        # Find starting position in cycle
-        self.find_starting_position()
-
-    def generate_hamiltonian_cycle(self):
+class CycleTables:
+    """
+    A Hamiltonian cycle of a cols x rows board, as grid cell indices (y * cols + x).
+    cells[i] is the i-th cell along the cycle and positions[cell] is the inverse, so
+    finding a cell on the cycle, the cell after it and the distance between two cells
+    along the cycle are all constant-time lookups.
+    The tables never change, so all games on a board share them (see cycle_tables).
+    """
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.cells = tuple(self.generate(cols, rows))
+        self.size = len(self.cells)
+        positions = [0] * self.size
+        for position, cell in enumerate(self.cells):
+            positions[cell] = position
+        self.positions = tuple(positions)
+
+    @staticmethod
+    def generate(cols, rows):
         """
         Generates a valid Hamiltonian cycle for a rectangular grid.
-        The construction works for any grid that is at least 2×2.
+        The construction works for any grid that is at least 2×2 and has an even
+        number of rows; grids with an odd number of rows are walked column by column
+        instead. Grids with an odd number of both have no Hamiltonian cycle at all.
 
         The idea is to:
         1.  Start at the top-left corner (0, 0).
@@ -34,155 +38,195 @@ class HamiltonianCycle(Game):
         3.  Finally, travel straight up the first column back towards the start.
 
         """
-        # Reset any existing cycle
-        self.cycle = []
+        width = cols
+        transposed = rows % 2 == 1
+        if transposed:
+            if cols % 2 == 1:
+                raise ValueError(
+                    f"A {cols}x{rows} board has no Hamiltonian cycle: "
+                    "one of its sides must have an even number of cells"
+                )
+            cols, rows = rows, cols
+
         # (0) Start position
-        self.cycle.append(Point(0, 0))
+        cells = [(0, 0)]
 
         # (1) Traverse every row while leaving column 0 for the end
-        for row in range(self.grid_height):
-            y = row * BLOCK_SIZE
-
+        for row in range(rows):
             if row % 2 == 0:
                 # Even row → move from left to right starting from col 1
-                start_col, end_col, step = 1, self.grid_width, 1
+                start_col, end_col, step = 1, cols, 1
             else:
                 # Odd row → move from right to left ending at col 1
-                start_col, end_col, step = self.grid_width - 1, 0, -1
+                start_col, end_col, step = cols - 1, 0, -1
 
             for col in range(start_col, end_col, step):
-                x = col * BLOCK_SIZE
-                self.cycle.append(Point(x, y))
+                cells.append((col, row))
 
         # (2) We are now at (1, last_row).
         # Move to the last cell (0, last_row).
-        last_row_y = (self.grid_height - 1) * BLOCK_SIZE
-        self.cycle.append(Point(0, last_row_y))
+        cells.append((0, rows - 1))
 
-        # (3) Move straight up column 0, visiting the remaining cells
-        for row in range(self.grid_height - 2, -1, -1):
-            y = row * BLOCK_SIZE
-            self.cycle.append(Point(0, y))
+        # (3) Move straight up column 0, visiting the remaining cells (the start
+        # cell is already in the cycle)
+        for row in range(rows - 2, 0, -1):
+            cells.append((0, row))
 
-    def find_starting_position(self):
-        """Find the current head position in the cycle and set the index."""
-        for i, point in enumerate(self.cycle):
-            if point == self.head:
-                self.current_cycle_index = i
-                return
-
-    def get_next_cycle_position(self):
-        """Get the next position in the Hamiltonian cycle."""
-        next_index = (self.current_cycle_index + 1) % len(self.cycle)
-        return self.cycle[next_index]
-
-    def get_direction_to_point(self, target_point):
-        """Calculate the direction needed to move from current head to target point."""
-        dx = target_point.x - self.head.x
-        dy = target_point.y - self.head.y
-
-        if dx > 0:
-            return Direction.RIGHT
-        elif dx < 0:
-            return Direction.LEFT
-        elif dy > 0:
-            return Direction.DOWN
-        elif dy < 0:
-            return Direction.UP
-        else:
-            return None  # Already at target
-
-    def is_position_safe(self, position):
-        """Check if a position is safe (not colliding with snake body or obstacles)."""
-        # Check boundaries
-        if (
-            position.x < 0
-            or position.x >= self.width
-            or position.y < 0
-            or position.y >= self.height
-        ):
-            return False
-
-        # Check snake body collision (excluding tail since it will move)
-        if position in self.snake[:-1]:
-            return False
-
-        # Check obstacles
-        if position in self.obstacles:
-            return False
-
-        return True
-
-    def find_path_to_cycle(
-        self, start_pos, target_cycle_indices, max_search_distance=10
-    ):
-        """
-        Use BFS to find a path from start_pos to any position in the cycle.
-        Returns (path, target_cycle_index) or (None, None) if no path found.
-        """
-        queue = deque([(start_pos, [])])
-        visited = {start_pos}
+        # Mirroring the cycle along the diagonal keeps every step between neighbors
+        if transposed:
+            cells = [(row, col) for col, row in cells]
+        return [row * width + col for col, row in cells]
 
-        directions = [
-            (0, -BLOCK_SIZE, Direction.UP),
-            (0, BLOCK_SIZE, Direction.DOWN),
-            (-BLOCK_SIZE, 0, Direction.LEFT),
-            (BLOCK_SIZE, 0, Direction.RIGHT),
-        ]
+    def next_cell(self, cell):
+        """The cell that follows the given one on the cycle."""
+        return self.cells[(self.positions[cell] + 1) % self.size]
 
-        while queue:
-            current_pos, path = queue.popleft()
+    def distance(self, start, end):
+        """Moves needed to get from start to end by following the cycle."""
+        return (self.positions[end] - self.positions[start]) % self.size
+
+
+@lru_cache(maxsize=8)
+def cycle_tables(cols, rows):
+    """Returns the shared CycleTables of a board size."""
+    return CycleTables(cols, rows)
 
-            # Don't search too far
-            if len(path) > max_search_distance:
-                continue
 
-            # Check if we reached any target cycle position
-            for target_index in target_cycle_indices:
-                if current_pos == self.cycle[target_index]:
-                    return path, target_index
+class HamiltonianCycle(Game):
+    # Cycle positions tried for a detour in safe_paths mode before giving up
+    SAFE_DETOUR_ATTEMPTS = 8
+    # Longest detour (in moves) searched for to get back onto the cycle
+    MAX_DETOUR_LENGTH = 10
+
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
+        self.grid_width = self.grid.cols
+        self.grid_height = self.grid.rows
+        self.cycle = ()
+        self.current_cycle_index = 0
+        self.detour_path = deque()
+        self.target_cycle_index = 0
+        self.is_avoiding_obstacle = False
+        # Direction of a move by the difference between the cells it goes between
+        self.cell_directions = {
+            -self.grid_width: Direction.UP,
+            self.grid_width: Direction.DOWN,
+            -1: Direction.LEFT,
+            1: Direction.RIGHT,
+        }
+
+        # Generate the Hamiltonian cycle
+        self.generate_hamiltonian_cycle()
 
-            # Explore neighbors
-            for dx, dy, direction in directions:
-                next_pos = Point(current_pos.x + dx, current_pos.y + dy)
+        # Find starting position in cycle
+        self.find_starting_position()
 
-                if next_pos not in visited and self.is_position_safe(next_pos):
-                    visited.add(next_pos)
-                    new_path = path + [direction]
-                    queue.append((next_pos, new_path))
+    def generate_hamiltonian_cycle(self):
+        """Looks up the (shared) Hamiltonian cycle of the board, as cell indices."""
+        self.tables = cycle_tables(self.grid_width, self.grid_height)
+        self.cycle = self.tables.cells
 
-        return None, None
+    def find_starting_position(self):
+        """Find the current head position in the cycle and set the index."""
+        self.current_cycle_index = self.tables.positions[self.grid.cell(self.head)]
+
+    def is_cell_safe(self, cell, tail):
+        """
+        Checks if the head can move onto the given on-board cell: it is neither an
+        obstacle nor part of the snake's body, except for the tail (given as a cell),
+        which moves out of the way as the head moves in.
+        """
+        return self.occupancy[cell] == (cell == tail)
+
+    def detour_tree(self, max_search_distance):
+        """
+        Breadth-first search over the safe cells around the head, up to the given
+        number of moves away. Returns the cell each reached cell is entered from
+        (the head maps to None); every path it describes is a shortest one.
+        """
+        grid = self.grid
+        cols = grid.cols
+        tail = self.snake.tail
+        start = grid.cell(self.head)
+        origin = {start: None}
+        frontier = [start]
+        for _ in range(max_search_distance):
+            reached = []
+            for cell in frontier:
+                x, y = grid.xs[cell], grid.ys[cell]
+                # Up, down, left, right
+                for neighbor, on_board in (
+                    (cell - cols, y > 0),
+                    (cell + cols, y < grid.rows - 1),
+                    (cell - 1, x > 0),
+                    (cell + 1, x < cols - 1),
+                ):
+                    if (
+                        on_board
+                        and neighbor not in origin
+                        and self.is_cell_safe(neighbor, tail)
+                    ):
+                        origin[neighbor] = cell
+                        reached.append(neighbor)
+            frontier = reached
+        return origin
+
+    def detour_directions(self, origin, target):
+        """Returns the moves from the head to the target along the detour tree."""
+        directions = []
+        while origin[target] is not None:
+            directions.append(self.cell_directions[target - origin[target]])
+            target = origin[target]
+        directions.reverse()
+        return directions
+
+    def detour_traps_snake(self, directions):
+        """Checks if the detour (a list of directions) would leave the head unable to reach its tail."""
+        path = []
+        position = self.head
+        for direction in directions:
+            position = self.get_next_head(direction, position)
+            path.append(position)
+        return self.traps_snake(path)
 
     def find_detour_around_obstacle(self):
         """
         Find a detour around obstacles to rejoin the cycle.
         Returns True if detour found, False otherwise.
+        Targets are tried in cycle order, so the detour rejoins the cycle at the
+        first free cell ahead that can be reached within MAX_DETOUR_LENGTH moves.
+        In safe_paths mode, detours that would trap the snake are skipped in favour
+        of ones that rejoin the cycle further ahead.
         """
-        # Look ahead in the cycle to find accessible positions
-        potential_targets = []
         current_index = self.current_cycle_index
+        attempts = self.SAFE_DETOUR_ATTEMPTS if self.safe_paths else 1
+        tail = self.snake.tail
+        # Built on the first target that needs it
+        origin = None
 
-        # Find the first safe position on the cycle starting from current index
+        # Look ahead in the cycle for safe positions, starting from current index
         for i in range(1, len(self.cycle)):
             target_index = (current_index + i) % len(self.cycle)
-            target_pos = self.cycle[target_index]
+            target = self.cycle[target_index]
 
             # Make sure the target position is not blocked and not too close to snake body
-            if self.is_position_safe(target_pos):
-                potential_targets.append(target_index)
-                break
-
-        if not potential_targets:
-            return False
-
-        # Try to find a path to any of these targets
-        path, target_index = self.find_path_to_cycle(self.head, potential_targets)
+            if not self.is_cell_safe(target, tail):
+                continue
 
-        if path and target_index is not None:
-            self.detour_path = path
-            self.target_cycle_index = target_index
-            self.is_avoiding_obstacle = True
-            return True
+            # Try to find a path to this target
+            if origin is None:
+                origin = self.detour_tree(self.MAX_DETOUR_LENGTH)
+            if target in origin:
+                path = self.detour_directions(origin, target)
+                if not (self.safe_paths and self.detour_traps_snake(path)):
+                    self.detour_path = deque(path)
+                    self.target_cycle_index = target_index
+                    self.is_avoiding_obstacle = True
+                    return True
+
+            attempts -= 1
+            if not attempts:
+                break
 
         return False
 
@@ -192,11 +236,13 @@ class HamiltonianCycle(Game):
         """
         if not self.is_avoiding_obstacle:
             # Try to follow the normal cycle
-            next_position = self.get_next_cycle_position()
-            if self.is_position_safe(next_position):
-                direction = self.get_direction_to_point(next_position)
+            head = self.snake.head
+            next_index = (self.current_cycle_index + 1) % len(self.cycle)
+            next_cell = self.cycle[next_index]
+            if self.is_cell_safe(next_cell, self.snake.tail):
+                direction = self.cell_directions.get(next_cell - head)
                 if direction:
-                    self.current_cycle_index = (self.current_cycle_index + 1) % len(self.cycle)
+                    self.current_cycle_index = next_index
                     return direction
             # If the next cycle position is blocked, try to find a detour
             if self.find_detour_around_obstacle():
@@ -204,7 +250,7 @@ class HamiltonianCycle(Game):
 
         # If we're currently following a detour path
         if self.is_avoiding_obstacle and self.detour_path:
-            next_direction = self.detour_path.pop(0)
+            next_direction = self.detour_path.popleft()
 
             # If we've completed the detour path
             if not self.detour_path:
@@ -214,7 +260,15 @@ class HamiltonianCycle(Game):
 
             return next_direction
 
-        # No safe move found
+        # No safe move found: in safe_paths mode, step wherever leaves the most room
+        # and pick up the cycle again from there (it covers every cell)
+        if self.safe_paths:
+            path = self.survival_path()
+            if path:
+                self.current_cycle_index = self.tables.positions[
+                    self.grid.cell(path[0])
+                ]
+                return path[0].direction_from(self.head)
         return None
 
     def generate_path(self):
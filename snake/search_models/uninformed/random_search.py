@@ -1,18 +1,16 @@
-import random
-
 from snake.configs.directions import Direction
 from snake.main.game import Game
 
 
 class Random(Game):
-    def __init__(self, game_has_obstacles):
-        super().__init__(game_has_obstacles)
+    def __init__(self, game_has_obstacles, **kwargs):
+        super().__init__(game_has_obstacles, **kwargs)
 
     def generate_path(self):
         """Randomly selects a direction for the snake to move"""
         directions = [Direction.LEFT, Direction.RIGHT, Direction.UP, Direction.DOWN]
         while directions:
-            direction = random.choice(directions)
+            direction = self.rng.choice(directions)
             random_point = self.get_next_head(direction)
             if self.detect_random_point_collision(random_point):
                 directions.remove(direction)
@@ -11,8 +11,9 @@ class ModeSelectionScreen:
         self.title_text = "Select Game Mode"
 
         self.button_width = game_configs.WIDTH // 2  # Make buttons wider
-        self.button_height = 40
-        self.button_spacing = 15  # Vertical spacing between buttons
+        # Small enough for all the mode buttons and the back button to fit on the screen
+        self.button_height = 32
+        self.button_spacing = 8  # Vertical spacing between buttons
         screen_center_x = self.display.get_width() // 2
 
         self.mode_buttons = []
@@ -34,9 +35,12 @@ class ModeSelectionScreen:
             ("Stochastic Hill Climbing", actions.MODE_STOCHASTIC_HILL_CLIMBING),
             ("Depth-First Search (DFS)", actions.MODE_DFS),
             ("Breadth-First Search (BFS)", actions.MODE_BFS),
+            ("Bidirectional BFS", actions.MODE_BIDIRECTIONAL_BFS),
             ("Hamiltonian Cycle", actions.MODE_HAMILTONIAN_CYCLE),
             ("Best-First Search", actions.MODE_BEST_FS),
             ("A* Search", actions.MODE_ASTAR),
+            ("Bidirectional A* Search", actions.MODE_BIDIRECTIONAL_ASTAR),
+            ("Jump Point Search", actions.MODE_JUMP_POINT_SEARCH),
         ]
 
         for text, action in game_modes_data:
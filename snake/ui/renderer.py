@@ -0,0 +1,199 @@
+import time
+
+import numpy as np
+import pygame
+
+from snake.configs import actions
+from snake.configs.colors import BLACK, BLUE, GREEN, RED, WHITE
+from snake.configs.game import BLOCK_SIZE, FPS
+from snake.main.game import OBSTACLE
+from snake.main.pacing import MoveClock
+
+# Simulation speed multipliers the + and - keys step through (None is unlimited)
+SIM_SPEEDS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, None)
+
+
+class GameRenderer:
+    """
+    Pygame observer for a running game.
+    The game core never touches pygame itself; it only calls into this
+    renderer (when one is attached) to pump events, draw frames and pace the loop.
+
+    Frames are drawn incrementally: the renderer keeps the occupancy, head and food it
+    last drew, and only the cells that differ from them (plus the old and new head
+    and food) and the score are redrawn and pushed to the screen, however many moves
+    were made in between. Anything else (a new game, a replaced snake or obstacles,
+    or invalidate()) redraws everything.
+
+    The loop is paced with a fixed timestep (see MoveClock): the game moves at its base
+    speed times sim_speed, while frames are drawn at most FPS times per second, so
+    fast simulations skip the frames in between. sim_speed=None runs the game as fast
+    as it can plan. While a game runs, + and - step through SIM_SPEEDS.
+    """
+
+    def __init__(self, display_surface, sim_speed=1):
+        self.display = display_surface
+        self.font = pygame.font.SysFont("arial", 25)
+        pygame.display.set_caption("Snake Game")
+        self.clock = MoveClock(sim_speed)
+        self.next_frame = 0.0
+        self.score = None
+        self.score_text = None
+        self.score_rect = pygame.Rect(0, 0, 0, 0)
+        # Cell size of the board being drawn
+        self.block_size = BLOCK_SIZE
+        # What the screen shows: (game, snake, obstacles, occupancy, head, food)
+        self.frame = None
+
+    def invalidate(self):
+        """Makes the next draw a full redraw, e.g. after something else drew over the display."""
+        self.frame = None
+
+    def poll_events(self):
+        """
+        Drains the pygame event queue.
+        Returns ACTION_QUIT_GAME or ACTION_PAUSE_GAME if the user asked for it, otherwise None.
+        """
+        for event in pygame.event.get():
+            # Quit event
+            if event.type == pygame.QUIT:
+                return actions.ACTION_QUIT_GAME
+            # ESC key event - signal pause
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE or event.key == pygame.KSCAN_ESCAPE:
+                    return actions.ACTION_PAUSE_GAME
+                # Simulation speed
+                if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    self.change_sim_speed(1)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self.change_sim_speed(-1)
+        return None
+
+    def change_sim_speed(self, steps):
+        """Moves the simulation speed the given number of steps along SIM_SPEEDS."""
+        if self.clock.sim_speed in SIM_SPEEDS:
+            index = SIM_SPEEDS.index(self.clock.sim_speed)
+        else:
+            index = SIM_SPEEDS.index(1)
+        index = max(0, min(index + steps, len(SIM_SPEEDS) - 1))
+        self.clock.sim_speed = SIM_SPEEDS[index]
+
+    def plot(self, point, color):
+        """Plots the point with given color, one cell of the current board in size."""
+        block = self.block_size
+        pygame.draw.rect(
+            self.display, color, pygame.Rect(point.x, point.y, block, block)
+        )
+
+    def render_score(self, score):
+        """Returns the rendered score text, which is only re-rendered when the score changes."""
+        if score != self.score:
+            self.score = score
+            self.score_text = self.font.render(f"Score: {score}", True, WHITE)
+        return self.score_text
+
+    def color_at(self, game, point):
+        """Returns the color of the given cell in the current state of the game."""
+        if point == game.head:
+            return WHITE
+        if point == game.food:
+            return BLUE
+        occupancy = game.occupancy[game.grid.cell(point)]
+        if occupancy & OBSTACLE:
+            return RED
+        return GREEN if occupancy else BLACK
+
+    def draw(self, game):
+        """
+        Plots the following entities of the given game on the display window:
+        - The snake's body
+        - The snake's head
+        - Obstacles
+        - Food source
+        - Current score
+        """
+        self.block_size = game.grid.block_size
+        frame = self.frame
+        if (
+            frame is None
+            or frame[0] is not game
+            or frame[1] is not game.snake
+            or frame[2] is not game.obstacles
+        ):
+            self.draw_all(game)
+        else:
+            self.draw_changes(game, frame)
+        self.frame = (
+            game,
+            game.snake,
+            game.obstacles,
+            bytes(game.occupancy),
+            game.head,
+            game.food,
+        )
+
+    def draw_all(self, game):
+        """Redraws the whole board and pushes it to the screen."""
+        self.display.fill(BLACK)
+        for point in game.snake:
+            self.plot(point, GREEN)
+        self.plot(game.head, WHITE)
+        for point in game.obstacles:
+            self.plot(point, RED)
+        # A won game has no food left
+        if game.food is not None:
+            self.plot(game.food, BLUE)
+        text = self.render_score(game.score)
+        self.score_rect = self.display.blit(text, [0, 0])
+        pygame.display.flip()
+
+    def draw_changes(self, game, frame):
+        """Redraws the cells that changed since the given frame and pushes just those."""
+        _game, _snake, _obstacles, occupancy, head, food = frame
+        grid = game.grid
+        block = self.block_size
+        changed = np.flatnonzero(
+            np.frombuffer(occupancy, dtype=np.uint8)
+            != np.frombuffer(game.occupancy, dtype=np.uint8)
+        )
+        points = {grid.point(cell) for cell in changed.tolist()}
+        dirty = []
+        for point in (points | {head, food, game.head, game.food}) - {None}:
+            self.plot(point, self.color_at(game, point))
+            dirty.append(pygame.Rect(point.x, point.y, block, block))
+
+        # The score is drawn over the board: redraw it (and the cells under it) when it
+        # changed or when one of the cells under it was just drawn over it
+        if game.score != self.score or self.score_rect.collidelist(dirty) != -1:
+            text = self.render_score(game.score)
+            covered = self.score_rect.union(text.get_rect())
+            self.plot_cells(game, covered)
+            self.score_rect = self.display.blit(text, [0, 0])
+            dirty.append(covered)
+        pygame.display.update(dirty)
+
+    def plot_cells(self, game, rect):
+        """Redraws every cell that overlaps the given rectangle."""
+        grid = game.grid
+        block = grid.block_size
+        right = min(-(-rect.right // block), grid.cols)
+        bottom = min(-(-rect.bottom // block), grid.rows)
+        for y in range(rect.top // block, bottom):
+            for x in range(rect.left // block, right):
+                point = grid.point(y * grid.cols + x)
+                self.plot(point, self.color_at(game, point))
+
+    def advance(self, game, speed):
+        """
+        Called after every move of the game: draws a frame if one is due (at most FPS
+        per second) and paces the loop to speed * sim_speed moves per second.
+        """
+        now = time.perf_counter()
+        if now >= self.next_frame:
+            self.draw(game)
+            self.next_frame = max(self.next_frame + 1 / FPS, now)
+        self.clock.wait(speed)
+
+    def time_left(self):
+        """Seconds until the next move of the game is due, or None if moves are not paced."""
+        return self.clock.time_left()
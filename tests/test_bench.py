@@ -0,0 +1,201 @@
+import contextlib
+import io
+import json
+import os
+import pstats
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from snake.bench.__main__ import main, parse_args, run_options
+from snake.bench.profiling import profile_game
+from snake.bench.runner import (
+    ALGORITHM_NAMES,
+    percentile,
+    run_benchmark,
+    run_game,
+)
+from snake.bench.scaling import format_chart, run_scaling
+from snake.bench.tournament import build_jobs, run_tournament
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+
+    def test_all_algorithms_are_named(self):
+        for name in [
+            "astar",
+            "bfs",
+            "dfs",
+            "best_fs",
+            "bidirectional_astar",
+            "bidirectional_bfs",
+            "hamiltonian_cycle",
+            "jump_point_search",
+            "random",
+        ]:
+            self.assertIn(name, ALGORITHM_NAMES)
+
+    def test_run_game_is_reproducible(self):
+        first = run_game("astar", seed=7, obstacles=True)
+        second = run_game("astar", seed=7, obstacles=True)
+
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.moves, second.moves)
+        self.assertEqual(len(first.plan_times), len(second.plan_times))
+
+    def test_run_game_respects_move_limit(self):
+        result = run_game("hamiltonian_cycle", seed=0, max_moves=50)
+        self.assertEqual(result.moves, 50)
+
+    def test_run_benchmark_summaries(self):
+        summaries, results = run_benchmark(["bfs", "random"], games=2, max_moves=200)
+
+        self.assertEqual([s["algorithm"] for s in summaries], ["bfs", "random"])
+        self.assertEqual(len(results), 4)
+        for summary in summaries:
+            self.assertEqual(summary["games"], 2)
+            self.assertGreater(summary["plan_calls"], 0)
+            self.assertIsNotNone(summary["plan_ms_p99"])
+            self.assertIsNotNone(summary["peak_memory_kib"])
+
+    def test_summaries_report_search_counters(self):
+        summaries, _results = run_benchmark(
+            ["bfs", "bidirectional_bfs"], games=1, max_moves=200, search_stats=True
+        )
+        bfs, bidirectional = summaries
+
+        self.assertGreater(bfs["expanded_per_plan"], bidirectional["expanded_per_plan"])
+        self.assertGreater(bidirectional["pushed_per_plan"], 0)
+
+        summaries, _results = run_benchmark(["bfs"], games=1, max_moves=50)
+        self.assertIsNone(summaries[0]["expanded_per_plan"])
+
+    def test_tournament_matches_sequential_games(self):
+        streamed = []
+        board, results = run_tournament(
+            ["astar", "random"],
+            games=3,
+            seed=5,
+            max_moves=300,
+            workers=2,
+            on_result=streamed.append,
+        )
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(len(streamed), 6)
+        self.assertEqual([summary["rank"] for summary in board], [1, 2])
+        for result in results:
+            expected = run_game(result.algorithm, result.seed, max_moves=300)
+            self.assertEqual(result.score, expected.score)
+            self.assertEqual(result.moves, expected.moves)
+
+    def test_build_jobs_interleaves_algorithms(self):
+        jobs = build_jobs(["astar", "bfs"], games=2, seed=10)
+        self.assertEqual(
+            [(algorithm, seed) for algorithm, seed, _obstacles, _max, _options in jobs],
+            [("astar", 10), ("bfs", 10), ("astar", 11), ("bfs", 11)],
+        )
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertIsNone(percentile([], 50))
+
+
+class TestProfiling(unittest.TestCase):
+
+    @patch("snake.bench.profiling.SAMPLE_DURATION", 0.2)
+    def test_profile_game_writes_pstats_and_collapsed_stacks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            report = profile_game(
+                "astar",
+                seed=0,
+                obstacles=False,
+                max_moves=300,
+                out_dir=directory,
+                top=5,
+            )
+
+            stats = pstats.Stats(os.path.join(directory, "astar.pstats"))
+            with open(os.path.join(directory, "astar.collapsed")) as file:
+                lines = file.read().splitlines()
+
+        self.assertGreater(stats.total_tt, 0)
+        self.assertIn("generate_path", report)
+        # Header, column titles and the top 5 functions
+        self.assertEqual(len(report.splitlines()), 7)
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("snake."))
+            self.assertGreater(int(count), 0)
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def test_zero_sim_speed_is_unlimited(self):
+        self.assertIsNone(run_options(parse_args(["--sim-speed", "0"]))["sim_speed"])
+        self.assertEqual(run_options(parse_args(["--sim-speed", "2"]))["sim_speed"], 2)
+
+
+class TestScaling(unittest.TestCase):
+
+    def test_run_scaling_covers_every_size(self):
+        rows, results, skipped = run_scaling(
+            ["astar", "bfs"], [8, 12], games=1, max_moves=200
+        )
+        self.assertEqual(skipped, [])
+        self.assertEqual(
+            [(result.size, result.algorithm) for result in results],
+            [(row["size"], row["algorithm"]) for row in rows],
+        )
+
+        self.assertEqual(
+            [(row["size"], row["algorithm"]) for row in rows],
+            [(8, "astar"), (8, "bfs"), (12, "astar"), (12, "bfs")],
+        )
+        self.assertTrue(all(row["peak_memory_kib"] > 0 for row in rows))
+
+        chart = format_chart(rows, "peak_memory_kib", "Peak memory", "KiB")
+        # Title and one bar per row
+        self.assertEqual(len(chart.splitlines()), 5)
+
+    def test_hamiltonian_cycle_is_skipped_on_odd_boards(self):
+        rows, _results, skipped = run_scaling(
+            ["hamiltonian_cycle", "astar"], [6, 5], games=1, max_moves=100
+        )
+
+        self.assertEqual(
+            [(row["size"], row["algorithm"]) for row in rows],
+            [(6, "hamiltonian_cycle"), (6, "astar"), (5, "astar")],
+        )
+        self.assertEqual(
+            [(size, name) for size, name, _ in skipped], [(5, "hamiltonian_cycle")]
+        )
+
+    def test_scaling_run_writes_every_game(self):
+        with tempfile.TemporaryDirectory() as directory:
+            stats_path = os.path.join(directory, "stats.jsonl")
+            json_path = os.path.join(directory, "results.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(
+                    ["-a", "astar", "-n", "2", "--max-moves", "100"]
+                    + ["--sizes", "6", "8", "--stats", stats_path, "--json", json_path]
+                )
+            with open(stats_path) as file:
+                records = [json.loads(line) for line in file]
+            with open(json_path) as file:
+                games = json.load(file)["games"]
+
+        expected = [(6, 0), (6, 1), (8, 0), (8, 1)]
+        self.assertEqual(
+            [(record["size"], record["seed"]) for record in records], expected
+        )
+        self.assertTrue(all(record["plans"] > 0 for record in records))
+        self.assertEqual([(game["size"], game["seed"]) for game in games], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
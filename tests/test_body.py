@@ -0,0 +1,57 @@
+import unittest
+
+from snake.configs.game import BLOCK_SIZE
+from snake.main.body import SnakeBody
+from snake.main.grid import Grid
+from snake.main.point import Point
+
+
+class TestSnakeBody(unittest.TestCase):
+
+    def setUp(self):
+        # 3x2 board: cells 0 1 2 / 3 4 5
+        self.grid = Grid(3 * BLOCK_SIZE, 2 * BLOCK_SIZE)
+
+    def test_reads_as_points_from_head_to_tail(self):
+        points = [Point(0, 0), Point(BLOCK_SIZE, 0), Point(BLOCK_SIZE, BLOCK_SIZE)]
+        body = SnakeBody(self.grid, points)
+
+        self.assertEqual(list(body), points)
+        self.assertEqual((body[0], body[-1]), (points[0], points[-1]))
+        self.assertEqual((body.head, body.tail), (0, 4))
+        self.assertEqual(body.cells().tolist(), [0, 1, 4])
+        with self.assertRaises(IndexError):
+            body[3]
+
+    def test_moves_wrap_around_the_buffer(self):
+        body = SnakeBody(self.grid, [Point(0, 0)])
+        # Walk around the board twice, growing on the first lap
+        cycle = [1, 2, 5, 4, 3, 0]
+        for move, cell in enumerate(cycle * 2):
+            body.push_head(cell)
+            if move >= 4:
+                body.pop_tail()
+
+        self.assertEqual(len(body), 5)
+        self.assertEqual(body.cells().tolist(), [0, 3, 4, 5, 2])
+        self.assertEqual(body[-1], Point(2 * BLOCK_SIZE, 0))
+
+    def test_cells_is_a_read_only_view(self):
+        body = SnakeBody(self.grid, [Point(0, 0)])
+        cells = body.cells()
+        body.push_head(1)
+
+        self.assertFalse(cells.flags.writeable)
+        self.assertFalse(cells.flags.owndata)
+        self.assertEqual(body.cells().tolist(), [1, 0])
+
+    def test_copy_is_independent(self):
+        body = SnakeBody(self.grid, [Point(0, 0)])
+        copy = body.copy()
+        body.push_head(1)
+
+        self.assertEqual(copy.cells().tolist(), [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from snake.configs.game import BLOCK_SIZE
+from snake.main.distances import CACHE_BUDGET, DistanceFields, distance_fields
+from snake.main.point import Point
+from snake.search_models.informed.a_star_search import AStar
+
+
+class TestDistanceFields(unittest.TestCase):
+
+    def test_open_board_is_manhattan(self):
+        fields = DistanceFields(4, 3, frozenset())
+        field = fields.field(5)  # (1, 1)
+
+        self.assertEqual(field[5], 0)
+        self.assertEqual(field[0], 2)
+        self.assertEqual(field[11], 3)  # (3, 2)
+
+    def test_distances_go_around_obstacles(self):
+        # . X .
+        # . X .
+        # . . .
+        fields = DistanceFields(3, 3, frozenset({1, 4}))
+        field = fields.field(0)
+
+        self.assertEqual(field[2], 6)
+        self.assertEqual(field[5], 5)
+        self.assertEqual(field[8], 4)
+
+    def test_walled_off_cells_are_unreachable(self):
+        # . X .
+        # X . .
+        fields = DistanceFields(3, 2, frozenset({1, 3}))
+        field = fields.field(5)
+
+        self.assertEqual(field[0], fields.unreachable)
+        self.assertEqual(field[2], 1)
+
+    def test_fields_are_cached_per_layout(self):
+        fields = distance_fields(8, 8, frozenset({3, 4}))
+
+        self.assertIs(fields, distance_fields(8, 8, frozenset({4, 3})))
+        self.assertIs(fields.field(10), fields.field(10))
+        self.assertFalse(fields.field(10).flags.writeable)
+
+    def test_cached_layouts_fit_in_budget(self):
+        # Boards this large only have room for a few layouts
+        layouts = [distance_fields(200, 200, frozenset({cell})) for cell in range(16)]
+
+        kept = CACHE_BUDGET // layouts[0].max_bytes
+        self.assertLess(kept, len(layouts))
+        for cell in range(16 - kept, 16):
+            self.assertIs(layouts[cell], distance_fields(200, 200, frozenset({cell})))
+        self.assertIsNot(layouts[0], distance_fields(200, 200, frozenset({0})))
+
+    def test_astar_expands_fewer_cells_with_distance_heuristic(self):
+        expanded = {}
+        for distance_heuristic in (False, True):
+            algo = AStar(
+                game_has_obstacles=False, distance_heuristic=distance_heuristic
+            )
+            algo.head = Point(0, 5 * BLOCK_SIZE)
+            algo.snake = [algo.head]
+            algo.food = Point(10 * BLOCK_SIZE, 5 * BLOCK_SIZE)
+            # Wall between head and food, open only at the top
+            algo.obstacles = [
+                Point(5 * BLOCK_SIZE, y * BLOCK_SIZE) for y in range(1, 12)
+            ]
+
+            algo.generate_path()
+            self.assertEqual(len(algo.path), 20)
+            expanded[distance_heuristic] = sum(algo.closed)
+
+        self.assertLess(expanded[True], expanded[False])
+        self.assertEqual(expanded[True], 21)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+
+import numpy as np
+
+from snake.configs.directions import Direction
+from snake.configs.game import BLOCK_SIZE, HEIGHT, WIDTH
+from snake.env.snake_env import (
+    ACTIONS,
+    BODY,
+    FOOD,
+    HEAD,
+    REWARD_DEATH,
+    REWARD_FOOD,
+    SnakeEnv,
+)
+from snake.env.vector_env import VectorSnakeEnv
+from snake.main.point import Point
+
+LEFT, RIGHT, UP, DOWN = (
+    ACTIONS.index(direction)
+    for direction in (Direction.LEFT, Direction.RIGHT, Direction.UP, Direction.DOWN)
+)
+
+
+class TestSnakeEnv(unittest.TestCase):
+
+    def test_reset_returns_observation_planes(self):
+        env = SnakeEnv(seed=1)
+        observation = env.reset()
+
+        self.assertEqual(
+            observation.shape, (4, HEIGHT // BLOCK_SIZE, WIDTH // BLOCK_SIZE)
+        )
+        self.assertEqual(observation[HEAD].sum(), 1)
+        self.assertEqual(observation[FOOD].sum(), 1)
+        self.assertEqual(observation[BODY].sum(), 1)
+
+    def test_seeded_resets_are_reproducible(self):
+        env = SnakeEnv(game_has_obstacles=True)
+        first = env.reset(seed=7)
+        second = env.reset(seed=7)
+        self.assertTrue((first == second).all())
+
+    def test_step_rewards_food_and_death(self):
+        env = SnakeEnv()
+        env.reset()
+        env.game.head = Point(0, 0)
+        env.game.snake = [env.game.head]
+        env.game.food = Point(BLOCK_SIZE, 0)
+
+        _observation, reward, done, info = env.step(RIGHT)
+        self.assertEqual((reward, done, info["score"]), (REWARD_FOOD, False, 1))
+
+        _observation, reward, done, _info = env.step(UP)
+        self.assertEqual((reward, done), (REWARD_DEATH, True))
+
+    def test_move_limit_truncates(self):
+        env = SnakeEnv(max_moves=1)
+        env.reset(seed=0)
+        _observation, reward, done, info = env.step(UP)
+        self.assertEqual((reward, done, info["truncated"]), (0.0, True, True))
+
+
+class TestVectorSnakeEnv(unittest.TestCase):
+
+    def test_observations_are_batched(self):
+        env = VectorSnakeEnv(8, game_has_obstacles=True, seed=0)
+        observations = env.reset()
+
+        self.assertEqual(observations.shape, (8, 4, env.rows, env.cols))
+        self.assertTrue((observations[:, HEAD].sum(axis=(1, 2)) == 1).all())
+
+    def test_snake_grows_and_follows_its_tail(self):
+        env = VectorSnakeEnv(1, seed=0, cols=4, rows=4)
+        env.reset()
+        self.assertEqual(env.head[0], 10)
+
+        # Feed the snake three times in a row: 10 -> 11 -> 7 -> 6
+        for action, food in ((RIGHT, 11), (UP, 7), (LEFT, 6)):
+            env.food[0] = food
+            _observations, rewards, dones, _info = env.step([action])
+            self.assertEqual((rewards[0], dones[0]), (REWARD_FOOD, False))
+        self.assertEqual(env.length[0], 4)
+
+        # Then chase the tail around the 2x2 square it covers
+        env.food[0] = 0
+        for action in (DOWN, RIGHT, UP, LEFT, DOWN):
+            _observations, rewards, dones, _info = env.step([action])
+            self.assertEqual((rewards[0], dones[0]), (0.0, False))
+        self.assertEqual(sorted(np.flatnonzero(env.lifetime[0])), [6, 7, 10, 11])
+
+    def test_collisions_end_and_reset_boards(self):
+        env = VectorSnakeEnv(2, seed=0, cols=4, rows=4)
+        env.reset()
+        env.food[:] = 0
+        for _ in range(2):
+            _observations, rewards, dones, _info = env.step([UP, UP])
+        self.assertTrue((rewards == 0).all())
+
+        _observations, rewards, dones, info = env.step([UP, UP])
+        self.assertTrue((rewards == REWARD_DEATH).all())
+        self.assertTrue(dones.all())
+        self.assertEqual(list(info["moves"]), [3, 3])
+        # Boards were reset straight away
+        self.assertTrue((env.head == env.start).all())
+        self.assertTrue((env.moves == 0).all())
+
+    def test_obstacles_leave_room_for_food_on_tiny_boards(self):
+        env = VectorSnakeEnv(4, game_has_obstacles=True, seed=0, cols=2, rows=2)
+        env.reset()
+
+        self.assertTrue((env.obstacles.sum(axis=1) == 2).all())
+        self.assertFalse(env.obstacles[env.boards, env.start].any())
+        self.assertFalse(env.obstacles[env.boards, env.food].any())
+
+    def test_filling_the_board_is_reported_as_won(self):
+        env = VectorSnakeEnv(1, seed=0, cols=2, rows=1)
+        env.reset()
+        self.assertEqual(env.head[0], 1)
+
+        _observations, rewards, dones, info = env.step([LEFT])
+        self.assertEqual((rewards[0], dones[0]), (REWARD_FOOD, True))
+        self.assertTrue(info["won"][0])
+        self.assertFalse(info["truncated"][0])
+
+    def test_random_play_keeps_state_consistent(self):
+        env = VectorSnakeEnv(64, game_has_obstacles=True, max_moves=200, seed=3)
+        env.reset()
+        rng = np.random.default_rng(0)
+        for _ in range(300):
+            env.step(rng.integers(0, 4, env.num_envs))
+            self.assertTrue((env.lifetime[env.boards, env.food] == 0).all())
+            self.assertFalse(env.obstacles[env.boards, env.food].any())
+            self.assertTrue(((env.lifetime > 0).sum(axis=1) == env.length).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
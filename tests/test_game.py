@@ -0,0 +1,269 @@
+import random
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from snake.configs.directions import Direction
+from snake.configs.game import BLOCK_SIZE, HEIGHT, OBSTACLE_THRESHOLD, WIDTH
+from snake.main.point import Point
+from snake.search_models.informed.a_star_search import AStar
+from snake.search_models.manual import Manual
+from snake.search_models.registry import ALGORITHMS
+from snake.search_models.uninformed.hamiltonian_cycle import (
+    HamiltonianCycle,
+    cycle_tables,
+)
+from snake.search_models.uninformed.random_search import Random
+
+
+class TestHeadlessGame(unittest.TestCase):
+
+    def test_search_models_do_not_import_pygame(self):
+        code = (
+            "import sys\n"
+            "import snake.search_models.informed.a_star_search\n"
+            "import snake.search_models.uninformed.hamiltonian_cycle\n"
+            "import snake.search_models.local.stochastic_hill_climbing\n"
+            "assert 'pygame' not in sys.modules, 'pygame was imported'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_step_moves_head(self):
+        game = Random(game_has_obstacles=False)
+        game.head = Point(WIDTH // 2, HEIGHT // 2)
+        game.snake = [game.head]
+        game.food = Point(0, 0)
+
+        self.assertTrue(game.step(Direction.LEFT))
+        self.assertEqual(game.head, Point(WIDTH // 2 - BLOCK_SIZE, HEIGHT // 2))
+        self.assertEqual(list(game.snake), [game.head])
+        self.assertEqual(game.score, 0)
+
+    def test_step_eats_food_and_grows(self):
+        game = Random(game_has_obstacles=False)
+        game.head = Point(0, 0)
+        game.snake = [game.head]
+        game.food = Point(BLOCK_SIZE, 0)
+
+        self.assertTrue(game.step(Direction.RIGHT))
+        self.assertEqual(game.score, 1)
+        self.assertEqual(len(game.snake), 2)
+        self.assertNotEqual(game.food, Point(BLOCK_SIZE, 0))
+
+    def test_step_into_wall_ends_game(self):
+        game = Random(game_has_obstacles=False)
+        game.head = Point(0, 0)
+        game.snake = [game.head]
+        game.food = Point(BLOCK_SIZE, BLOCK_SIZE)
+
+        self.assertFalse(game.step(Direction.UP))
+
+    def test_step_into_body_ends_game(self):
+        game = Random(game_has_obstacles=False)
+        # Snake bent around (BS, BS): moving down from the head hits its own body
+        game.head = Point(BLOCK_SIZE, 0)
+        game.snake = [
+            game.head,
+            Point(2 * BLOCK_SIZE, 0),
+            Point(2 * BLOCK_SIZE, BLOCK_SIZE),
+            Point(BLOCK_SIZE, BLOCK_SIZE),
+            Point(0, BLOCK_SIZE),
+        ]
+        game.food = Point(5 * BLOCK_SIZE, 5 * BLOCK_SIZE)
+
+        self.assertFalse(game.step(Direction.DOWN))
+
+    def test_step_into_vacating_tail_is_allowed(self):
+        game = Random(game_has_obstacles=False)
+        # Snake curled in a 2x2 square: the head may follow its tail
+        game.head = Point(0, 0)
+        game.snake = [
+            game.head,
+            Point(BLOCK_SIZE, 0),
+            Point(BLOCK_SIZE, BLOCK_SIZE),
+            Point(0, BLOCK_SIZE),
+        ]
+        game.food = Point(5 * BLOCK_SIZE, 5 * BLOCK_SIZE)
+
+        self.assertTrue(game.step(Direction.DOWN))
+        self.assertEqual(game.head, Point(0, BLOCK_SIZE))
+
+    def test_step_into_obstacle_ends_game(self):
+        game = Random(game_has_obstacles=False)
+        game.head = Point(0, 0)
+        game.snake = [game.head]
+        game.obstacles = [Point(0, BLOCK_SIZE)]
+        game.food = Point(5 * BLOCK_SIZE, 5 * BLOCK_SIZE)
+
+        self.assertFalse(game.step(Direction.DOWN))
+
+    def test_occupancy_stays_in_sync(self):
+        game = AStar(game_has_obstacles=True)
+        game.main()
+
+        occupancy = bytearray(game.occupancy)
+        free_cells = set(game.free_cells)
+        game.rebuild_occupancy()
+        self.assertEqual(occupancy, game.occupancy)
+        self.assertEqual(free_cells, set(game.free_cells))
+        for index, cell in enumerate(game.free_cells):
+            self.assertEqual(game.free_index[cell], index)
+
+    def test_filling_the_board_wins_the_game(self):
+        # 2x2 board: the snake covers three cells and the food is on the last one
+        game = Random(game_has_obstacles=False, width=40, height=40)
+        game.head = Point(0, 0)
+        game.snake = [game.head, Point(BLOCK_SIZE, 0), Point(BLOCK_SIZE, BLOCK_SIZE)]
+        game.food = Point(0, BLOCK_SIZE)
+
+        self.assertTrue(game.step(Direction.DOWN))
+        self.assertTrue(game.won)
+        self.assertIsNone(game.food)
+        self.assertEqual(game.main(), 1)
+
+    def test_hamiltonian_cycle_fills_a_small_board(self):
+        game = HamiltonianCycle(False, seed=0, width=80, height=80)
+        score = game.main()
+
+        self.assertTrue(game.won)
+        self.assertEqual(score, 15)
+        self.assertEqual(len(game.snake), 16)
+
+    def test_headless_game_runs_to_completion(self):
+        game = AStar(game_has_obstacles=True)
+        score = game.main()
+
+        self.assertIsInstance(score, int)
+        self.assertEqual(score, game.score)
+
+
+class TestSeeding(unittest.TestCase):
+
+    def test_same_seed_replays_the_same_game(self):
+        games = [Random(game_has_obstacles=True, seed=5) for _ in range(2)]
+        for game in games:
+            game.main()
+
+        first, second = games
+        self.assertEqual(first.obstacles, second.obstacles)
+        self.assertEqual((first.score, first.moves), (second.score, second.moves))
+        self.assertEqual(list(first.snake), list(second.snake))
+
+    def test_streams_are_independent(self):
+        first = Random(game_has_obstacles=True, seed=3)
+        second = Random(game_has_obstacles=True, seed=3)
+        # Algorithm draws must not shift where the next food goes
+        second.rng.random()
+
+        first.generate_food()
+        second.generate_food()
+        self.assertEqual(first.food, second.food)
+
+    def test_seeded_games_leave_global_random_alone(self):
+        state = random.getstate()
+        Random(game_has_obstacles=True, seed=1).main()
+        self.assertEqual(random.getstate(), state)
+
+    def test_unseeded_games_record_their_seed(self):
+        game = Random(game_has_obstacles=True)
+        replay = Random(game_has_obstacles=True, seed=game.seed)
+        self.assertEqual(game.obstacles, replay.obstacles)
+        self.assertEqual(game.food, replay.food)
+
+
+class TestBoardSize(unittest.TestCase):
+
+    def test_every_algorithm_plays_on_a_custom_board(self):
+        for name, algorithm in ALGORITHMS.items():
+            with self.subTest(name):
+                game = algorithm(
+                    game_has_obstacles=True,
+                    seed=1,
+                    max_moves=500,
+                    width=120,
+                    height=80,
+                    block_size=10,
+                )
+                self.assertEqual((game.grid.cols, game.grid.rows), (12, 8))
+                self.assertEqual(game.head, Point(60, 40))
+                game.main()
+                self.assertTrue(all(game.grid.contains(point) for point in game.snake))
+
+    def test_every_algorithm_plays_on_boards_too_small_for_the_obstacles(self):
+        for cols, rows in ((2, 2), (3, 4), (4, 4)):
+            for name, algorithm in ALGORITHMS.items():
+                with self.subTest(name, cols=cols, rows=rows):
+                    game = algorithm(
+                        game_has_obstacles=True,
+                        seed=1,
+                        max_moves=100,
+                        width=cols * BLOCK_SIZE,
+                        height=rows * BLOCK_SIZE,
+                    )
+                    # Obstacles leave room for the snake and the food
+                    self.assertEqual(
+                        len(game.obstacles), min(OBSTACLE_THRESHOLD, cols * rows - 2)
+                    )
+                    self.assertIsNotNone(game.food)
+                    game.main()
+
+    def test_manual_game_ends_when_the_board_is_filled(self):
+        game = Manual(False, width=2 * BLOCK_SIZE, height=BLOCK_SIZE)
+        game.direction = Direction.LEFT
+        # No key presses: the snake keeps moving left, onto the food
+        with patch.object(Manual, "generate_path", return_value=None):
+            self.assertEqual(game.main(), 1)
+        self.assertTrue(game.won)
+        self.assertEqual(game.moves, 1)
+
+    def test_game_without_room_for_food_is_won_from_the_start(self):
+        for name, algorithm in ALGORITHMS.items():
+            if algorithm is HamiltonianCycle:
+                continue
+            with self.subTest(name):
+                game = algorithm(
+                    game_has_obstacles=True, width=BLOCK_SIZE, height=BLOCK_SIZE
+                )
+                self.assertTrue(game.won)
+                self.assertEqual(list(game.path), [])
+                self.assertEqual(game.main(), 0)
+                self.assertEqual(game.moves, 0)
+
+    def test_hamiltonian_cycle_covers_odd_boards(self):
+        for cols, rows in ((9, 8), (8, 9), (2, 3)):
+            with self.subTest(cols=cols, rows=rows):
+                game = HamiltonianCycle(
+                    False, width=cols * BLOCK_SIZE, height=rows * BLOCK_SIZE
+                )
+                cycle = game.cycle
+                self.assertEqual(sorted(cycle), list(range(cols * rows)))
+                for cell, following in zip(cycle, cycle[1:] + cycle[:1]):
+                    self.assertEqual(game.grid.manhattan(cell, following), 1)
+
+    def test_hamiltonian_cycle_rejects_odd_by_odd_boards(self):
+        with self.assertRaises(ValueError):
+            HamiltonianCycle(False, width=9 * BLOCK_SIZE, height=9 * BLOCK_SIZE)
+
+    def test_cycle_tables_are_shared_and_invert_the_cycle(self):
+        first, second = HamiltonianCycle(False), HamiltonianCycle(True)
+        tables = first.tables
+        self.assertIs(second.tables, tables)
+        self.assertIs(cycle_tables(first.grid.cols, first.grid.rows), tables)
+
+        head = first.grid.cell(first.head)
+        self.assertEqual(tables.cells[first.current_cycle_index], head)
+        for position in (0, 17, tables.size - 1):
+            cell = tables.cells[position]
+            self.assertEqual(tables.positions[cell], position)
+            following = tables.cells[(position + 1) % tables.size]
+            self.assertEqual(tables.next_cell(cell), following)
+            self.assertEqual(tables.distance(cell, following), 1)
+            self.assertEqual(tables.distance(following, cell), tables.size - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
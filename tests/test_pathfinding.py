@@ -7,6 +7,11 @@ from snake.configs.game import (  # Using actual game dimensions for now
 from snake.main.point import Point
 from snake.search_models.informed.a_star_search import AStar
 from snake.search_models.informed.best_first_search import BestFS
+from snake.search_models.informed.bidirectional_a_star_search import (
+    BidirectionalAStar,
+)
+from snake.search_models.informed.jump_point_search import JumpPointSearch
+from snake.search_models.uninformed.bidirectional_bfs import BidirectionalBFS
 from snake.search_models.uninformed.breadth_first_search import BFS
 from snake.search_models.uninformed.depth_first_search import DFS
 
@@ -21,7 +26,7 @@ def configure_mock_pygame(mock_pygame_obj):
     # Reset call counts etc. before reconfiguring for a specific test context
     mock_pygame_obj.reset_mock()
 
-    # Configure return values for pygame calls made in Game.__init__
+    # Configure return values for pygame calls made by the game renderer
     mock_pygame_obj.display.set_mode.return_value = MagicMock()
     mock_pygame_obj.font.SysFont.return_value = MagicMock()
     mock_pygame_obj.display.set_caption.return_value = (
@@ -32,7 +37,7 @@ def configure_mock_pygame(mock_pygame_obj):
     )  # Though not strictly necessary for pathfinding logic
 
 
-@patch("snake.main.game.pygame")  # Mocks pygame for all test methods in this class
+@patch("snake.ui.renderer.pygame")  # Mocks pygame for all test methods in this class
 class TestPathfindingAlgorithms(unittest.TestCase):
 
     # --- Helper (runner) methods for different test scenarios ---
@@ -313,6 +318,20 @@ class TestPathfindingAlgorithms(unittest.TestCase):
     def test_astar_food_on_head(self, mock_pygame_injected):
         self.run_test_food_on_head(AStar, "AStar", mock_pygame_injected)
 
+    def test_astar_open_board_expands_only_the_path(self, mock_pygame_injected):
+        configure_mock_pygame(mock_pygame_injected)
+        algo = AStar(game_has_obstacles=False)
+        algo.head = Point(0, 0)
+        algo.food = Point(BLOCK_SIZE * 9, BLOCK_SIZE * 9)
+        algo.snake = [algo.head]
+        algo.obstacles = []
+
+        algo.generate_path()
+
+        # Ties on f are broken towards the deepest cell, so no f-level is widened
+        self.assertEqual(len(algo.path), 18)
+        self.assertEqual(sum(algo.closed), len(algo.path) + 1)
+
     def test_bestfs_simple_path(self, mock_pygame_injected):
         self.run_test_simple_path(BestFS, "BestFS", mock_pygame_injected)
 
@@ -328,6 +347,113 @@ class TestPathfindingAlgorithms(unittest.TestCase):
     def test_bestfs_food_on_head(self, mock_pygame_injected):
         self.run_test_food_on_head(BestFS, "BestFS", mock_pygame_injected)
 
+    def test_bidirectional_bfs_simple_path(self, mock_pygame_injected):
+        self.run_test_simple_path(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_no_path_blocked(self, mock_pygame_injected):
+        self.run_test_no_path_blocked(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_path_with_obstacles(self, mock_pygame_injected):
+        self.run_test_path_with_obstacles(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_food_adjacent(self, mock_pygame_injected):
+        self.run_test_food_adjacent(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_food_on_head(self, mock_pygame_injected):
+        self.run_test_food_on_head(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_simple_path(self, mock_pygame_injected):
+        self.run_test_simple_path(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_no_path_blocked(self, mock_pygame_injected):
+        self.run_test_no_path_blocked(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_path_with_obstacles(self, mock_pygame_injected):
+        self.run_test_path_with_obstacles(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_food_adjacent(self, mock_pygame_injected):
+        self.run_test_food_adjacent(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_food_on_head(self, mock_pygame_injected):
+        self.run_test_food_on_head(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_expands_fewer_cells(self, mock_pygame_injected):
+        configure_mock_pygame(mock_pygame_injected)
+        expanded = {}
+        for algorithm_class in (BFS, BidirectionalBFS):
+            algo = algorithm_class(game_has_obstacles=False)
+            # Both searches grow a diamond, but two of half the radius cover half as much
+            algo.head = Point(BLOCK_SIZE * 8, BLOCK_SIZE * 16)
+            algo.food = Point(BLOCK_SIZE * 24, BLOCK_SIZE * 16)
+            algo.snake = [algo.head]
+            algo.obstacles = []
+
+            algo.generate_path()
+
+            self.assertEqual(len(algo.path), 16)
+            self.assertEqual(algo.path[-1], algo.food)
+            expanded[algorithm_class] = sum(algo.closed) + sum(
+                getattr(algo, "closed_backward", b"")
+            )
+
+        self.assertLess(expanded[BidirectionalBFS], expanded[BFS] * 0.6)
+
+    def test_jps_simple_path(self, mock_pygame_injected):
+        self.run_test_simple_path(JumpPointSearch, "JPS", mock_pygame_injected)
+
+    def test_jps_no_path_blocked(self, mock_pygame_injected):
+        self.run_test_no_path_blocked(JumpPointSearch, "JPS", mock_pygame_injected)
+
+    def test_jps_path_with_obstacles(self, mock_pygame_injected):
+        self.run_test_path_with_obstacles(JumpPointSearch, "JPS", mock_pygame_injected)
+
+    def test_jps_food_adjacent(self, mock_pygame_injected):
+        self.run_test_food_adjacent(JumpPointSearch, "JPS", mock_pygame_injected)
+
+    def test_jps_food_on_head(self, mock_pygame_injected):
+        self.run_test_food_on_head(JumpPointSearch, "JPS", mock_pygame_injected)
+
+    def test_jps_pushes_only_jump_points(self, mock_pygame_injected):
+        configure_mock_pygame(mock_pygame_injected)
+        pushed = {}
+        for algorithm_class in (AStar, JumpPointSearch):
+            algo = algorithm_class(game_has_obstacles=False)
+            algo.head = Point(BLOCK_SIZE * 3, BLOCK_SIZE * 5)
+            algo.food = Point(BLOCK_SIZE * 25, BLOCK_SIZE * 20)
+            # A wall the path has to get around
+            algo.obstacles = [
+                Point(BLOCK_SIZE * 10, BLOCK_SIZE * y) for y in range(3, 25)
+            ]
+            algo.snake = [algo.head, Point(BLOCK_SIZE * 3, BLOCK_SIZE * 6)]
+
+            algo.generate_path()
+
+            self.assertEqual(len(algo.path), 22 + 15 + 2 * 3)
+            self.assertEqual(algo.path[-1], algo.food)
+            pushed[algorithm_class] = algo.counter
+
+        self.assertLess(pushed[JumpPointSearch] * 5, pushed[AStar])
+
     # --- New runner methods for current_simulated_snake behavior ---
 
     def run_test_tail_vacate_simple(
@@ -431,6 +557,116 @@ class TestPathfindingAlgorithms(unittest.TestCase):
     def test_bestfs_tail_vacate_with_turn(self, mock_pygame_injected):
         self.run_test_tail_vacate_with_turn(BestFS, "BestFS", mock_pygame_injected)
 
+    def test_bidirectional_bfs_tail_vacate_simple(self, mock_pygame_injected):
+        self.run_test_tail_vacate_simple(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_tail_vacate_with_turn(self, mock_pygame_injected):
+        self.run_test_tail_vacate_with_turn(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_tail_vacate_simple(self, mock_pygame_injected):
+        self.run_test_tail_vacate_simple(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_tail_vacate_with_turn(self, mock_pygame_injected):
+        self.run_test_tail_vacate_with_turn(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
+    def test_jps_tail_vacate_simple(self, mock_pygame_injected):
+        self.run_test_tail_vacate_simple(JumpPointSearch, "JPS", mock_pygame_injected)
+
+    def test_jps_tail_vacate_with_turn(self, mock_pygame_injected):
+        self.run_test_tail_vacate_with_turn(
+            JumpPointSearch, "JPS", mock_pygame_injected
+        )
+
+    # --- Runner and test methods for time-aware search ---
+
+    def run_test_time_aware_path_through_vacated_body(
+        self, algorithm_class, algorithm_name, current_mock_pygame
+    ):
+        configure_mock_pygame(current_mock_pygame)
+        algo = algorithm_class(game_has_obstacles=False, time_aware=True)
+
+        # Food F at the end of a dead-end corridor that the body B still fills:
+        # F B B B
+        # X X X H
+        # The body frees the corridor from its tail first, so the head can walk a
+        # short loop and follow it in: (4,1) -> (4,0) -> (3,0) -> ... -> (0,0)
+        algo.head = Point(BLOCK_SIZE * 3, BLOCK_SIZE)
+        algo.snake = [
+            algo.head,
+            Point(BLOCK_SIZE * 3, 0),
+            Point(BLOCK_SIZE * 2, 0),
+            Point(BLOCK_SIZE, 0),
+        ]
+        algo.obstacles = [Point(BLOCK_SIZE * x, BLOCK_SIZE) for x in range(3)]
+        algo.food = Point(0, 0)
+
+        algo.time_aware = False
+        algo.generate_path()
+        self.assertEqual(
+            len(algo.path),
+            0,
+            f"{algorithm_name}: Conservative search should treat the body as blocked. Path: {algo.path}",
+        )
+
+        algo.time_aware = True
+        algo.generate_path()
+        self.assertTrue(
+            len(algo.path) > 0,
+            f"{algorithm_name}: Time-aware search should follow the vacating body. Path: {algo.path}",
+        )
+        if algorithm_name not in ["DFS"]:
+            self.assertEqual(
+                len(algo.path),
+                6,
+                f"{algorithm_name}: Path length should be 6. Path: {algo.path}",
+            )
+
+        # Playing the path must reach the food without colliding
+        for p_step in algo.path:
+            self.assertTrue(
+                algo.step(p_step.direction_from(algo.head)),
+                f"{algorithm_name}: Snake collided when moving to {p_step}.",
+            )
+        self.assertEqual(algo.score, 1, f"{algorithm_name}: Food was not eaten.")
+
+    def test_bfs_time_aware_path(self, mock_pygame_injected):
+        self.run_test_time_aware_path_through_vacated_body(
+            BFS, "BFS", mock_pygame_injected
+        )
+
+    def test_dfs_time_aware_path(self, mock_pygame_injected):
+        self.run_test_time_aware_path_through_vacated_body(
+            DFS, "DFS", mock_pygame_injected
+        )
+
+    def test_astar_time_aware_path(self, mock_pygame_injected):
+        self.run_test_time_aware_path_through_vacated_body(
+            AStar, "AStar", mock_pygame_injected
+        )
+
+    def test_bestfs_time_aware_path(self, mock_pygame_injected):
+        self.run_test_time_aware_path_through_vacated_body(
+            BestFS, "BestFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_bfs_time_aware_path(self, mock_pygame_injected):
+        self.run_test_time_aware_path_through_vacated_body(
+            BidirectionalBFS, "BidirectionalBFS", mock_pygame_injected
+        )
+
+    def test_bidirectional_astar_time_aware_path(self, mock_pygame_injected):
+        self.run_test_time_aware_path_through_vacated_body(
+            BidirectionalAStar, "BidirectionalAStar", mock_pygame_injected
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from snake.configs.directions import Direction
+from snake.main.planner import PathPlanner
+from snake.search_models.informed.a_star_search import AStar
+from snake.search_models.uninformed.breadth_first_search import BFS
+
+
+class LatePlanner:
+    """Planner whose plans are never ready in time."""
+
+    def __init__(self):
+        self.speculated = 0
+
+    def speculate(self, game):
+        self.speculated += 1
+
+    def take(self, game, timeout=None):
+        return None
+
+
+class TestClone(unittest.TestCase):
+
+    def test_clone_is_independent(self):
+        game = AStar(game_has_obstacles=True, seed=2)
+        clone = game.clone()
+        snake, food_state = list(game.snake), game.food_rng.getstate()
+        clone.step(Direction.LEFT)
+        clone.food_rng.random()
+
+        self.assertEqual(list(game.snake), snake)
+        self.assertEqual(game.moves, 0)
+        self.assertEqual(game.occupancy, game.clone().occupancy)
+        self.assertNotEqual(clone.occupancy, game.occupancy)
+        self.assertEqual(game.food_rng.getstate(), food_state)
+
+    def test_clone_draws_the_same_food(self):
+        game = AStar(game_has_obstacles=True, seed=2)
+        clone = game.clone()
+        game.generate_food()
+        clone.generate_food()
+
+        self.assertEqual(clone.food, game.food)
+
+
+class TestPlanAhead(unittest.TestCase):
+
+    def test_plan_ahead_plays_the_same_game(self):
+        for game_class in (AStar, BFS):
+            games = [
+                game_class(game_has_obstacles=True, seed=6, plan_ahead=plan_ahead)
+                for plan_ahead in (False, True)
+            ]
+            for game in games:
+                game.main()
+
+            sync, ahead = games
+            self.assertEqual((ahead.score, ahead.moves), (sync.score, sync.moves))
+            self.assertEqual(list(ahead.snake), list(sync.snake))
+
+    def test_planned_path_is_taken(self):
+        game = AStar(game_has_obstacles=False, seed=1)
+        planner = PathPlanner()
+        try:
+            planner.speculate(game)
+            for point in list(game.path):
+                game.step(point.direction_from(game.head))
+            game.take_planned_path(planner)
+        finally:
+            planner.close()
+
+        self.assertEqual(game.path[-1], game.food)
+
+    def test_late_plan_falls_back_to_a_survival_move(self):
+        game = AStar(game_has_obstacles=True, seed=1)
+        planner = LatePlanner()
+        game.take_planned_path(planner)
+
+        self.assertEqual(list(game.path), game.survival_path())
+        self.assertEqual(len(game.path), 1)
+        self.assertEqual(planner.speculated, 1)
+
+    def test_stale_plan_is_rejected(self):
+        game = AStar(game_has_obstacles=False, seed=1)
+        planner = PathPlanner()
+        try:
+            planner.speculate(game)
+            self.assertIsNone(planner.take(game))
+        finally:
+            planner.close()
+
+    def test_superseded_plan_does_not_hold_up_the_next_one(self):
+        release = threading.Event()
+
+        def slow_plan(game):
+            release.wait()
+            return game
+
+        game = AStar(game_has_obstacles=False, seed=1)
+        planner = PathPlanner()
+        try:
+            with patch("snake.main.planner.plan_after_path", slow_plan):
+                planner.speculate(game)
+                self.assertIsNone(planner.take(game, timeout=0.01))
+            planner.speculate(game)
+            clone = planner.future.result(timeout=5)
+        finally:
+            release.set()
+            planner.close()
+
+        # The second plan ran through the game's path to the food
+        self.assertEqual(clone.moves, len(game.path))
+        self.assertEqual(clone.score, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,11 +11,15 @@ class TestPoint(unittest.TestCase):
         point = Point(10, 20)
         self.assertEqual(point.x, 10)
         self.assertEqual(point.y, 20)
-        self.assertIsNone(point.f)
-        self.assertIsNone(point.g)
-        self.assertIsNone(point.h)
-        self.assertEqual(point.neighbors, [])
-        self.assertIsNone(point.origin)
+        self.assertFalse(hasattr(point, "__dict__"))
+
+    def test_points_are_immutable(self):
+        point = Point(10, 20)
+        with self.assertRaises(AttributeError):
+            point.x = 30
+        # Search state cannot be attached to shared Points
+        with self.assertRaises(AttributeError):
+            point.origin = Point(10, 0)
 
     def test_equality_and_hashability(self):
         point1 = Point(10, 20)
@@ -31,15 +35,15 @@ class TestPoint(unittest.TestCase):
         self.assertIn(point1, point_set)
         self.assertIn(point3, point_set)
 
-    def test_generate_neighbors(self):
+    def test_neighbors(self):
         # Using default WIDTH, HEIGHT, BLOCK_SIZE for this test.
         # Adjust if these constants are too large for practical neighbor generation testing.
         # For this test, assume point is not near border to get all 4 neighbors.
         point = Point(WIDTH // 2, HEIGHT // 2)
-        point.generate_neighbors()
+        neighbors = point.neighbors()
 
-        self.assertEqual(len(point.neighbors), 4)
-        for neighbor in point.neighbors:
+        self.assertEqual(len(neighbors), 4)
+        for neighbor in neighbors:
             self.assertIsInstance(neighbor, Point)
 
         expected_neighbors = [
@@ -50,16 +54,16 @@ class TestPoint(unittest.TestCase):
         ]
 
         # Check if all expected neighbors are generated, order doesn't matter for this check
-        self.assertCountEqual(point.neighbors, expected_neighbors)
+        self.assertCountEqual(neighbors, expected_neighbors)
 
-    def test_generate_neighbors_at_boundary(self):
+    def test_neighbors_at_boundary(self):
         # Top-left corner
         point_tl = Point(0, 0)
-        point_tl.generate_neighbors()
+        neighbors_tl = point_tl.neighbors()
         # Expected: Right and Down neighbors
         expected_tl_neighbors = [Point(BLOCK_SIZE, 0), Point(0, BLOCK_SIZE)]
-        self.assertEqual(len(point_tl.neighbors), 2)
-        self.assertCountEqual(point_tl.neighbors, expected_tl_neighbors)
+        self.assertEqual(len(neighbors_tl), 2)
+        self.assertCountEqual(neighbors_tl, expected_tl_neighbors)
 
         # Bottom-right corner
         # Requires careful calculation of max valid x, y based on WIDTH, HEIGHT, BLOCK_SIZE
@@ -67,40 +71,44 @@ class TestPoint(unittest.TestCase):
         max_x = WIDTH - BLOCK_SIZE
         max_y = HEIGHT - BLOCK_SIZE
         point_br = Point(max_x, max_y)
-        point_br.generate_neighbors()
+        neighbors_br = point_br.neighbors()
         # Expected: Left and Up neighbors
         expected_br_neighbors = [
             Point(max_x - BLOCK_SIZE, max_y),
             Point(max_x, max_y - BLOCK_SIZE),
         ]
-        self.assertEqual(len(point_br.neighbors), 2)
-        self.assertCountEqual(point_br.neighbors, expected_br_neighbors)
+        self.assertEqual(len(neighbors_br), 2)
+        self.assertCountEqual(neighbors_br, expected_br_neighbors)
 
-    def test_get_direction(self):
-        point = Point(50, 50)
+    def test_neighbors_on_custom_board(self):
+        # 5x4 board of 10-pixel blocks: the bottom-right cell is (40, 30)
+        point = Point(40, 30)
+        neighbors = point.neighbors(width=50, height=40, block_size=10)
+        self.assertCountEqual(neighbors, [Point(30, 30), Point(40, 20)])
 
-        # No origin
-        self.assertIsNone(point.get_direction())
+    def test_direction_from(self):
+        point = Point(50, 50)
 
         # Origin below (moves UP)
-        point.origin = Point(50, 50 + BLOCK_SIZE)
-        self.assertEqual(point.get_direction(), Direction.UP)
+        self.assertEqual(point.direction_from(Point(50, 50 + BLOCK_SIZE)), Direction.UP)
 
         # Origin above (moves DOWN)
-        point.origin = Point(50, 50 - BLOCK_SIZE)
-        self.assertEqual(point.get_direction(), Direction.DOWN)
+        self.assertEqual(
+            point.direction_from(Point(50, 50 - BLOCK_SIZE)), Direction.DOWN
+        )
 
         # Origin to the right (moves LEFT)
-        point.origin = Point(50 + BLOCK_SIZE, 50)
-        self.assertEqual(point.get_direction(), Direction.LEFT)
+        self.assertEqual(
+            point.direction_from(Point(50 + BLOCK_SIZE, 50)), Direction.LEFT
+        )
 
         # Origin to the left (moves RIGHT)
-        point.origin = Point(50 - BLOCK_SIZE, 50)
-        self.assertEqual(point.get_direction(), Direction.RIGHT)
+        self.assertEqual(
+            point.direction_from(Point(50 - BLOCK_SIZE, 50)), Direction.RIGHT
+        )
 
         # Origin is the same (should ideally not happen or return None)
-        point.origin = Point(50, 50)
-        self.assertIsNone(point.get_direction())  # No change in x or y
+        self.assertIsNone(point.direction_from(Point(50, 50)))  # No change in x or y
 
 
 if __name__ == "__main__":
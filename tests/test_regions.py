@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+
+from snake.configs.game import BLOCK_SIZE
+from snake.main.point import Point
+from snake.main.regions import label_regions, region_sizes
+from snake.search_models.informed.a_star_search import AStar
+
+
+def board(rows):
+    """Builds a free-cell mask from rows of '.' (free) and 'X' (blocked)."""
+    return np.array([cell == "." for row in rows for cell in row])
+
+
+class TestLabelRegions(unittest.TestCase):
+
+    def test_regions_are_labelled_with_their_smallest_cell(self):
+        free = board(
+            [
+                ".X..",
+                ".X.X",
+                "XX..",
+            ]
+        )
+        labels = label_regions(free, 4)
+
+        self.assertEqual(
+            labels[:-1].tolist(), [0, 12, 2, 2, 0, 12, 2, 12, 12, 12, 2, 2]
+        )
+        self.assertEqual(list(region_sizes(labels)[[0, 2]]), [2, 5])
+        self.assertEqual(region_sizes(labels)[12], 0)
+
+    def test_long_corridor_is_one_region(self):
+        # A serpentine corridor through the whole board
+        rows = []
+        for row in range(16):
+            if row % 2 == 0:
+                rows.append("." * 16)
+            elif row % 4 == 1:
+                rows.append("X" * 15 + ".")
+            else:
+                rows.append("." + "X" * 15)
+        labels = label_regions(board(rows), 16)
+
+        self.assertEqual(set(labels[:-1]) - {256}, {0})
+
+    def test_fully_blocked_board(self):
+        labels = label_regions(np.zeros(6, dtype=bool), 3)
+        self.assertEqual(list(labels), [6] * 7)
+
+
+class TestSafePaths(unittest.TestCase):
+
+    def make_game(self, safe_paths):
+        game = AStar(game_has_obstacles=False, safe_paths=safe_paths)
+        # Food at the end of a dead-end pocket along the top wall: the snake is long
+        # enough to seal the pocket behind itself when it goes in
+        #   F . . . X
+        #   X X X . X
+        #   . . . H X
+        game.obstacles = [
+            Point(0, BLOCK_SIZE),
+            Point(BLOCK_SIZE, BLOCK_SIZE),
+            Point(2 * BLOCK_SIZE, BLOCK_SIZE),
+            Point(4 * BLOCK_SIZE, 0),
+            Point(4 * BLOCK_SIZE, BLOCK_SIZE),
+            Point(4 * BLOCK_SIZE, 2 * BLOCK_SIZE),
+        ]
+        game.head = Point(3 * BLOCK_SIZE, 2 * BLOCK_SIZE)
+        game.snake = [game.head] + [
+            Point(3 * BLOCK_SIZE, y * BLOCK_SIZE) for y in range(3, 9)
+        ]
+        game.food = Point(0, 0)
+        return game
+
+    def test_trapping_path_is_detected(self):
+        game = self.make_game(safe_paths=False)
+        game.generate_path()
+
+        self.assertEqual(len(game.path), 5)
+        self.assertTrue(game.traps_snake(game.path))
+
+    def test_safe_paths_replaces_trapping_path_with_survival_move(self):
+        game = self.make_game(safe_paths=True)
+        game.generate_path()
+
+        self.assertEqual(len(game.path), 1)
+        self.assertFalse(game.traps_snake(game.path))
+        self.assertEqual(game.path[0], Point(2 * BLOCK_SIZE, 2 * BLOCK_SIZE))
+
+    def test_safe_path_is_kept(self):
+        game = self.make_game(safe_paths=True)
+        game.food = Point(0, 2 * BLOCK_SIZE)
+        game.generate_path()
+
+        self.assertEqual(len(game.path), 3)
+        self.assertEqual(game.path[-1], game.food)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from snake.configs.game import HEIGHT, WIDTH
+from snake.search_models.informed.a_star_search import AStar
+from snake.search_models.manual import Manual
+from snake.ui.renderer import GameRenderer
+
+
+class CountingRenderer(GameRenderer):
+    """Renderer that counts its full redraws and draws every move without pacing."""
+
+    def __init__(self, display_surface):
+        super().__init__(display_surface)
+        self.full_redraws = 0
+
+    def draw_all(self, game):
+        self.full_redraws += 1
+        super().draw_all(game)
+
+    def advance(self, game, speed):
+        self.draw(game)
+
+
+class TestGameRenderer(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_incremental_frames_match_full_redraws(self):
+        reference = pygame.Surface((WIDTH, HEIGHT))
+        full = GameRenderer(reference)
+        test = self
+
+        class CheckedRenderer(CountingRenderer):
+            def draw(self, game):
+                super().draw(game)
+                full.draw_all(game)
+                test.assertEqual(
+                    pygame.image.tobytes(self.display, "RGB"),
+                    pygame.image.tobytes(reference, "RGB"),
+                    f"frame after move {game.moves} differs",
+                )
+
+        renderer = CheckedRenderer(self.display)
+        game = AStar(game_has_obstacles=True, seed=3, max_moves=400, renderer=renderer)
+        game.main()
+
+        # Only the very first frame is a full redraw
+        self.assertEqual(renderer.full_redraws, 1)
+
+    def test_frames_that_skip_moves_are_incremental(self):
+        reference = pygame.Surface((WIDTH, HEIGHT))
+        full = GameRenderer(reference)
+        test = self
+
+        class SkippingRenderer(CountingRenderer):
+            # Draws every fifth move, like a fast simulation that skips frames
+            def advance(self, game, speed):
+                if game.moves % 5:
+                    return
+                self.draw(game)
+                full.draw_all(game)
+                test.assertEqual(
+                    pygame.image.tobytes(self.display, "RGB"),
+                    pygame.image.tobytes(reference, "RGB"),
+                    f"frame after move {game.moves} differs",
+                )
+
+        renderer = SkippingRenderer(self.display)
+        game = AStar(game_has_obstacles=True, seed=3, max_moves=400, renderer=renderer)
+        game.main()
+
+        self.assertGreater(game.score, 0)
+        self.assertEqual(renderer.full_redraws, 1)
+
+    def test_manual_games_ignore_the_simulation_speed(self):
+        renderer = GameRenderer(self.display, sim_speed=8)
+        game = Manual(game_has_obstacles=False, seed=1, renderer=renderer)
+
+        game.update_ui(10)
+        self.assertAlmostEqual(renderer.clock.move_time, 1 / 10)
+        self.assertEqual(renderer.clock.sim_speed, 8)
+
+    def test_invalidate_forces_a_full_redraw(self):
+        renderer = CountingRenderer(self.display)
+        game = AStar(game_has_obstacles=False, seed=1)
+
+        renderer.draw(game)
+        renderer.invalidate()
+        renderer.draw(game)
+        self.assertEqual(renderer.full_redraws, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
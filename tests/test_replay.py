@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+from snake.configs.directions import Direction
+from snake.replay.player import ReplayPlayer
+from snake.replay.recording import (
+    HEADER,
+    Replay,
+    ReplayRecorder,
+    pack_moves,
+    unpack_moves,
+)
+from snake.search_models.informed.a_star_search import AStar
+
+
+def record(seed=4):
+    recorder = ReplayRecorder()
+    game = AStar(game_has_obstacles=True, seed=seed, recorder=recorder)
+    game.main()
+    return game, recorder.replay()
+
+
+class TestPacking(unittest.TestCase):
+
+    def test_moves_round_trip(self):
+        for count in range(10):
+            codes = bytes((3 * i + 1) % 4 for i in range(count))
+            packed = pack_moves(codes)
+
+            self.assertEqual(len(packed), -(-count // 4))
+            self.assertEqual(unpack_moves(packed, count), codes)
+
+    def test_replay_round_trip(self):
+        _game, replay = record()
+        data = replay.to_bytes()
+
+        self.assertEqual(Replay.from_bytes(data), replay)
+        expected = HEADER.size + 4 * len(replay.obstacles) + -(-replay.moves // 4)
+        self.assertEqual(len(data), expected)
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b"\0" * HEADER.size)
+
+
+class TestRecording(unittest.TestCase):
+
+    def test_every_move_is_recorded(self):
+        game, replay = record()
+
+        self.assertEqual(replay.moves, game.moves)
+        self.assertEqual(replay.score, game.score)
+        self.assertEqual(replay.seed, game.seed)
+
+    def test_reset_starts_a_new_recording(self):
+        recorder = ReplayRecorder()
+        game = AStar(game_has_obstacles=False, seed=2, recorder=recorder)
+        food = game.food
+        game.step(Direction.LEFT)
+        game.reset()
+
+        self.assertEqual(recorder.replay().moves, 0)
+        self.assertEqual(game.food, food)
+
+
+class TestReplayPlayer(unittest.TestCase):
+
+    def test_replay_ends_like_the_recorded_game(self):
+        game, replay = record()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.snkr")
+            replay.save(path)
+            final = ReplayPlayer.load(path).play_to_end()
+
+        self.assertEqual((final.score, final.moves), (game.score, game.moves))
+        self.assertEqual(list(final.snake), list(game.snake))
+
+    def test_seek_backwards_and_forwards(self):
+        _game, replay = record()
+        player = ReplayPlayer(replay)
+        middle = replay.moves // 2
+        state = list(player.seek(middle).snake)
+        player.seek(replay.moves)
+
+        self.assertEqual(list(player.seek(middle).snake), state)
+        self.assertEqual(player.game.moves, middle)
+        self.assertEqual(player.seek(0).moves, 0)
+
+    def test_render_only_draws_requested_frames(self):
+        _game, replay = record()
+        drawn = []
+
+        class Renderer:
+            def draw(self, game):
+                drawn.append(game.moves)
+
+        player = ReplayPlayer(replay)
+        self.assertEqual(list(player.render([20, 5], Renderer())), [5, 20])
+        self.assertEqual(drawn, [5, 20])
+
+    def test_replays_games_on_other_boards(self):
+        recorder = ReplayRecorder()
+        game = AStar(
+            game_has_obstacles=True, seed=6, recorder=recorder, width=240, height=160
+        )
+        game.main()
+        final = ReplayPlayer(recorder.replay()).play_to_end()
+
+        self.assertEqual((final.grid.cols, final.grid.rows), (12, 8))
+        self.assertEqual(list(final.snake), list(game.snake))
+
+    def test_rejects_a_different_obstacle_layout(self):
+        _game, replay = record()
+        replay.obstacles = replay.obstacles[1:]
+
+        with self.assertRaises(ValueError):
+            ReplayPlayer(replay)
+
+
+if __name__ == "__main__":
+    unittest.main()
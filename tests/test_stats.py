@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+
+from snake.bench.report import write_search_stats
+from snake.bench.runner import run_game
+from snake.configs.game import BLOCK_SIZE
+from snake.main.planner import PathPlanner
+from snake.main.point import Point
+from snake.main.stats import SearchStats
+from snake.search_models.informed.a_star_search import AStar
+from snake.search_models.local.simple_hill_climbing import HillClimbing
+from snake.search_models.uninformed.breadth_first_search import BFS
+
+
+def open_board(game_class, stats):
+    game = game_class(game_has_obstacles=False, seed=0, search_stats=stats)
+    game.head = Point(0, 0)
+    game.snake = [game.head]
+    game.food = Point(BLOCK_SIZE * 9, BLOCK_SIZE * 9)
+    return game
+
+
+class TestSearchStats(unittest.TestCase):
+
+    def test_astar_counters(self):
+        stats = SearchStats()
+        game = open_board(AStar, stats)
+        game.plan()
+
+        calls = stats.calls
+        self.assertEqual(calls["path_length"][-1], 18)
+        self.assertEqual(calls["expanded"][-1], 19)
+        self.assertEqual(calls["pushed"][-1], game.counter)
+        self.assertGreater(calls["max_frontier"][-1], 0)
+        self.assertLessEqual(calls["max_frontier"][-1], calls["pushed"][-1])
+
+    def test_bfs_counters(self):
+        stats = SearchStats()
+        open_board(BFS, stats).plan()
+
+        # Breadth first reaches the far corner of a 10x10 square last
+        self.assertGreaterEqual(stats.calls["expanded"][-1], 100)
+        self.assertGreaterEqual(stats.calls["pushed"][-1], stats.calls["expanded"][-1])
+
+    def test_replans_for_the_same_food_are_counted(self):
+        stats = SearchStats()
+        game = open_board(AStar, stats)
+        game.plan()
+        game.plan()
+
+        summary = stats.summary()
+        # The constructor planned for the original food, the test for the moved food
+        self.assertEqual(summary["plans"], 3)
+        self.assertEqual(summary["replans"], 1)
+
+    def test_single_step_models_record_moves(self):
+        stats = SearchStats()
+        game = HillClimbing(game_has_obstacles=False, seed=1, search_stats=stats)
+        game.max_moves = 20
+        game.main()
+
+        self.assertEqual(stats.summary()["plans"], game.moves)
+        self.assertEqual(set(stats.calls["path_length"]), {1})
+
+    def test_only_adopted_plans_are_counted(self):
+        stats = SearchStats()
+        game = AStar(game_has_obstacles=False, seed=1, search_stats=stats)
+        planner = PathPlanner()
+        try:
+            # A plan that is thrown away (e.g. because it was late)
+            planner.speculate(game)
+            planner.future.result()
+            self.assertEqual(stats.summary()["plans"], 1)
+
+            planner.speculate(game)
+            for point in list(game.path):
+                game.step(point.direction_from(game.head))
+            game.take_planned_path(planner)
+        finally:
+            planner.close()
+
+        self.assertEqual(stats.summary()["plans"], 2)
+        self.assertEqual(stats.last_target, game.food)
+
+    def test_disabled_stats_count_nothing(self):
+        game = open_board(AStar, None)
+        game.plan()
+        self.assertEqual(game.search_counts, (0, 0, 0))
+
+
+class TestSearchStatsExport(unittest.TestCase):
+
+    def test_one_json_line_per_game(self):
+        results = [
+            run_game("astar", seed, max_moves=300, search_stats=True)
+            for seed in range(2)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stats.jsonl")
+            write_search_stats(path, results)
+            with open(path) as file:
+                records = [json.loads(line) for line in file]
+
+        self.assertEqual([record["seed"] for record in records], [0, 1])
+        for record, result in zip(records, results):
+            self.assertEqual(record["plans"], len(result.plan_times))
+            self.assertEqual(len(record["calls"]["expanded"]), record["plans"])
+
+
+if __name__ == "__main__":
+    unittest.main()